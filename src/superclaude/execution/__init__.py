@@ -14,25 +14,100 @@ Usage:
         context={"project_index": "...", "git_status": "..."},
         operations=[op1, op2, op3]
     )
+
+Operations that touch shared files can declare them and are ordered
+automatically (readers in parallel, writers in turn):
+
+    operations=[
+        Operation(parse, reads=["src/**/*.py"]),
+        Operation(reformat, writes=["src/**/*.py"]),
+    ]
+
+Operations whose result depends only on input files can declare them;
+re-runs over unchanged inputs reuse the stored result:
+
+    Operation(build_index, cache=CacheKey(inputs=["src"], version="index-2"))
+
+Nothing is printed by default; pass ``events=EventBus(ConsoleRenderer())``
+for console progress output.
 """
 
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
-from .parallel import ExecutionPlan, ParallelExecutor, Task, should_parallelize
+from .adaptive import AIMDController
+from .async_parallel import AsyncParallelExecutor
+from .backends import BackendError, SharedBytes
+from .cost_model import DurationHistory, callable_fingerprint
+from .distributed import DistributedPool, WorkerLostError
+from .events import (
+    ConsoleRenderer,
+    Event,
+    EventBus,
+    PhaseStarted,
+    RunFinished,
+    RunStarted,
+)
+from .journal import ExecutionJournal
+from .parallel import (
+    FAILED_STATUSES,
+    CancellationToken,
+    CircularDependencyError,
+    ExecutionPlan,
+    ParallelExecutor,
+    Task,
+    TaskCancelledError,
+    TaskOutcome,
+    TaskStatus,
+    TaskTimeoutError,
+    get_shared_pool,
+    should_parallelize,
+    shutdown_shared_pool,
+)
+from .plan_cache import PlanCache
+from .profiling import ExecutionProfile
 from .reflection import ConfidenceScore, ReflectionEngine, reflect_before_execution
+from .reflexion_store import ReflexionStore
+from .resources import Operation, infer_dependencies
+from .result_cache import CacheKey, ResultCache
 from .self_correction import RootCause, SelfCorrectionEngine, learn_from_failure
 
 __all__ = [
     "intelligent_execute",
     "ReflectionEngine",
     "ParallelExecutor",
+    "AsyncParallelExecutor",
+    "AIMDController",
     "SelfCorrectionEngine",
+    "ReflexionStore",
     "ConfidenceScore",
     "ExecutionPlan",
+    "PlanCache",
+    "ResultCache",
+    "ExecutionJournal",
+    "CacheKey",
+    "ExecutionProfile",
+    "CircularDependencyError",
+    "BackendError",
+    "SharedBytes",
+    "DistributedPool",
+    "WorkerLostError",
+    "DurationHistory",
+    "Event",
+    "EventBus",
+    "ConsoleRenderer",
     "RootCause",
     "Task",
+    "Operation",
+    "infer_dependencies",
+    "TaskStatus",
+    "TaskOutcome",
+    "CancellationToken",
+    "TaskCancelledError",
+    "TaskTimeoutError",
     "should_parallelize",
+    "get_shared_pool",
+    "shutdown_shared_pool",
     "reflect_before_execution",
     "learn_from_failure",
 ]
@@ -44,6 +119,14 @@ def intelligent_execute(
     context: Optional[Dict[str, Any]] = None,
     repo_path: Optional[Path] = None,
     auto_correct: bool = True,
+    backend: str = "thread",
+    failure_policy: str = "continue",
+    timeout: Optional[float] = None,
+    retries: int = 0,
+    deadline: Optional[float] = None,
+    events: Optional[EventBus] = None,
+    pool_limits: Optional[Dict[str, int]] = None,
+    checkpoint: bool = False,
 ) -> Dict[str, Any]:
     """
     Intelligent Task Execution with Reflection, Parallelization, and Self-Correction
@@ -56,10 +139,30 @@ def intelligent_execute(
 
     Args:
         task: Task description
-        operations: List of callables to execute
+        operations: List of callables to execute; wrap one in Operation
+            to declare the resources it reads and writes, from which
+            the ordering between operations is derived, or the input
+            files its result is cached by
         context: Optional context (project index, git status, etc.)
         repo_path: Repository path (defaults to cwd)
         auto_correct: Enable automatic self-correction
+        backend: Where operations run - "thread" (I/O-bound), "process"
+            (CPU-bound, operations must be picklable), "distributed"
+            (socket-connected worker processes, operations must be
+            importable module-level functions) or "inline"
+        failure_policy: "continue", "skip-dependents" or "fail-fast"
+        timeout: Seconds each operation attempt may take (None = no limit)
+        retries: Extra attempts for operations that fail or time out
+        deadline: Seconds the whole execution may take (None = no limit)
+        events: Event bus receiving progress events from every phase
+            (None = silent)
+        pool_limits: Concurrency limits per named pool, e.g.
+            {"subprocess": 4, "mcp": 2}, for Operations listing ``pools``
+        checkpoint: Journal completed operations under docs/memory so an
+            interrupted run of the same task resumes instead of starting
+            over (the journal is removed once a run fully succeeds). Only
+            named functions with JSON results are journaled; lambdas
+            always run again
 
     Returns:
         Dict with execution results and metadata
@@ -67,30 +170,25 @@ def intelligent_execute(
 
     if repo_path is None:
         repo_path = Path.cwd()
+    if events is None:
+        events = EventBus()
 
-    print("\n" + "=" * 70)
-    print("🧠 INTELLIGENT EXECUTION ENGINE")
-    print("=" * 70)
-    print(f"Task: {task}")
-    print(f"Operations: {len(operations)}")
-    print("=" * 70)
+    def phase(title: str):
+        if events.listening:
+            events.emit(PhaseStarted(title))
+
+    if events.listening:
+        events.emit(RunStarted(task, len(operations)))
 
     # Phase 1: Reflection × 3
-    print("\n📋 PHASE 1: REFLECTION × 3")
-    print("-" * 70)
+    phase("📋 PHASE 1: REFLECTION × 3")
 
-    reflection_engine = ReflectionEngine(repo_path)
+    reflection_engine = ReflectionEngine(repo_path, events=events)
     confidence = reflection_engine.reflect(task, context)
 
     if not confidence.should_proceed:
-        print("\n🔴 EXECUTION BLOCKED")
-        print(f"Confidence too low: {confidence.confidence:.0%} < 70%")
-        print("\nBlockers:")
-        for blocker in confidence.blockers:
-            print(f"  ❌ {blocker}")
-        print("\nRecommendations:")
-        for rec in confidence.recommendations:
-            print(f"  💡 {rec}")
+        if events.listening:
+            events.emit(RunFinished("blocked", confidence=confidence))
 
         return {
             "status": "blocked",
@@ -99,87 +197,125 @@ def intelligent_execute(
             "recommendations": confidence.recommendations,
         }
 
-    print(f"\n✅ HIGH CONFIDENCE ({confidence.confidence:.0%}) - PROCEEDING")
-
     # Phase 2: Parallel Planning
-    print("\n📦 PHASE 2: PARALLEL PLANNING")
-    print("-" * 70)
-
-    executor = ParallelExecutor(max_workers=10)
+    phase("📦 PHASE 2: PARALLEL PLANNING")
+
+    result_cache = None
+    if any(isinstance(op, Operation) and op.cache is not None for op in operations):
+        result_cache = ResultCache.for_repo(repo_path)
+
+    executor = ParallelExecutor(
+        max_workers="auto",
+        shared_pool=True,
+        backend=backend,
+        history=DurationHistory.for_repo(repo_path),
+        failure_policy=failure_policy,
+        deadline=deadline,
+        events=events,
+        result_cache=result_cache,
+        pool_limits=pool_limits,
+    )
 
-    # Convert operations to Tasks
-    tasks = [
-        Task(
-            id=f"task_{i}",
-            description=f"Operation {i + 1}",
-            execute=op,
-            depends_on=[],  # Assume independent for now (can enhance later)
+    # Convert operations to Tasks; declared reads/writes order them and
+    # operations without declarations are independent
+    tasks = []
+    for i, op in enumerate(operations):
+        if isinstance(op, Operation):
+            func, reads, writes, cache = op.func, op.reads, op.writes, op.cache
+            pools = op.pools
+            description = op.description or f"Operation {i + 1}"
+        else:
+            func, reads, writes, cache, pools = op, (), (), None, ()
+            description = f"Operation {i + 1}"
+
+        tasks.append(
+            Task(
+                id=f"task_{i}",
+                description=description,
+                execute=func,
+                depends_on=[],
+                fingerprint=callable_fingerprint(func),
+                timeout=timeout,
+                retries=retries,
+                reads=reads,
+                writes=writes,
+                cache=cache,
+                pools=pools,
+            )
         )
-        for i, op in enumerate(operations)
-    ]
-
-    plan = executor.plan(tasks)
 
-    # Phase 3: Execution
-    print("\n⚡ PHASE 3: PARALLEL EXECUTION")
-    print("-" * 70)
+    journal = None
+    if checkpoint:
+        journal = ExecutionJournal.for_repo(repo_path, task)
 
     try:
-        results = executor.execute(plan)
+        # Inside the try: a cycle in the declared reads/writes must still
+        # shut the executor down
+        plan = executor.plan(tasks)
 
-        # Check for failures
-        failures = [
-            (task_id, None)  # Placeholder - need actual error
-            for task_id, result in results.items()
-            if result is None
-        ]
+        # Phase 3: Execution
+        phase("⚡ PHASE 3: PARALLEL EXECUTION")
 
-        if failures and auto_correct:
-            # Phase 4: Self-Correction
-            print("\n🔍 PHASE 4: SELF-CORRECTION")
-            print("-" * 70)
-
-            correction_engine = SelfCorrectionEngine(repo_path)
-
-            for task_id, error in failures:
-                failure_info = {
-                    "type": "execution_error",
-                    "error": "Operation returned None",
-                    "task_id": task_id,
-                }
-
-                root_cause = correction_engine.analyze_root_cause(task, failure_info)
-                correction_engine.learn_and_prevent(task, failure_info, root_cause)
+        results = executor.execute(plan, resume_from=journal)
 
-        execution_status = "success" if not failures else "partial_failure"
+        # Check for failures (skipped/cancelled tasks are reported separately)
+        failures = [t for t in tasks if t.status in FAILED_STATUSES]
+        skipped = [t.id for t in tasks if t.status == TaskStatus.SKIPPED]
+        cancelled = [t.id for t in tasks if t.status == TaskStatus.CANCELLED]
 
-        print("\n" + "=" * 70)
-        print(f"✅ EXECUTION COMPLETE: {execution_status.upper()}")
-        print("=" * 70)
+        if failures and auto_correct:
+            # Phase 4: Self-Correction
+            phase("🔍 PHASE 4: SELF-CORRECTION")
+
+            with SelfCorrectionEngine(repo_path, events=events) as correction_engine:
+                for failed in failures:
+                    timed_out = failed.status == TaskStatus.TIMED_OUT
+                    failure_info = {
+                        "type": "timeout" if timed_out else "execution_error",
+                        "error": str(failed.error),
+                        "task_id": failed.id,
+                        "attempts": failed.attempts,
+                    }
+
+                    root_cause = correction_engine.analyze_root_cause(
+                        task, failure_info
+                    )
+                    correction_engine.learn_and_prevent(task, failure_info, root_cause)
+
+        incomplete = failures or skipped or cancelled
+        execution_status = "success" if not incomplete else "partial_failure"
+        if journal is not None and not incomplete:
+            journal.discard()
+
+        if events.listening:
+            events.emit(RunFinished(execution_status, confidence=confidence))
 
         return {
             "status": execution_status,
             "confidence": confidence.confidence,
             "results": results,
             "failures": len(failures),
+            "skipped": skipped,
+            "cancelled": cancelled,
+            "cached": [t.id for t in tasks if t.cached],
             "speedup": plan.speedup,
+            "workers": executor.concurrency,
+            "profile": executor.last_profile,
         }
 
     except Exception as e:
         # Unhandled exception - learn from it
-        print(f"\n❌ EXECUTION FAILED: {e}")
-
         if auto_correct:
-            print("\n🔍 ANALYZING FAILURE...")
-
-            correction_engine = SelfCorrectionEngine(repo_path)
+            phase("🔍 ANALYZING FAILURE...")
 
             failure_info = {"type": "exception", "error": str(e), "exception": e}
 
-            root_cause = correction_engine.analyze_root_cause(task, failure_info)
-            correction_engine.learn_and_prevent(task, failure_info, root_cause)
+            with SelfCorrectionEngine(repo_path, events=events) as correction_engine:
+                root_cause = correction_engine.analyze_root_cause(task, failure_info)
+                correction_engine.learn_and_prevent(task, failure_info, root_cause)
 
-        print("=" * 70)
+        if events.listening:
+            events.emit(RunFinished("failed", confidence=confidence, error=str(e)))
 
         return {
             "status": "failed",
@@ -187,6 +323,9 @@ def intelligent_execute(
             "confidence": confidence.confidence,
         }
 
+    finally:
+        executor.shutdown()
+
 
 # Convenience functions
 
@@ -197,15 +336,14 @@ def quick_execute(operations: List[Callable]) -> List[Any]:
 
     Use for simple, low-risk operations.
     """
-    executor = ParallelExecutor()
-
     tasks = [
         Task(id=f"op_{i}", description=f"Op {i}", execute=op, depends_on=[])
         for i, op in enumerate(operations)
     ]
 
-    plan = executor.plan(tasks)
-    results = executor.execute(plan)
+    with ParallelExecutor(shared_pool=True) as executor:
+        plan = executor.plan(tasks)
+        results = executor.execute(plan)
 
     return [results[task.id] for task in tasks]
 
@@ -0,0 +1,179 @@
+"""
+Adaptive Concurrency - Tune the Number of Tasks in Flight
+
+Used by ParallelExecutor(max_workers="auto"). Starts from the CPU
+count and adjusts the in-flight limit from what completions show:
+
+- Throughput (tasks finished per second) over a window of completions
+- Run time per task (grows when workers contend for a CPU, the GIL,
+  a disk or a rate-limited service)
+- Queue delay (time between handing a task to the pool and the
+  callable starting)
+
+The limit moves by additive increase / multiplicative decrease (AIMD),
+keeping direction while throughput improves and backing off as soon
+as more concurrency only makes each task slower.
+"""
+
+import os
+import time
+from typing import Callable, List, Optional, Tuple
+
+# Upper bound for automatic thread concurrency
+AUTO_MAX_WORKERS = max(32, 4 * (os.cpu_count() or 1))
+
+
+class AIMDController:
+    """
+    Additive-increase / multiplicative-decrease concurrency limit
+
+    Completions are grouped into windows of about ``limit`` tasks
+    (at least ``min_window``), each measured at a fixed limit. When a
+    window closes it is compared with the previous one:
+
+    - tasks queued longer than they ran: decrease
+    - per-task run time grew with the limit (contention): decrease
+    - after an increase that raised throughput: increase again
+    - after a decrease that relieved contention without costing
+      throughput: decrease again
+    - after a decrease that cost throughput: increase
+    - otherwise, if work was waiting for a free slot: increase
+
+    Decreases multiply the limit by ``decrease``; increases add one.
+    Completions of tasks started before a change of limit are ignored.
+    A change of limit from L to L' changes throughput by about
+    (L' - L) / L when work scales, and per-task run time by as much
+    when it is fully contended; changes above half of that (and above
+    ``noise``) count as real.
+
+    Example:
+        controller = AIMDController(initial=os.cpu_count())
+        controller.record(wall=0.12, duration=0.10, backlog=True)
+        controller.limit  # current in-flight limit
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: int = AUTO_MAX_WORKERS,
+        decrease: float = 0.7,
+        noise: float = 0.02,
+        min_window: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            initial: Starting limit (clamped to [minimum, maximum])
+            minimum: Lowest limit ever chosen
+            maximum: Highest limit ever chosen
+            decrease: Factor applied on a multiplicative decrease
+            noise: Smallest relative change treated as a real effect
+            min_window: Fewest completions per measurement window
+            clock: Time source (seconds)
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.noise = noise
+        self.min_window = min_window
+        self.clock = clock
+
+        self.limit = min(max(initial, minimum), maximum)
+        self.history: List[Tuple[float, int]] = [(clock(), self.limit)]
+
+        # Previous window: (limit, throughput, mean run time)
+        self._previous: Optional[Tuple[int, float, float]] = None
+        self._settling = 0  # Completions still started under an older limit
+        self._reset_window(None)
+
+    def _reset_window(self, start: Optional[float]):
+        self._window_start = start
+        self._count = 0
+        self._run_time = 0.0
+        self._queue_time = 0.0
+        self._backlog = False
+
+    def record(
+        self,
+        wall: float,
+        duration: Optional[float],
+        backlog: bool,
+        queued: Optional[float] = None,
+    ):
+        """
+        Feed one completed task
+
+        Args:
+            wall: Seconds from submission to completion
+            duration: Seconds the callable itself ran (None = unknown)
+            backlog: Whether ready work was waiting for a free slot
+            queued: Seconds from submission until the callable started
+                (None = unknown: wall minus run time, which also counts
+                the scheduler's delay in noticing the completion)
+        """
+        now = self.clock()
+        if self._settling:
+            # Tasks submitted before the last change say nothing about it
+            self._settling -= 1
+            return
+        if self._window_start is None:
+            self._window_start = now
+
+        run = wall if duration is None else min(duration, wall)
+        self._count += 1
+        self._run_time += run
+        self._queue_time += wall - run if queued is None else max(queued, 0.0)
+        self._backlog = self._backlog or backlog
+
+        if self._count >= max(self.limit, self.min_window):
+            self._close_window(now)
+
+    def _close_window(self, now: float):
+        start = now if self._window_start is None else self._window_start
+        elapsed = max(now - start, 1e-9)
+        throughput = self._count / elapsed
+        duration = self._run_time / self._count
+        queued = self._queue_time / self._count
+        limit = self.limit
+
+        action = "increase" if self._backlog else "hold"
+
+        if queued > duration:
+            action = "decrease"
+
+        elif self._previous is not None:
+            last_limit, last_throughput, last_duration = self._previous
+            step = (limit - last_limit) / last_limit
+            threshold = max(abs(step) / 2, self.noise)
+            change = (duration - last_duration) / max(last_duration, 1e-9)
+            gain = (throughput - last_throughput) / max(last_throughput, 1e-9)
+            gained, lost = gain > threshold, -gain > threshold
+
+            if step > 0:
+                if change > threshold:
+                    action = "decrease"
+                elif not gained:
+                    action = "hold"
+            elif step < 0:
+                if lost:
+                    action = "increase"
+                elif -change > threshold:
+                    action = "decrease"
+                else:
+                    action = "hold"
+
+        if action == "increase":
+            self._set_limit(limit + 1, now)
+        elif action == "decrease":
+            self._set_limit(int(limit * self.decrease), now)
+
+        self._previous = (limit, throughput, duration)
+        self._reset_window(now)
+
+    def _set_limit(self, limit: int, now: float):
+        limit = min(max(limit, self.minimum), self.maximum)
+        if limit != self.limit:
+            self._settling = self.limit
+            self.limit = limit
+            self.history.append((now, limit))
@@ -0,0 +1,391 @@
+"""
+Async Parallel Execution Engine - Coroutine Tasks on One Event Loop
+
+Runs I/O-bound coroutine operations (subprocess calls, MCP/HTTP
+requests) on a single event loop instead of one thread per task, while
+still honouring task dependencies.
+
+Key features:
+- Coroutine functions run directly on the event loop
+- Sync callables are offloaded to the executor's thread/process pool
+- Concurrency bounded by a configurable semaphore, plus one semaphore
+  per named pool in pool_limits
+- Each task starts as soon as its own dependencies complete
+- Same failure policies as ParallelExecutor (continue, skip-dependents,
+  fail-fast); fail-fast cancels running coroutines
+- Per-task timeouts and retries, and a per-plan deadline; a timed-out
+  attempt still running on a pool keeps its semaphore slots until it
+  returns
+- Execution profile of every run (last_profile)
+"""
+
+import asyncio
+import functools
+import inspect
+import time
+from collections import deque
+from concurrent.futures import Future
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, List, Set
+
+from .backends import run_in_process
+from .events import (
+    DeadlineExceeded,
+    ExecutionFinished,
+    ExecutionStarted,
+    TaskFinished,
+    TaskRetrying,
+    TaskStarted,
+)
+from .parallel import (
+    FAILED_STATUSES,
+    CancellationToken,
+    ExecutionPlan,
+    ParallelExecutor,
+    Task,
+    TaskCancelledError,
+    TaskStatus,
+    TaskTimeoutError,
+    _check_task_ids,
+    _index_dependencies,
+    _run_timed,
+)
+from .profiling import ExecutionProfile
+
+
+class AsyncParallelExecutor(ParallelExecutor):
+    """
+    Parallel executor for coroutine (and mixed sync/async) tasks
+
+    Planning, pools and backends are inherited from ParallelExecutor.
+    ``max_concurrency`` bounds how many tasks run at once on the event
+    loop; ``max_workers`` still sizes the pool used for sync tasks.
+
+    Example:
+        async def fetch(url):
+            ...
+
+        executor = AsyncParallelExecutor(max_concurrency=500)
+
+        tasks = [
+            Task("a", "Fetch A", functools.partial(fetch, url_a), []),
+            Task("b", "Fetch B", functools.partial(fetch, url_b), []),
+            Task("merge", "Merge", merge_results, ["a", "b"]),  # sync
+        ]
+
+        plan = executor.plan(tasks)
+        results = await executor.execute_async(plan)  # or executor.run(plan)
+    """
+
+    def __init__(self, max_concurrency: int = 100, **kwargs):
+        super().__init__(**kwargs)
+        self.max_concurrency = max_concurrency
+
+    def run(self, plan: ExecutionPlan) -> Dict[str, Any]:
+        """Execute plan on a fresh event loop (for sync callers)"""
+        return asyncio.run(self.execute_async(plan))
+
+    async def execute_async(self, plan: ExecutionPlan) -> Dict[str, Any]:
+        """
+        Execute plan on the running event loop
+
+        Returns dict of task_id -> result
+        """
+
+        if self._closed:
+            raise RuntimeError("ParallelExecutor has been shut down")
+
+        tasks = [task for group in plan.groups for task in group.tasks]
+        self._check_backends([task for task in tasks if not _is_coroutine_task(task)])
+        self._check_pools(tasks)
+
+        events = self.events
+        if events.listening:
+            events.emit(ExecutionStarted(plan, "event loop"))
+
+        loop = asyncio.get_running_loop()
+        profile = self.last_profile = ExecutionProfile(
+            self.max_concurrency, time.perf_counter()
+        )
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        pool_semaphores = {
+            name: asyncio.Semaphore(limit) for name, limit in self.pool_limits.items()
+        }
+
+        _check_task_ids(tasks)
+        remaining, dependents = _index_dependencies(tasks)
+        results: Dict[str, Any] = {}
+        running: Set[asyncio.Task] = set()
+        blocked: Set[str] = set()
+        all_done = asyncio.Event()
+        token = self._cancel_token = CancellationToken()
+        expired = False  # Plan deadline passed
+
+        def launch(task: Task):
+            # Pools first (in a fixed order), so no global slot is held
+            # while waiting for a pool
+            semaphores = [pool_semaphores[name] for name in sorted(set(task.pools))]
+            semaphores.append(semaphore)
+            future = loop.create_task(self._run_async(task, semaphores, token, profile))
+            running.add(future)
+            future.add_done_callback(functools.partial(finish, task))
+
+        def release(task: Task):
+            incoming = deque([task])
+            while incoming:
+                for child in dependents.get(incoming.popleft().id, ()):
+                    remaining[child.id] -= 1
+                    if remaining[child.id] != 0 or token.cancelled:
+                        continue
+                    if self.failure_policy == "skip-dependents" and any(
+                        dep in blocked for dep in child.depends_on
+                    ):
+                        child.status = TaskStatus.SKIPPED
+                        blocked.add(child.id)
+                        results[child.id] = None
+                        incoming.append(child)
+                        if events.listening:
+                            events.emit(TaskFinished(child))
+                    else:
+                        launch(child)
+
+        def finish(task: Task, future: asyncio.Task):
+            running.discard(future)
+
+            if future.cancelled() and expired:
+                self._record_timeout(task, TaskTimeoutError("Plan deadline exceeded"))
+                results[task.id] = None
+            elif future.cancelled():
+                task.status = TaskStatus.CANCELLED
+                results[task.id] = None
+            else:
+                results[task.id] = self._collect_async(task, future)
+
+            if task.status != TaskStatus.COMPLETED:
+                blocked.add(task.id)
+                if (
+                    self.failure_policy == "fail-fast"
+                    and task.status in FAILED_STATUSES
+                ):
+                    token.cancel()
+
+            if events.listening:
+                events.emit(TaskFinished(task))
+
+            if token.cancelled:
+                for other in running:
+                    other.cancel()
+            else:
+                release(task)
+
+            if not running:
+                all_done.set()
+
+        for task in tasks:
+            if remaining[task.id] == 0:
+                launch(task)
+
+        if running:
+            try:
+                await asyncio.wait_for(all_done.wait(), self.deadline)
+            except asyncio.TimeoutError:  # Only raised with a deadline set
+                if events.listening and self.deadline is not None:
+                    events.emit(DeadlineExceeded(self.deadline))
+                expired = True
+                token.cancel()
+                for other in running:
+                    other.cancel()
+                await all_done.wait()
+
+        if token.cancelled:
+            for task in tasks:
+                if task.id not in results:
+                    task.status = TaskStatus.CANCELLED
+                    results[task.id] = None
+                    if events.listening:
+                        events.emit(TaskFinished(task))
+
+        if len(results) < len(tasks):
+            stuck = [task.id for task in tasks if task.id not in results]
+            raise ValueError(f"Unsatisfiable dependencies for tasks: {stuck}")
+
+        if self.history is not None:
+            self.history.save()
+        if self.result_cache is not None:
+            self.result_cache.save()
+
+        profile.finish(time.perf_counter(), self.max_concurrency)
+        if events.listening:
+            events.emit(
+                ExecutionFinished(plan, profile.elapsed, self.max_concurrency, profile)
+            )
+
+        return results
+
+    def _collect_async(self, task: Task, future: "asyncio.Task[Any]") -> Any:
+        """Record the outcome of a finished task coroutine"""
+
+        return self._record_outcome(task, future.result)
+
+    async def _run_async(
+        self,
+        task: Task,
+        semaphores: List[asyncio.Semaphore],
+        token: CancellationToken,
+        profile: ExecutionProfile,
+    ) -> Any:
+        """Run one task, retrying failed or timed-out attempts"""
+
+        task.attempts = 0
+
+        while True:
+            try:
+                return await self._attempt_async(task, semaphores, token, profile)
+            except (TaskCancelledError, asyncio.CancelledError):
+                raise
+            except Exception:
+                if task.attempts > task.retries or token.cancelled:
+                    raise
+
+            # Backoff is spent outside the semaphores so others can run
+            delay = self._retry_delay(task.attempts)
+            if self.events.listening:
+                self.events.emit(TaskRetrying(task, delay))
+            await asyncio.sleep(delay)
+
+    async def _attempt_async(
+        self,
+        task: Task,
+        semaphores: List[asyncio.Semaphore],
+        token: CancellationToken,
+        profile: ExecutionProfile,
+    ) -> Any:
+        """Run one attempt under the concurrency semaphores"""
+
+        queued = time.perf_counter()
+        # Pool futures of this attempt: a thread cannot be stopped, so a
+        # timed-out attempt keeps its slots until its future is done
+        offloaded: List[Future] = []
+        with ExitStack() as slots:
+            for semaphore in semaphores:
+                await semaphore.acquire()
+                slots.callback(semaphore.release)
+            token.raise_if_cancelled()
+            started = time.perf_counter()
+            task.status = TaskStatus.RUNNING
+            task.attempts += 1
+            task.cached = False
+            if self.events.listening:
+                self.events.emit(TaskStarted(task))
+
+            status = TaskStatus.FAILED
+            try:
+                result = await asyncio.wait_for(
+                    self._call_async(task, token, offloaded), task.timeout
+                )
+                status = TaskStatus.COMPLETED
+                return result
+            except asyncio.TimeoutError:
+                status = TaskStatus.TIMED_OUT
+                if offloaded and not offloaded[-1].done():
+                    _release_when_done(offloaded[-1], slots.pop_all())
+                raise TaskTimeoutError(f"Timed out after {task.timeout}s") from None
+            except asyncio.CancelledError:
+                status = TaskStatus.CANCELLED
+                raise
+            finally:
+                profile.record(task, queued, time.perf_counter(), started, status)
+
+    async def _call_async(
+        self, task: Task, token: CancellationToken, offloaded: List[Future]
+    ) -> Any:
+        """Serve a task from the result cache, else call it"""
+
+        cache = self.result_cache
+        if task.cache is None or cache is None:
+            return await self._call_backend_async(task, token, offloaded)
+
+        # Keying hashes input files: keep that off the event loop
+        pool = self._acquire_pool()
+        key, hit, result = await _offload(offloaded, pool.submit, cache.lookup, task)
+        if hit:
+            task.cached = True
+            task.duration = 0.0
+            task.worker = "result cache"
+            return result
+
+        result = await self._call_backend_async(task, token, offloaded)
+        if key is not None:
+            await _offload(offloaded, pool.submit, cache.put, key, result)
+        return result
+
+    async def _call_backend_async(
+        self, task: Task, token: CancellationToken, offloaded: List[Future]
+    ) -> Any:
+        """Call a task on the event loop or its backend"""
+
+        backend = self._backend_for(task)
+        func = task.execute
+        if task.cancellable:
+            func = functools.partial(task.execute, token)
+
+        if backend == "distributed" and not _is_coroutine_task(task):
+            pool = self._acquire_distributed_pool()
+            result, task.duration, task.worker = await _offload(
+                offloaded, pool.submit_timed, task.execute
+            )
+            return result
+
+        if backend == "process" and not _is_coroutine_task(task):
+            result, task.duration, task.worker = await _offload(
+                offloaded,
+                self._acquire_process_pool().submit,
+                run_in_process,
+                task.execute,
+                self.shared_memory_threshold,
+            )
+            return result
+
+        start = time.perf_counter()
+
+        if _is_coroutine_task(task) or backend == "inline":
+            task.worker = "event loop"
+            result = func()
+        else:
+            result = await _offload(
+                offloaded, self._acquire_pool().submit, _run_timed, task, token
+            )
+
+        # Sync wrappers (e.g. lambda: fetch(url)) may hand back a coroutine
+        if inspect.isawaitable(result):
+            result = await result
+
+        task.duration = time.perf_counter() - start
+        return result
+
+
+async def _offload(
+    offloaded: List[Future], submit: Callable[..., Future], *args: Any
+) -> Any:
+    """Await a call submitted to a pool, noting its future in ``offloaded``"""
+    future = submit(*args)
+    offloaded.append(future)
+    return await asyncio.wrap_future(future)
+
+
+def _release_when_done(future: Future, slots: ExitStack):
+    """Release an abandoned attempt's slots once its pool future is done"""
+    loop = asyncio.get_running_loop()
+
+    def done(_: Future):
+        try:
+            loop.call_soon_threadsafe(slots.close)
+        except RuntimeError:  # Loop closed: the run, and its slots, are over
+            pass
+
+    future.add_done_callback(done)
+
+
+def _is_coroutine_task(task: Task) -> bool:
+    """Check if a task's callable is a coroutine function"""
+    return inspect.iscoroutinefunction(task.execute)
@@ -0,0 +1,176 @@
+"""
+Execution Backends - Where a task's callable actually runs
+
+Backends:
+- thread: Worker thread pool (default, best for I/O-bound work)
+- process: Worker process pool (CPU-bound work, bypasses the GIL)
+- inline: Calling thread, no pool at all (trivial or debugging work)
+- distributed: Worker processes connected over a socket, local or on
+  other hosts (see distributed.py)
+
+Process-backed callables must be picklable: module-level functions,
+classes, or functools.partial objects wrapping them. Large bytes
+results are handed back through shared memory instead of being
+pickled through the result pipe.
+"""
+
+import os
+import pickle
+import time
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+BACKENDS = ("thread", "process", "inline", "distributed")
+
+# Bytes results at least this large come back via shared memory
+SHARED_MEMORY_THRESHOLD = 1 << 20  # 1 MiB
+
+
+class BackendError(ValueError):
+    """Raised when a task cannot run on its requested backend"""
+
+
+def check_backend(backend: str):
+    """Validate a backend name"""
+    if backend not in BACKENDS:
+        raise BackendError(
+            f"Unknown backend: {backend!r} (expected one of {', '.join(BACKENDS)})"
+        )
+
+
+def check_picklable(task_id: str, func: Callable):
+    """
+    Ensure a callable can be sent to a worker process
+
+    Raises:
+        BackendError: With an explanation of how to fix the callable
+    """
+    name = getattr(func, "__qualname__", repr(func))
+
+    if name == "<lambda>" or "<lambda>" in name:
+        raise BackendError(
+            f"Task {task_id!r} uses backend='process' but its callable is a "
+            f"lambda. Lambdas cannot be sent to worker processes; define a "
+            f"module-level function instead (functools.partial can bind "
+            f"arguments)."
+        )
+
+    try:
+        pickle.dumps(func)
+    except Exception as e:
+        raise BackendError(
+            f"Task {task_id!r} uses backend='process' but its callable {name} "
+            f"is not picklable ({e}). Use a module-level function, optionally "
+            f"wrapped in functools.partial."
+        ) from e
+
+
+def _buffer(shm: SharedMemory) -> memoryview:
+    """Mapped buffer of an open shared memory segment"""
+    if shm.buf is None:
+        raise BackendError(f"Shared memory segment {shm.name!r} is closed")
+    return shm.buf
+
+
+class SharedBytes:
+    """
+    Large bytes result living in shared memory
+
+    Returned in place of ``bytes`` when a process-backed task produces a
+    payload above the shared-memory threshold. ``view`` exposes the data
+    without copying; ``tobytes()`` makes an ordinary copy. The receiver
+    owns the segment and must call ``release()`` (or use the object as a
+    context manager) once done with it.
+
+    Example:
+        with results["hash_tree"] as payload:
+            digest = hashlib.sha256(payload.view).hexdigest()
+    """
+
+    def __init__(self, name: str, size: int):
+        self.name = name
+        self.size = size
+        self._shm: Optional[SharedMemory] = None
+
+    @classmethod
+    def export(cls, data: Union[bytes, bytearray]) -> "SharedBytes":
+        """Copy data into a new shared memory segment (worker side)"""
+        shm = SharedMemory(create=True, size=max(len(data), 1))
+        _buffer(shm)[: len(data)] = data
+
+        # Lifetime is owned by the receiving process, not this worker
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        shm.close()
+
+        return cls(shm.name, len(data))
+
+    @property
+    def view(self) -> memoryview:
+        """Zero-copy view of the payload"""
+        if self._shm is None:
+            self._shm = SharedMemory(name=self.name)
+        return _buffer(self._shm)[: self.size]
+
+    def tobytes(self) -> bytes:
+        """Copy the payload into a regular bytes object"""
+        with self.view as view:
+            return bytes(view)
+
+    def release(self):
+        """
+        Free the shared memory segment
+
+        All memoryviews obtained from ``view`` must be released first.
+        """
+        shm = self._shm or SharedMemory(name=self.name)
+        self._shm = None
+        shm.close()
+        shm.unlink()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __enter__(self) -> "SharedBytes":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+    def __reduce__(self):
+        # Pickled by name: the receiver attaches to the same segment
+        return SharedBytes, (self.name, self.size)
+
+    def __repr__(self) -> str:
+        return f"SharedBytes({self.name!r}, {self.size} bytes)"
+
+
+def run_in_process(
+    func: Callable, threshold: int = SHARED_MEMORY_THRESHOLD
+) -> Tuple[Any, float, str]:
+    """
+    Worker-process entry point for process-backed tasks
+
+    Runs the callable and moves large bytes results into shared memory.
+
+    Returns:
+        (result, seconds the callable ran for, worker name)
+    """
+    worker = f"process-{os.getpid()}"
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+
+    if isinstance(result, (bytes, bytearray)) and len(result) >= threshold:
+        return SharedBytes.export(result), elapsed, worker
+
+    return result, elapsed, worker
+
+
+def run_chunk(func: Callable, items: Sequence) -> List[Any]:
+    """
+    Worker entry point for ParallelExecutor.map()
+
+    Applies func to a whole chunk of items in one submission.
+    """
+    return [func(item) for item in items]
@@ -0,0 +1,301 @@
+"""
+Cost Model - Duration-Aware Plan Estimates
+
+Turns per-task cost estimates into plan-level numbers:
+- Sequential time: sum of task costs
+- Critical path: longest dependency chain weighted by cost
+- Makespan: simulated list scheduling on max_workers workers
+
+Task costs come from (in order): an explicit ``Task.cost``, the
+measured duration history for the task's key, or a default of 1s.
+
+History is persisted to docs/memory/task_durations.json and keyed by
+``Task.fingerprint`` (falling back to the task description).
+"""
+
+import heapq
+import itertools
+import json
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .parallel import ParallelGroup, Task
+
+# Cost assumed for tasks with no estimate and no history
+DEFAULT_TASK_COST = 1.0
+
+
+def task_key(task: "Task") -> str:
+    """History key for a task: its fingerprint, else its description"""
+    return task.fingerprint or task.description
+
+
+def operation_key(task: "Task") -> Optional[str]:
+    """
+    Key identifying a task's operation across runs (results are reused by it)
+
+    The fingerprint (given, else derived from the callable) and the
+    description. None for anonymous callables such as lambdas: under a
+    generated description like "Operation 1" they cannot be told apart
+    from a different operation in the same place in a later run.
+    """
+    fingerprint = task.fingerprint
+    if fingerprint is None and task.execute is not None:
+        fingerprint = callable_fingerprint(task.execute)
+    if fingerprint is None:
+        return None
+    return json.dumps([fingerprint, task.description])
+
+
+def callable_fingerprint(func: Callable) -> Optional[str]:
+    """
+    Stable fingerprint for a callable (module.qualname)
+
+    Returns None for lambdas and other anonymous callables, which
+    cannot be told apart across runs.
+    """
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+
+    if not module or not qualname or "<lambda>" in qualname:
+        return None
+
+    return f"{module}.{qualname}"
+
+
+class DurationHistory:
+    """
+    Persisted history of measured task durations
+
+    Keeps an exponentially weighted moving average per key so estimates
+    follow recent behaviour without being thrown by a single outlier.
+
+    Usage:
+        history = DurationHistory.for_repo(Path.cwd())
+        executor = ParallelExecutor(history=history)
+    """
+
+    def __init__(self, path: Optional[Path] = None, smoothing: float = 0.3):
+        """
+        Args:
+            path: JSON file to load from and save to (None = in-memory)
+            smoothing: Weight of the newest sample in the moving average
+        """
+        self.path = path
+        self.smoothing = smoothing
+        self._entries: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        if path is not None and path.exists():
+            try:
+                with open(path) as f:
+                    self._entries = json.load(f).get("durations", {})
+            except (OSError, ValueError):
+                self._entries = {}
+
+    @classmethod
+    def for_repo(cls, repo_path: Path) -> "DurationHistory":
+        """History stored in the repository's docs/memory directory"""
+        return cls(repo_path / "docs" / "memory" / "task_durations.json")
+
+    def estimate(self, key: str) -> Optional[float]:
+        """Expected duration in seconds, or None if never measured"""
+        entry = self._entries.get(key)
+        return entry["mean"] if entry else None
+
+    def record(self, key: str, seconds: float):
+        """Fold one measured duration into the moving average"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._entries[key] = {"mean": seconds, "count": 1}
+            else:
+                entry["mean"] += self.smoothing * (seconds - entry["mean"])
+                entry["count"] += 1
+            self._dirty = True
+
+    def save(self):
+        """Write history to disk (atomically) if anything changed"""
+        if self.path is None or not self._dirty:
+            return
+
+        with self._lock:
+            data = {"version": "1.0", "durations": self._entries}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            tmp_path.replace(self.path)
+            self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def estimate_costs(
+    tasks: List["Task"], history: Optional[DurationHistory] = None
+) -> Dict[str, float]:
+    """Resolve a cost estimate (seconds) for every task"""
+
+    costs = {}
+    for task in tasks:
+        cost = task.cost
+        if cost is None and history is not None:
+            cost = history.estimate(task_key(task))
+        costs[task.id] = DEFAULT_TASK_COST if cost is None else cost
+    return costs
+
+
+def critical_path(
+    order: List["Task"], costs: Dict[str, float]
+) -> Tuple[float, List[str]]:
+    """
+    Longest cost-weighted dependency chain
+
+    Args:
+        order: Tasks in topological order
+        costs: Cost per task id
+
+    Returns:
+        (length in seconds, task ids along the path)
+    """
+
+    finish: Dict[str, float] = {}
+    via: Dict[str, Optional[str]] = {}
+
+    for task in order:
+        start, parent = 0.0, None
+        for dep in task.depends_on:
+            if finish[dep] > start:
+                start, parent = finish[dep], dep
+        finish[task.id] = start + costs[task.id]
+        via[task.id] = parent
+
+    if not finish:
+        return 0.0, []
+
+    end = max(finish, key=finish.__getitem__)
+    path = []
+    node: Optional[str] = end
+    while node is not None:
+        path.append(node)
+        node = via[node]
+
+    return finish[end], path[::-1]
+
+
+def downstream_costs(
+    order: List["Task"], costs: Dict[str, float], dependents: Dict[str, List["Task"]]
+) -> Dict[str, float]:
+    """
+    Cost-weighted length of the longest path from each task to the end
+
+    Includes the task's own cost (the classic "bottom level" used for
+    critical-path-first list scheduling).
+    """
+
+    bottom: Dict[str, float] = {}
+    for task in reversed(order):
+        bottom[task.id] = costs[task.id] + max(
+            (bottom[child.id] for child in dependents.get(task.id, ())), default=0.0
+        )
+    return bottom
+
+
+def priority_keys(
+    order: List["Task"], bottom: Dict[str, float]
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Heap keys for critical-path-first ordering (smallest runs first)
+
+    Explicit Task.priority dominates; ties go to the longest remaining
+    downstream path.
+    """
+    return {task.id: (-(task.priority or 0.0), -bottom[task.id]) for task in order}
+
+
+def streaming_makespan(
+    order: List["Task"],
+    costs: Dict[str, float],
+    in_degree: Dict[str, int],
+    dependents: Dict[str, List["Task"]],
+    max_workers: int,
+    keys: Optional[Dict[str, Tuple[float, float]]] = None,
+) -> float:
+    """
+    Simulate streaming list scheduling on max_workers workers
+
+    Mirrors ParallelExecutor's streaming mode: whenever a worker is
+    free the next ready task starts, in FIFO order or by ``keys``.
+
+    Args:
+        order: Tasks in topological order
+        costs: Cost per task id
+        in_degree: Distinct dependency count per task id (not modified)
+        dependents: Tasks depending on each task id
+        max_workers: Number of simulated workers
+        keys: Optional ordering key per task id (see priority_keys)
+    """
+
+    remaining = dict(in_degree)
+    ready: List[Tuple[Any, int, "Task"]] = []
+    running: List[Tuple[float, int, "Task"]] = []
+    arrival = itertools.count()
+    now = 0.0
+
+    def push(task: "Task"):
+        key = keys[task.id] if keys else ()
+        heapq.heappush(ready, (key, next(arrival), task))
+
+    for task in order:
+        if remaining[task.id] == 0:
+            push(task)
+
+    while ready or running:
+        while ready and len(running) < max_workers:
+            task = heapq.heappop(ready)[2]
+            heapq.heappush(running, (now + costs[task.id], next(arrival), task))
+
+        now, _, task = heapq.heappop(running)
+        for child in dependents.get(task.id, ()):
+            remaining[child.id] -= 1
+            if remaining[child.id] == 0:
+                push(child)
+
+    return now
+
+
+def waves_makespan(
+    groups: List["ParallelGroup"],
+    costs: Dict[str, float],
+    max_workers: int,
+    keys: Optional[Dict[str, Tuple[float, float]]] = None,
+) -> float:
+    """
+    Simulate wave scheduling on max_workers workers
+
+    Each group is list-scheduled on its own (in plan order or by
+    ``keys``); the next group starts only when the slowest worker of the
+    previous one is done.
+    """
+
+    total = 0.0
+
+    for group in groups:
+        if len(group.tasks) <= max_workers:
+            total += max((costs[t.id] for t in group.tasks), default=0.0)
+            continue
+
+        tasks = group.tasks
+        if keys:
+            tasks = sorted(tasks, key=lambda t: keys[t.id])
+
+        workers = [0.0] * max_workers
+        for task in tasks:
+            heapq.heapreplace(workers, workers[0] + costs[task.id])
+        total += max(workers)
+
+    return total
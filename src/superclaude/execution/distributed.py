@@ -0,0 +1,520 @@
+"""
+Distributed Backend - Run Tasks on Worker Processes over a Socket
+
+DistributedPool is a concurrent.futures.Executor whose workers connect
+to it over multiprocessing.connection (length-prefixed pickles with
+HMAC authentication). Workers may be local processes the pool spawns
+itself or processes started on other hosts with:
+
+    SUPERCLAUDE_WORKER_AUTHKEY=<hex key> \\
+        python -m superclaude.execution.distributed HOST:PORT
+
+Protocol (one job per worker at a time):
+
+    worker -> pool: ("hello", name, pid)
+    pool -> worker: ("run", job_id, pickle((callable_ref, args, kwargs)))
+    worker -> pool: ("result", job_id, pickle((ok, value)), seconds)
+    worker -> pool: ("heartbeat",)  every heartbeat_interval, even mid-job
+    pool -> worker: ("stop",)
+
+Jobs reference their callable as "module:qualname" and are resolved by
+import on the worker, so only module-level functions (optionally wrapped
+in functools.partial) can be sent. A worker whose connection drops or
+whose heartbeats stop for heartbeat_timeout is dropped and its job is
+re-queued for another worker, up to max_requeues times; spawned local
+workers are replaced.
+
+Usage:
+    with DistributedPool(workers=8) as pool:
+        executor = ParallelExecutor(backend="distributed", distributed_pool=pool)
+        results = executor.execute(executor.plan(tasks))
+"""
+
+import functools
+import importlib
+import itertools
+import multiprocessing
+import os
+import pickle
+import socket
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .backends import BackendError
+
+# Environment variable holding the hex authkey for remote workers
+AUTHKEY_ENV = "SUPERCLAUDE_WORKER_AUTHKEY"
+
+
+class WorkerLostError(RuntimeError):
+    """Raised when a job's worker was lost more than max_requeues times"""
+
+
+def callable_ref(func: Callable) -> str:
+    """
+    Importable reference ("module:qualname") for a callable
+
+    Raises:
+        BackendError: If the callable cannot be re-imported by name
+    """
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+
+    if module and qualname and "<" not in qualname:
+        ref = f"{module}:{qualname}"
+        try:
+            if resolve_callable(ref) is func:
+                return ref
+        except (ImportError, AttributeError):
+            pass
+
+    raise BackendError(
+        f"Callable {qualname or func!r} cannot be sent to distributed workers: "
+        f"only module-level functions importable by name are supported "
+        f"(functools.partial can bind arguments)"
+    )
+
+
+def resolve_callable(ref: str) -> Callable:
+    """Import the callable named by a callable_ref() string"""
+    module_name, _, qualname = ref.partition(":")
+    target: Any = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        target = getattr(target, attr)
+    func: Callable = target
+    return func
+
+
+def check_importable(task_id: str, func: Callable):
+    """Ensure a task's callable (or partial) can run on a distributed worker"""
+    while isinstance(func, functools.partial):
+        func = func.func
+    try:
+        callable_ref(func)
+    except BackendError as e:
+        raise BackendError(f"Task {task_id!r} uses backend='distributed': {e}") from e
+
+
+def _job_payload(func: Callable, args: tuple, kwargs: dict) -> bytes:
+    """Serialize a call as (callable_ref, args, kwargs), unwrapping partials"""
+    while isinstance(func, functools.partial):
+        args = func.args + args
+        kwargs = {**func.keywords, **kwargs}
+        func = func.func
+    return pickle.dumps((callable_ref(func), args, kwargs))
+
+
+@dataclass
+class _Job:
+    job_id: int
+    payload: bytes
+    future: Future
+    timed: bool  # Resolve to (result, seconds, worker) instead of the result
+    requeues: int = 0
+    started: bool = False
+
+
+@dataclass
+class _Worker:
+    conn: Connection
+    name: str
+    pid: int
+    last_seen: float
+    job: Optional[_Job] = None
+    alive: bool = True
+
+
+@dataclass
+class _Outcome:
+    """Future completions collected under the lock, applied after it"""
+
+    results: List[Tuple[Future, Any]] = field(default_factory=list)
+    errors: List[Tuple[Future, BaseException]] = field(default_factory=list)
+
+    def apply(self):
+        for future, result in self.results:
+            future.set_result(result)
+        for future, error in self.errors:
+            future.set_exception(error)
+
+
+class DistributedPool(Executor):
+    """
+    Executor running jobs on socket-connected worker processes
+
+    Futures from submit() resolve to the callable's return value;
+    submit_timed() futures resolve to (value, seconds it ran on the
+    worker, worker name). ``requeued`` counts jobs re-queued after losing a worker.
+    """
+
+    def __init__(
+        self,
+        workers: int = os.cpu_count() or 1,
+        address: Tuple[str, int] = ("127.0.0.1", 0),
+        authkey: Optional[bytes] = None,
+        heartbeat_interval: float = 1.0,
+        heartbeat_timeout: float = 10.0,
+        max_requeues: int = 2,
+    ):
+        """
+        Args:
+            workers: Local worker processes to spawn (0 = remote only)
+            address: Address to listen on (port 0 = any free port)
+            authkey: Shared secret for worker connections (None = random)
+            heartbeat_interval: Seconds between worker heartbeats
+            heartbeat_timeout: Silence after which a worker counts as lost
+            max_requeues: Times one job may be re-queued after worker loss
+        """
+        if workers < 0:
+            raise ValueError(f"workers must be >= 0, got {workers}")
+
+        self.workers = workers
+        self.authkey = authkey if authkey is not None else os.urandom(32)
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_requeues = max_requeues
+        self.requeued = 0
+
+        self._listener = Listener(address, authkey=self.authkey)
+        self.address: Tuple[str, int] = self._listener.address
+        self._lock = threading.Condition()
+        self._pending: Deque[_Job] = deque()
+        self._connected: List[_Worker] = []
+        self._processes: List[multiprocessing.process.BaseProcess] = []
+        self._ids = itertools.count()
+        self._stopping = False  # No new submissions
+        self._closed = False  # Workers told to stop
+        self._done = threading.Event()
+
+        for target, name in (
+            (self._accept_loop, "accept"),
+            (self._monitor_loop, "monitor"),
+        ):
+            threading.Thread(
+                target=target, name=f"superclaude-distributed-{name}", daemon=True
+            ).start()
+
+        with self._lock:
+            for _ in range(workers):
+                self._spawn_locked()
+
+    # Executor interface
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """Schedule fn(*args, **kwargs) on a worker"""
+        return self._enqueue(fn, args, kwargs, timed=False)
+
+    def submit_timed(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """Like submit(), resolving to (result, seconds, worker name)"""
+        return self._enqueue(fn, args, kwargs, timed=True)
+
+    def _enqueue(self, fn: Callable, args: tuple, kwargs: dict, timed: bool) -> Future:
+        payload = _job_payload(fn, args, kwargs)
+
+        with self._lock:
+            if self._stopping:
+                raise RuntimeError("DistributedPool has been shut down")
+            job = _Job(next(self._ids), payload, Future(), timed)
+            self._pending.append(job)
+            outcome = self._dispatch_locked()
+        outcome.apply()
+        return job.future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """
+        Stop the workers and the listener
+
+        With ``wait``, queued and running jobs finish first (unless
+        ``cancel_futures`` cancels the queued ones); without it, queued
+        jobs are cancelled and running ones fail.
+        """
+        outcome = _Outcome()
+        with self._lock:
+            if self._closed:
+                return
+            self._stopping = True
+
+            if cancel_futures or not wait:
+                while self._pending:
+                    self._pending.popleft().future.cancel()
+            while wait and self._busy_locked():
+                self._lock.wait(self.heartbeat_interval)
+
+            self._closed = True
+            for worker in self._connected:
+                if worker.job is not None:
+                    error = RuntimeError("DistributedPool has been shut down")
+                    outcome.errors.append((worker.job.future, error))
+                    worker.job = None
+                try:
+                    worker.conn.send(("stop",))
+                except OSError:
+                    pass
+            processes = list(self._processes)
+
+        outcome.apply()
+        self._done.set()
+        self._close_listener()
+
+        for process in processes:
+            process.join(timeout=max(self.heartbeat_timeout, 1.0))
+            if process.is_alive():
+                process.kill()
+                process.join()
+
+    # Connection handling
+
+    def _accept_loop(self):
+        while True:
+            try:
+                conn = self._listener.accept()
+            except (OSError, EOFError, multiprocessing.AuthenticationError):
+                if self._closed:
+                    return
+                continue
+            if self._closed:
+                conn.close()
+                return
+            threading.Thread(
+                target=self._serve,
+                args=(conn,),
+                name="superclaude-distributed-worker",
+                daemon=True,
+            ).start()
+
+    def _close_listener(self):
+        # accept() is not interrupted by close(); wake it with a connection
+        try:
+            Client(self.address, authkey=self.authkey).close()
+        except (OSError, EOFError, multiprocessing.AuthenticationError):
+            pass
+        self._listener.close()
+
+    def _serve(self, conn: Connection):
+        """Read one worker's messages until it disconnects"""
+        try:
+            kind, name, pid = conn.recv()
+            if kind != "hello":
+                raise ValueError(kind)
+        except (OSError, EOFError, ValueError, TypeError):
+            conn.close()
+            return
+
+        worker = _Worker(conn, name, pid, time.monotonic())
+        with self._lock:
+            if self._closed:
+                conn.close()
+                return
+            self._connected.append(worker)
+            outcome = self._dispatch_locked()
+        outcome.apply()
+
+        try:
+            while True:
+                message = conn.recv()
+                worker.last_seen = time.monotonic()
+                if message[0] == "result":
+                    self._finish(worker, *message[1:])
+        except (OSError, EOFError):
+            pass
+
+        with self._lock:
+            outcome = self._lose_locked(worker)
+        outcome.apply()
+
+    def _finish(self, worker: _Worker, job_id: int, data: bytes, seconds: float):
+        try:
+            ok, value = pickle.loads(data)
+        except Exception as e:
+            ok, value = False, e
+
+        outcome = _Outcome()
+        with self._lock:
+            job = worker.job
+            if job is None or job.job_id != job_id or not worker.alive:
+                return  # Already given up on and re-queued
+            worker.job = None
+            if not ok:
+                outcome.errors.append((job.future, value))
+            elif job.timed:
+                outcome.results.append((job.future, (value, seconds, worker.name)))
+            else:
+                outcome.results.append((job.future, value))
+            self._merge(outcome, self._dispatch_locked())
+            self._lock.notify_all()
+        outcome.apply()
+
+    def _monitor_loop(self):
+        """Drop workers whose heartbeats stopped"""
+        while not self._done.wait(self.heartbeat_interval):
+            cutoff = time.monotonic() - self.heartbeat_timeout
+            outcome = _Outcome()
+            with self._lock:
+                for worker in list(self._connected):
+                    if worker.last_seen < cutoff:
+                        self._merge(outcome, self._lose_locked(worker))
+            outcome.apply()
+
+    # Scheduling (called with the lock held)
+
+    def _busy_locked(self) -> bool:
+        return bool(self._pending) or any(w.job for w in self._connected)
+
+    def _dispatch_locked(self) -> _Outcome:
+        """Hand queued jobs to idle workers"""
+        outcome = _Outcome()
+        for worker in list(self._connected):
+            while worker.job is None and worker.alive and self._pending:
+                job = self._pending.popleft()
+                if not job.started:
+                    if not job.future.set_running_or_notify_cancel():
+                        continue  # Cancelled while queued
+                    job.started = True
+                worker.job = job
+                try:
+                    worker.conn.send(("run", job.job_id, job.payload))
+                except OSError:
+                    self._merge(outcome, self._lose_locked(worker))
+        return outcome
+
+    def _lose_locked(self, worker: _Worker) -> _Outcome:
+        """Drop a worker, re-queuing its job and replacing local processes"""
+        outcome = _Outcome()
+        if not worker.alive:
+            return outcome
+        worker.alive = False
+        self._connected.remove(worker)
+        worker.conn.close()
+
+        job, worker.job = worker.job, None
+        if job is not None:
+            if job.requeues < self.max_requeues:
+                job.requeues += 1
+                self.requeued += 1
+                self._pending.appendleft(job)
+            else:
+                error = WorkerLostError(
+                    f"Worker {worker.name} lost; job already re-queued "
+                    f"{job.requeues} times"
+                )
+                outcome.errors.append((job.future, error))
+
+        for process in self._processes:
+            if process.pid == worker.pid:
+                process.kill()
+                self._processes.remove(process)
+                if not self._closed:
+                    self._spawn_locked()
+                break
+
+        self._merge(outcome, self._dispatch_locked())
+        self._lock.notify_all()
+        return outcome
+
+    def _spawn_locked(self):
+        process = multiprocessing.get_context("spawn").Process(
+            target=run_worker,
+            args=(self.address, self.authkey, self.heartbeat_interval),
+            name="superclaude-distributed-worker",
+            daemon=True,
+        )
+        process.start()
+        self._processes.append(process)
+
+    @staticmethod
+    def _merge(outcome: _Outcome, other: _Outcome):
+        outcome.results.extend(other.results)
+        outcome.errors.extend(other.errors)
+
+
+def run_worker(
+    address: Tuple[str, int],
+    authkey: bytes,
+    heartbeat_interval: float = 1.0,
+    name: Optional[str] = None,
+):
+    """
+    Worker main loop: connect, run jobs one at a time, send heartbeats
+
+    Returns when the pool sends "stop" or the connection closes.
+    """
+    conn = Client(address, authkey=authkey)
+    send_lock = threading.Lock()
+    stopped = threading.Event()
+
+    def send(message: tuple):
+        with send_lock:
+            conn.send(message)
+
+    def heartbeat():
+        while not stopped.wait(heartbeat_interval):
+            try:
+                send(("heartbeat",))
+            except OSError:
+                return
+
+    send(("hello", name or f"{socket.gethostname()}:{os.getpid()}", os.getpid()))
+    threading.Thread(target=heartbeat, daemon=True).start()
+    functions: Dict[str, Callable] = {}
+
+    try:
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+            if message[0] == "stop":
+                break
+
+            _, job_id, payload = message
+            start = time.perf_counter()
+            try:
+                ref, args, kwargs = pickle.loads(payload)
+                func = functions.get(ref)
+                if func is None:
+                    func = functions[ref] = resolve_callable(ref)
+                outcome: Tuple[bool, Any] = (True, func(*args, **kwargs))
+            except Exception as e:
+                outcome = (False, e)
+            seconds = time.perf_counter() - start
+
+            try:
+                data = pickle.dumps(outcome)
+            except Exception as e:
+                kind = "result" if outcome[0] else "exception"
+                error = RuntimeError(f"Unpicklable {kind} {outcome[1]!r}: {e}")
+                data = pickle.dumps((False, error))
+            send(("result", job_id, data, seconds))
+    finally:
+        stopped.set()
+        conn.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point for remote workers"""
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 1 or ":" not in args[0]:
+        print(
+            "usage: python -m superclaude.execution.distributed HOST:PORT",
+            file=sys.stderr,
+        )
+        return 2
+
+    key = os.environ.get(AUTHKEY_ENV)
+    if not key:
+        print(f"{AUTHKEY_ENV} must hold the pool's authkey (hex)", file=sys.stderr)
+        return 2
+
+    host, _, port = args[0].rpartition(":")
+    run_worker((host, int(port)), bytes.fromhex(key))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
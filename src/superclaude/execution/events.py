@@ -0,0 +1,397 @@
+"""
+Execution Events - Structured Progress Reporting
+
+The execution engines report progress as typed events instead of
+printing. Nothing is rendered unless a listener is subscribed, and
+emitting sites skip building events entirely when no one is listening.
+
+Event kinds:
+- plan_created, execution_started, execution_finished
+- group_started, group_finished (waves scheduling)
+- task_started, task_retrying, task_finished, deadline_exceeded
+- reflection_scored, root_cause_found, failure_learned
+- run_started, phase_started, run_finished (intelligent_execute)
+- notice (non-fatal problems such as unreadable memory files)
+
+Usage:
+    events = EventBus()
+    events.subscribe(ConsoleRenderer())  # classic console output
+    events.subscribe(lambda event: metrics.count(event.kind))
+
+    executor = ParallelExecutor(events=events)
+"""
+
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, List, Optional, TextIO
+
+if TYPE_CHECKING:
+    from .parallel import ExecutionPlan, ParallelGroup, Task
+    from .profiling import ExecutionProfile
+    from .reflection import ConfidenceScore
+    from .self_correction import RootCause
+
+
+@dataclass
+class Event:
+    """Base class for all execution events"""
+
+    kind: ClassVar[str] = "event"
+
+
+@dataclass
+class PlanCreated(Event):
+    """ParallelExecutor.plan() finished"""
+
+    kind: ClassVar[str] = "plan_created"
+    plan: "ExecutionPlan"
+
+
+@dataclass
+class ExecutionStarted(Event):
+    """A plan started executing"""
+
+    kind: ClassVar[str] = "execution_started"
+    plan: "ExecutionPlan"
+    mode: str  # waves / streaming / event loop
+
+
+@dataclass
+class ExecutionFinished(Event):
+    """A plan finished executing"""
+
+    kind: ClassVar[str] = "execution_finished"
+    plan: "ExecutionPlan"
+    elapsed: float
+    workers: int  # Concurrency level in use at the end
+    profile: Optional["ExecutionProfile"] = None  # Measured task timings
+
+
+@dataclass
+class GroupStarted(Event):
+    """A parallel group was released (waves scheduling)"""
+
+    kind: ClassVar[str] = "group_started"
+    group: "ParallelGroup"
+
+
+@dataclass
+class GroupFinished(Event):
+    """Every task of a parallel group is done (waves scheduling)"""
+
+    kind: ClassVar[str] = "group_finished"
+    group: "ParallelGroup"
+    elapsed: float
+
+
+@dataclass
+class TaskStarted(Event):
+    """A task attempt was submitted to its backend"""
+
+    kind: ClassVar[str] = "task_started"
+    task: "Task"
+
+
+@dataclass
+class TaskRetrying(Event):
+    """A failed or timed-out attempt will be retried after ``delay``"""
+
+    kind: ClassVar[str] = "task_retrying"
+    task: "Task"
+    delay: float
+
+
+@dataclass
+class TaskFinished(Event):
+    """
+    A task reached its final status
+
+    Status, result, error, duration and attempts are on the task.
+    """
+
+    kind: ClassVar[str] = "task_finished"
+    task: "Task"
+
+
+@dataclass
+class DeadlineExceeded(Event):
+    """The plan deadline passed with work still outstanding"""
+
+    kind: ClassVar[str] = "deadline_exceeded"
+    deadline: float
+
+
+@dataclass
+class ReflectionScored(Event):
+    """ReflectionEngine.reflect() produced a confidence score"""
+
+    kind: ClassVar[str] = "reflection_scored"
+    task: str
+    confidence: "ConfidenceScore"
+
+
+@dataclass
+class RootCauseFound(Event):
+    """SelfCorrectionEngine analyzed a failure"""
+
+    kind: ClassVar[str] = "root_cause_found"
+    task: str
+    root_cause: "RootCause"
+    similar_failures: int
+
+
+@dataclass
+class FailureLearned(Event):
+    """A failure was stored in reflexion memory"""
+
+    kind: ClassVar[str] = "failure_learned"
+    failure_id: str
+    recurrence_count: int  # 0 for a new failure
+    rule_added: bool
+
+
+@dataclass
+class RunStarted(Event):
+    """intelligent_execute() started"""
+
+    kind: ClassVar[str] = "run_started"
+    task: str
+    operations: int
+
+
+@dataclass
+class PhaseStarted(Event):
+    """intelligent_execute() entered a phase"""
+
+    kind: ClassVar[str] = "phase_started"
+    title: str
+
+
+@dataclass
+class RunFinished(Event):
+    """intelligent_execute() finished (status as in its return value)"""
+
+    kind: ClassVar[str] = "run_finished"
+    status: str
+    confidence: Optional["ConfidenceScore"] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class Notice(Event):
+    """Non-fatal problem worth surfacing"""
+
+    kind: ClassVar[str] = "notice"
+    message: str
+
+
+Listener = Callable[[Event], Any]
+
+
+class EventBus:
+    """
+    Dispatches events to subscribed listeners
+
+    Emitting code checks ``listening`` first so that, with no
+    listeners, no event objects are created at all:
+
+        if self.events.listening:
+            self.events.emit(TaskStarted(task))
+    """
+
+    def __init__(self, *listeners: Listener):
+        self._listeners: List[Listener] = list(listeners)
+        self.listening = bool(self._listeners)
+
+    def subscribe(self, listener: Listener) -> Listener:
+        """Add a listener (returned, so this works as a decorator)"""
+        self._listeners.append(listener)
+        self.listening = True
+        return listener
+
+    def unsubscribe(self, listener: Listener):
+        """Remove a previously subscribed listener"""
+        self._listeners.remove(listener)
+        self.listening = bool(self._listeners)
+
+    def emit(self, event: Event):
+        """Deliver an event to every listener, in subscription order"""
+        for listener in self._listeners:
+            listener(event)
+
+
+@dataclass
+class ConsoleRenderer:
+    """
+    Listener printing the classic banner-and-emoji console output
+
+    Example:
+        executor = ParallelExecutor(events=EventBus(ConsoleRenderer()))
+    """
+
+    stream: Optional[TextIO] = None  # Defaults to sys.stdout at print time
+    width: int = 60
+    _task_icons: ClassVar[dict] = {
+        "completed": "✅",
+        "failed": "❌",
+        "timed_out": "⏱️",
+        "cancelled": "🚫",
+        "skipped": "⏭️",
+    }
+    # Unsuccessful outcomes counted in the summary, in print order
+    _summary_labels: ClassVar[dict] = {
+        "failed": "Failed",
+        "timed_out": "Timed out",
+        "skipped": "Skipped",
+        "cancelled": "Cancelled",
+    }
+
+    def __call__(self, event: Event):
+        handler = getattr(self, f"_on_{event.kind}", None)
+        if handler is not None:
+            handler(event)
+
+    def _print(self, *lines: str):
+        stream = self.stream or sys.stdout
+        for line in lines:
+            print(line, file=stream)
+
+    def _on_plan_created(self, event: PlanCreated):
+        self._print(
+            f"⚡ Parallel Executor: Planned {event.plan.total_tasks} tasks",
+            "=" * self.width,
+            repr(event.plan),
+            "=" * self.width,
+        )
+
+    def _on_execution_started(self, event: ExecutionStarted):
+        plan = event.plan
+        self._print(
+            f"\n🚀 Executing {plan.total_tasks} tasks in {len(plan.groups)} groups"
+            f" ({event.mode})",
+            "=" * self.width,
+        )
+
+    def _on_execution_finished(self, event: ExecutionFinished):
+        plan = event.plan
+        statuses = Counter(
+            task.status.value for group in plan.groups for task in group.tasks
+        )
+        unsuccessful = [
+            f"{label}: {statuses[status]}"
+            for status, label in self._summary_labels.items()
+            if statuses[status]
+        ]
+        lines = ["\n" + "=" * self.width]
+        if unsuccessful:
+            lines += [
+                f"❌ {statuses['completed']}/{plan.total_tasks} tasks completed "
+                f"in {event.elapsed:.2f}s",
+                "   " + ", ".join(unsuccessful),
+            ]
+        else:
+            lines.append(f"✅ All tasks completed in {event.elapsed:.2f}s")
+        lines.append(f"   Workers: {event.workers}")
+        if event.elapsed > 0:
+            lines.append(f"   Estimated: {plan.parallel_time_estimate:.2f}s")
+        profile = event.profile
+        if profile is not None and profile.elapsed > 0:
+            lines += [
+                f"   Busy: {profile.busy_time:.2f}s "
+                f"({profile.utilization:.0%} utilization)",
+                f"   Measured speedup: {profile.parallelism:.1f}x",
+            ]
+        self._print(*lines, "=" * self.width)
+
+    def _on_group_started(self, event: GroupStarted):
+        self._print(f"\n📦 {event.group}")
+
+    def _on_group_finished(self, event: GroupFinished):
+        self._print(f"   Completed in {event.elapsed:.2f}s")
+
+    def _on_task_retrying(self, event: TaskRetrying):
+        task = event.task
+        self._print(
+            f"   🔁 {task.description}: {task.error}; retrying in {event.delay:.2f}s "
+            f"(attempt {task.attempts + 1}/{task.retries + 1})"
+        )
+
+    def _on_task_finished(self, event: TaskFinished):
+        task = event.task
+        status = task.status.value
+        icon = self._task_icons.get(status, "•")
+        if status == "completed":
+            self._print(f"   {icon} {task.description}")
+        elif task.error is not None:
+            self._print(f"   {icon} {task.description}: {task.error}")
+        else:
+            self._print(f"   {icon} {task.description}: {status}")
+
+    def _on_deadline_exceeded(self, event: DeadlineExceeded):
+        self._print(f"   ⏱️ Deadline of {event.deadline:.2f}s exceeded")
+
+    def _on_reflection_scored(self, event: ReflectionScored):
+        confidence = event.confidence
+        self._print(
+            "🧠 Reflection Engine: 3-Stage Analysis",
+            "=" * self.width,
+            f"1️⃣ {confidence.requirement_clarity}",
+            f"2️⃣ {confidence.mistake_check}",
+            f"3️⃣ {confidence.context_ready}",
+            "=" * self.width,
+            repr(confidence),
+            "=" * self.width,
+        )
+
+    def _on_root_cause_found(self, event: RootCauseFound):
+        lines = ["🔍 Self-Correction: Analyzing root cause", "=" * self.width]
+        if event.similar_failures:
+            lines.append(f"Found {event.similar_failures} similar past failures")
+        self._print(*lines, repr(event.root_cause), "=" * self.width)
+
+    def _on_failure_learned(self, event: FailureLearned):
+        lines = ["📚 Self-Correction: Learning from failure"]
+        if event.recurrence_count:
+            lines.append(f"⚠️ Recurring failure (count: {event.recurrence_count})")
+        else:
+            lines.append(f"✅ New failure recorded: {event.failure_id}")
+        if event.rule_added:
+            lines.append("📝 Prevention rule added")
+        self._print(*lines, "💾 Reflexion memory updated")
+
+    def _on_run_started(self, event: RunStarted):
+        self._print(
+            "\n" + "=" * 70,
+            "🧠 INTELLIGENT EXECUTION ENGINE",
+            "=" * 70,
+            f"Task: {event.task}",
+            f"Operations: {event.operations}",
+            "=" * 70,
+        )
+
+    def _on_phase_started(self, event: PhaseStarted):
+        self._print(f"\n{event.title}", "-" * 70)
+
+    def _on_run_finished(self, event: RunFinished):
+        if event.status == "blocked" and event.confidence is not None:
+            confidence = event.confidence
+            self._print(
+                "\n🔴 EXECUTION BLOCKED",
+                f"Confidence too low: {confidence.confidence:.0%} < 70%",
+                "\nBlockers:",
+                *(f"  ❌ {blocker}" for blocker in confidence.blockers),
+                "\nRecommendations:",
+                *(f"  💡 {rec}" for rec in confidence.recommendations),
+            )
+        elif event.status == "failed":
+            self._print(f"\n❌ EXECUTION FAILED: {event.error}", "=" * 70)
+        else:
+            self._print(
+                "\n" + "=" * 70,
+                f"✅ EXECUTION COMPLETE: {event.status.upper()}",
+                "=" * 70,
+            )
+
+    def _on_notice(self, event: Notice):
+        self._print(f"⚠️ {event.message}")
@@ -0,0 +1,207 @@
+"""
+Execution Journal - Checkpoint and Resume Long-Running Plans
+
+An ExecutionJournal is an append-only file recording every task that
+completes, with its result. Passing it to
+``execute(plan, resume_from=journal)`` skips tasks the journal already
+holds a result for, so a run that crashed or was interrupted picks up
+where it stopped instead of starting over.
+
+Each record is written with a single O_APPEND write and carries its
+length and a CRC32, so a record torn by a crash is detected and dropped
+(along with anything after it) instead of corrupting the journal. A
+journaled result is only reused for a task with the same id and the
+same operation (see cost_model.operation_key) it was recorded under;
+tasks without a stable identity, such as lambdas, are never journaled.
+When the execution ends the journal is compacted to one record per task.
+
+Results are stored as JSON, so a journal checked out with a repository
+is only ever parsed as data. As with the result cache, pickled results
+are opt-in (``allow_pickle=True``) and only for journals kept outside
+any repository.
+
+Usage:
+    journal = ExecutionJournal.for_repo(Path.cwd(), "nightly-index")
+    results = executor.execute(plan, resume_from=journal)
+    journal.discard()  # Once the results are safely used
+"""
+
+import hashlib
+import json
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Tuple
+
+from .result_cache import dump_result, load_result
+
+if TYPE_CHECKING:
+    from .parallel import Task
+
+# Record header: payload length, CRC32 of the payload. The payload is a
+# JSON line {"task": id, "key": operation key, "kind": result format}
+# followed by the stored result, so records can be told apart without
+# loading results.
+_HEADER = struct.Struct("<II")
+
+
+class ExecutionJournal:
+    """
+    Append-only journal of completed tasks and their results
+
+    Thread-safe. Results that cannot be stored are not journaled (the
+    task simply runs again on resume). With ``fsync`` every record is
+    flushed to disk, surviving power loss as well as process crashes.
+    ``allow_pickle`` also journals results JSON cannot represent; only
+    use it for a journal outside any repository.
+    """
+
+    def __init__(self, path: Path, fsync: bool = False, allow_pickle: bool = False):
+        self.path = path
+        self.fsync = fsync
+        self.allow_pickle = allow_pickle
+        self._lock = threading.Lock()
+        self._tail_checked = False  # Torn tail of an earlier crash dropped
+
+    @classmethod
+    def for_repo(cls, repo_path: Path, name: str, fsync: bool = False):
+        """Journal named ``name`` in the repository's docs/memory (JSON only)"""
+        digest = hashlib.sha256(name.encode()).hexdigest()[:16]
+        return cls(
+            repo_path / "docs" / "memory" / "journals" / f"{digest}.journal", fsync
+        )
+
+    def restore(self, tasks: List["Task"]) -> Dict[str, Any]:
+        """Journaled results (task id -> result) still valid for ``tasks``"""
+        from .cost_model import operation_key
+
+        entries = self._entries()
+        restored = {}
+        for task in tasks:
+            entry = entries.get(task.id)
+            key = operation_key(task)
+            if entry is not None and key is not None and entry[0] == key:
+                restored[task.id] = entry[1]
+        return restored
+
+    def record(self, task: "Task", result: Any) -> bool:
+        """
+        Append a completed task
+
+        False if it is not journaled: the task has no stable identity or
+        its result cannot be stored.
+        """
+        from .cost_model import operation_key
+
+        key = operation_key(task)
+        if key is None:
+            return False
+        dumped = dump_result(result, self.allow_pickle)
+        if dumped is None:
+            return False
+        kind, data = dumped
+        header = json.dumps({"task": task.id, "key": key, "kind": kind})
+        payload = header.encode() + b"\n" + data
+
+        record = _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                if not self._tail_checked:
+                    self._truncate_torn_tail(fd)
+                    self._tail_checked = True
+                os.write(fd, record)
+                if self.fsync:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+        return True
+
+    def compact(self):
+        """Rewrite the journal keeping only the last record per task"""
+        with self._lock:
+            latest: Dict[str, bytes] = {}
+            for task_id, payload in self._records():
+                latest[task_id] = payload
+            if not latest:
+                return
+
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                for payload in latest.values():
+                    f.write(_HEADER.pack(len(payload), zlib.crc32(payload)))
+                    f.write(payload)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            tmp_path.replace(self.path)
+            self._tail_checked = True
+
+    def discard(self):
+        """Delete the journal (the next execution starts from scratch)"""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    # Internals
+
+    def _entries(self) -> Dict[str, Tuple[str, Any]]:
+        """Last readable record per task id: (operation key, result)"""
+        entries = {}
+        with self._lock:
+            records = list(self._records())
+        for _, payload in records:
+            header, _, data = payload.partition(b"\n")
+            try:
+                meta = json.loads(header)
+                result = load_result(meta["kind"], data, self.allow_pickle)
+            except Exception:
+                continue  # e.g. a pickle, or its class no longer exists
+            entries[meta["task"]] = (meta["key"], result)
+        return entries
+
+    def _records(self) -> Iterator[Tuple[str, bytes]]:
+        """(task id, payload) of every intact record, in order"""
+        for payload in self._payloads(self._read()):
+            try:
+                task_id = json.loads(payload.partition(b"\n")[0])["task"]
+            except Exception:
+                continue
+            yield task_id, payload
+
+    def _read(self) -> bytes:
+        try:
+            return self.path.read_bytes()
+        except OSError:
+            return b""
+
+    @staticmethod
+    def _payloads(data: bytes) -> Iterator[bytes]:
+        """Intact payloads up to the first torn or corrupt record"""
+        offset = 0
+        while offset + _HEADER.size <= len(data):
+            length, crc = _HEADER.unpack_from(data, offset)
+            start = offset + _HEADER.size
+            payload = data[start : start + length]
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                return
+            yield payload
+            offset = start + length
+
+    def _valid_length(self, data: bytes) -> int:
+        return sum(_HEADER.size + len(p) for p in self._payloads(data))
+
+    def _truncate_torn_tail(self, fd: int):
+        """Drop a partial record left by a crash so appends stay readable"""
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return
+        data = self._read()
+        valid = self._valid_length(data)
+        if valid < size:
+            os.ftruncate(fd, valid)
@@ -8,14 +8,156 @@ Key features:
 - Dependency graph construction
 - Automatic parallel group detection
 - Concurrent execution with ThreadPoolExecutor
+- Streaming scheduling (tasks start as soon as their own dependencies finish)
+- Persistent worker pools (per executor or shared process-wide)
+- Thread, process, inline and distributed backends (per executor or per task)
+- Duration-aware estimates (critical path, list-scheduling makespan)
+- Critical-path-first ordering of ready tasks
+- Failure policies, downstream pruning and cooperative cancellation
+- Per-task timeouts, retries with jittered exponential backoff and a
+  per-plan deadline
 - Result aggregation and error handling
+- Structured progress events (silent unless a listener subscribes)
+- Streaming results (execute_iter) with optional early release
+- Bounded-memory chunked map over any iterable (map)
+- Adaptive worker count from observed throughput (max_workers="auto")
+- Dependencies inferred from declared resource reads and writes
+- Plan caching for repeated, structurally identical graphs
 """
 
+import functools
+import heapq
+import itertools
+import os
+import random
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .adaptive import AUTO_MAX_WORKERS, AIMDController
+from .backends import (
+    SHARED_MEMORY_THRESHOLD,
+    BackendError,
+    check_backend,
+    check_picklable,
+    run_chunk,
+    run_in_process,
+)
+from .cost_model import (
+    DurationHistory,
+    critical_path,
+    downstream_costs,
+    estimate_costs,
+    priority_keys,
+    streaming_makespan,
+    task_key,
+    waves_makespan,
+)
+from .distributed import DistributedPool, check_importable
+from .events import (
+    ConsoleRenderer,
+    DeadlineExceeded,
+    EventBus,
+    ExecutionFinished,
+    ExecutionStarted,
+    GroupFinished,
+    GroupStarted,
+    PlanCreated,
+    TaskFinished,
+    TaskRetrying,
+    TaskStarted,
+)
+from .journal import ExecutionJournal
+from .plan_cache import PlanCache, PlanTemplate, plan_key
+from .profiling import ExecutionProfile
+from .resources import Resource, add_inferred_dependencies
+from .result_cache import CacheKey, ResultCache
+
+# Scheduling modes understood by ParallelExecutor
+# - waves: run plan groups one at a time (barrier between groups)
+# - streaming: launch each task the moment its own dependencies complete
+SCHEDULING_MODES = ("waves", "streaming")
+
+# Orderings for ready tasks when more are ready than there are workers
+# - fifo: in plan order / the order they became ready
+# - critical_path: highest Task.priority first, then longest remaining
+#   downstream path (so long chains do not start last)
+ORDERING_MODES = ("fifo", "critical_path")
+
+# What happens to the rest of the plan when a task fails
+# - continue: run everything else, dependents included
+# - skip-dependents: mark transitive dependents SKIPPED without running them
+# - fail-fast: cancel everything not yet finished
+FAILURE_POLICIES = ("continue", "skip-dependents", "fail-fast")
+
+# Process-wide pool shared by executors created with shared_pool=True
+_shared_pool: Optional[ThreadPoolExecutor] = None
+_shared_pool_lock = threading.Lock()
+_worker_state = threading.local()
+
+
+def _mark_shared_worker():
+    """Thread initializer flagging threads owned by the shared pool"""
+    _worker_state.shared = True
+
+
+def _in_shared_worker() -> bool:
+    """Check if the current thread is a shared pool worker"""
+    return getattr(_worker_state, "shared", False)
+
+
+def get_shared_pool() -> ThreadPoolExecutor:
+    """
+    Get or create the process-wide worker pool
+
+    Executors created with ``shared_pool=True`` submit to this pool,
+    so short-lived executors do not pay thread start-up costs.
+    """
+    global _shared_pool
+
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = ThreadPoolExecutor(
+                thread_name_prefix="superclaude-shared",
+                initializer=_mark_shared_worker,
+            )
+        return _shared_pool
+
+
+def shutdown_shared_pool(wait: bool = True):
+    """Shut down the process-wide pool (recreated on next use)"""
+    global _shared_pool
+
+    with _shared_pool_lock:
+        pool, _shared_pool = _shared_pool, None
+
+    if pool is not None:
+        pool.shutdown(wait=wait)
 
 
 class TaskStatus(Enum):
@@ -25,6 +167,55 @@ class TaskStatus(Enum):
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
+    SKIPPED = "skipped"  # Not run because a dependency failed
+    CANCELLED = "cancelled"  # Stopped or never started due to cancellation
+    TIMED_OUT = "timed_out"  # Last attempt exceeded its timeout or the deadline
+
+
+# Statuses that count as a failure (for failure policies and retries)
+FAILED_STATUSES = (TaskStatus.FAILED, TaskStatus.TIMED_OUT)
+
+
+class TaskCancelledError(Exception):
+    """Raised by a task that stops early because it was cancelled"""
+
+
+class TaskTimeoutError(TimeoutError):
+    """Recorded as Task.error when an attempt exceeds its time limit"""
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation signal for long-running tasks
+
+    Tasks created with ``cancellable=True`` receive the token as the
+    only argument to their callable and should check it periodically:
+
+        def crawl(token):
+            for path in paths:
+                token.raise_if_cancelled()
+                index(path)
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """Request cancellation"""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """Raise TaskCancelledError if cancellation was requested"""
+        if self._event.is_set():
+            raise TaskCancelledError("Task cancelled")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancelled or timeout; returns True if cancelled"""
+        return self._event.wait(timeout)
 
 
 @dataclass
@@ -38,12 +229,36 @@ class Task:
     status: TaskStatus = TaskStatus.PENDING
     result: Any = None
     error: Optional[Exception] = None
+    backend: Optional[str] = None  # thread / process / ... (None = executor's)
+    cost: Optional[float] = None  # Estimated seconds (None = use history)
+    fingerprint: Optional[str] = None  # Duration history key (None = description)
+    duration: Optional[float] = None  # Measured run time of the last execution
+    started: Optional[float] = None  # perf_counter() at the last start (in-process)
+    priority: Optional[float] = None  # Higher runs first (critical_path ordering)
+    cancellable: bool = False  # Call execute(token) with a CancellationToken
+    timeout: Optional[float] = None  # Seconds per attempt (None = no limit)
+    retries: int = 0  # Extra attempts after a failure or timeout
+    attempts: int = 0  # Attempts made by the last execution
+    worker: Optional[str] = None  # Where the last attempt ran
+    reads: Sequence[Resource] = ()  # Resources read (see resources.py)
+    writes: Sequence[Resource] = ()  # Resources written
+    cache: Optional[CacheKey] = None  # Inputs the result is a pure function of
+    cached: bool = False  # Last result was served from the result cache
+    pools: Sequence[str] = ()  # Named concurrency pools a run occupies a slot in
 
     def can_execute(self, completed_tasks: Set[str]) -> bool:
         """Check if all dependencies are satisfied"""
         return all(dep in completed_tasks for dep in self.depends_on)
 
 
+class CircularDependencyError(ValueError):
+    """Raised when task dependencies form one or more cycles"""
+
+    def __init__(self, cycles: List[List[str]]):
+        self.cycles = cycles
+        super().__init__(f"Circular dependency detected: {cycles}")
+
+
 @dataclass
 class ParallelGroup:
     """Group of tasks that can execute in parallel"""
@@ -56,6 +271,15 @@ class ParallelGroup:
         return f"Group {self.group_id}: {len(self.tasks)} tasks"
 
 
+class TaskOutcome(NamedTuple):
+    """Final outcome of one task, as yielded by execute_iter()"""
+
+    task_id: str
+    result: Any
+    status: TaskStatus
+    duration: Optional[float]  # None if the task never ran
+
+
 @dataclass
 class ExecutionPlan:
     """Complete execution plan with parallelization strategy"""
@@ -65,6 +289,9 @@ class ExecutionPlan:
     sequential_time_estimate: float
     parallel_time_estimate: float
     speedup: float
+    critical_path: List[str] = field(default_factory=list)  # Longest chain
+    critical_path_time: float = 0.0  # Lower bound on parallel time
+    workers: int = 0  # Concurrency the estimate assumes
 
     def __repr__(self) -> str:
         return (
@@ -73,10 +300,207 @@ class ExecutionPlan:
             f"  Parallel groups: {len(self.groups)}\n"
             f"  Sequential time: {self.sequential_time_estimate:.1f}s\n"
             f"  Parallel time: {self.parallel_time_estimate:.1f}s\n"
+            f"  Critical path: {self.critical_path_time:.1f}s "
+            f"({len(self.critical_path)} tasks)\n"
+            f"  Workers: {self.workers}\n"
             f"  Speedup: {self.speedup:.1f}x"
         )
 
 
+def _check_task_ids(tasks: List[Task]):
+    """Reject duplicate task ids and dependencies on unknown tasks"""
+
+    known: Set[str] = set()
+    for task in tasks:
+        if task.id in known:
+            raise ValueError(f"Duplicate task id: {task.id}")
+        known.add(task.id)
+
+    unknown = sorted({dep for task in tasks for dep in task.depends_on} - known)
+    if unknown:
+        raise ValueError(f"Unknown dependencies: {unknown}")
+
+
+def _plan_from_template(template: PlanTemplate, tasks: List[Task]) -> ExecutionPlan:
+    """Bind a cached plan template to the given (structurally equal) tasks"""
+
+    by_id = {task.id: task for task in tasks}
+    groups = []
+    for group_id, ids in enumerate(template.groups):
+        ready = [by_id[task_id] for task_id in ids]
+        groups.append(
+            ParallelGroup(
+                group_id=group_id,
+                tasks=ready,
+                dependencies={dep for t in ready for dep in t.depends_on},
+            )
+        )
+
+    return ExecutionPlan(
+        groups=groups,
+        total_tasks=len(tasks),
+        sequential_time_estimate=template.sequential_time_estimate,
+        parallel_time_estimate=template.parallel_time_estimate,
+        speedup=template.speedup,
+        critical_path=list(template.critical_path),
+        critical_path_time=template.critical_path_time,
+        workers=template.workers,
+    )
+
+
+def _index_dependencies(
+    tasks: List[Task],
+) -> Tuple[Dict[str, int], Dict[str, List[Task]]]:
+    """
+    Build dependency indexes in a single pass
+
+    Every dependency must be one of ``tasks`` (see _check_task_ids).
+
+    Returns:
+        (in_degree, dependents): number of distinct dependencies per
+        task id, and the tasks that depend on each task id.
+    """
+
+    in_degree: Dict[str, int] = {}
+    dependents: Dict[str, List[Task]] = {task.id: [] for task in tasks}
+
+    for task in tasks:
+        deps: Collection[str] = task.depends_on
+        if len(deps) > 1:
+            deps = set(deps)
+        in_degree[task.id] = len(deps)
+        for dep in deps:
+            dependents[dep].append(task)
+
+    return in_degree, dependents
+
+
+def _find_cycles(
+    tasks: List[Task], resolved: Dict[str, int], dependents: Dict[str, List[Task]]
+) -> List[List[str]]:
+    """
+    Find the exact members of every dependency cycle
+
+    Runs an iterative Tarjan SCC search over the tasks Kahn's algorithm
+    could not resolve. Tasks merely downstream of a cycle are excluded.
+    """
+
+    pending = [task.id for task in tasks if task.id not in resolved]
+    pending_set = set(pending)
+    successors = {
+        task_id: [c.id for c in dependents.get(task_id, ()) if c.id in pending_set]
+        for task_id in pending
+    }
+
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack: Set[str] = set()
+    cycles: List[List[str]] = []
+
+    for root in pending:
+        if root in index:
+            continue
+
+        work = [(root, iter(successors[root]))]
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            node, children = work[-1]
+            child = next(children, None)
+
+            if child is not None:
+                if child not in index:
+                    index[child] = lowlink[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(successors[child])))
+                elif child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in successors[node]:
+                    cycles.append(sorted(component))
+
+    return cycles
+
+
+def _current_attempt(task: Task, attempt: int) -> bool:
+    """Whether an attempt is still the one the scheduler waits for"""
+    return task.attempts == attempt and task.status == TaskStatus.RUNNING
+
+
+def _run_timed(task: Task, token: CancellationToken) -> Any:
+    """
+    Run a task's callable, recording its start, run time and worker on
+    the task
+
+    An attempt the scheduler gave up on (timed out, or retried since)
+    leaves the task's recorded fields alone when it finally returns.
+    """
+
+    attempt = task.attempts
+    task.worker = threading.current_thread().name
+    start = time.perf_counter()
+    if _current_attempt(task, attempt):
+        task.started = start
+    try:
+        if task.cancellable:
+            return task.execute(token)
+        return task.execute()
+    finally:
+        if _current_attempt(task, attempt):
+            task.duration = time.perf_counter() - start
+
+
+class _RelayFuture(Future):
+    """Result future of a job run elsewhere; cancelling it cancels the job"""
+
+    def __init__(self, inner: Future):
+        super().__init__()
+        self.inner = inner
+
+    def cancel(self) -> bool:
+        # Fails while the job runs, like a pool future of a running task
+        return self.inner.cancel() and super().cancel()
+
+
+def _relay_timed(task: Task, inner: Future) -> Future:
+    """Unwrap a worker's (result, seconds, worker) into a plain result future"""
+
+    outer = _RelayFuture(inner)
+    attempt = task.attempts
+
+    def relay(done: Future):
+        if done.cancelled():
+            return  # Cancelled through outer
+        try:
+            result, duration, worker = done.result()
+            if _current_attempt(task, attempt):
+                task.duration, task.worker = duration, worker
+            outer.set_result(result)
+        except Exception as e:
+            outer.set_exception(e)
+
+    inner.add_done_callback(relay)
+    return outer
+
+
 class ParallelExecutor:
     """
     Automatic Parallel Execution Engine
@@ -95,61 +519,577 @@ class ParallelExecutor:
 
         plan = executor.plan(tasks)
         results = executor.execute(plan)
+
+    The worker pool is created on first use and reused for every
+    subsequent execute() call until shutdown(). Use the executor as a
+    context manager to release its threads deterministically:
+
+        with ParallelExecutor() as executor:
+            executor.execute(executor.plan(tasks))
+
+    With ``shared_pool=True`` the executor submits to a process-wide
+    pool instead (see get_shared_pool()); max_workers still bounds how
+    many of its tasks are in flight at once.
+
+    Backends (``backend=`` here, or ``Task.backend`` per task):
+        thread: Thread pool; right for I/O-bound operations.
+        process: Process pool for CPU-bound work (parsing, hashing,
+            regex extraction). Callables must be picklable, and bytes
+            results over ``shared_memory_threshold`` come back as
+            SharedBytes instead of being copied through a pipe.
+        inline: Runs in the scheduling thread.
+        distributed: Worker processes connected over a socket (see
+            DistributedPool; pass one as ``distributed_pool`` or a
+            local one is started). Callables must be module-level
+            functions, optionally wrapped in functools.partial.
+
+    Ordering (which ready task gets the next free worker):
+        fifo: Plan order, then the order tasks became ready.
+        critical_path: Explicit ``Task.priority`` first (higher wins),
+            then the task with the longest cost-weighted path to the
+            end of the plan.
+
+    Failure policies:
+        continue: Failed tasks yield None; everything else still runs.
+        skip-dependents: Transitive dependents of a failed task are
+            marked SKIPPED without running; unrelated tasks continue.
+        fail-fast: The first failure cancels the plan: queued tasks are
+            CANCELLED and running ``cancellable`` tasks are signalled.
+        cancel() from another thread has the same effect as fail-fast.
+
+    Estimates:
+        plan() costs each task from ``Task.cost``, else from the measured
+        duration ``history`` (if given), else 1s. It reports the
+        cost-weighted critical path and the makespan of simulating the
+        executor's scheduling mode on ``max_workers`` workers. execute()
+        feeds measured run times back into the history. With a
+        ``plan_cache``, a graph planned before (same task ids, edges
+        and settings) reuses the cached groups and estimates.
+
+    Concurrency pools:
+        ``pool_limits`` names extra limits, e.g. ``{"subprocess": 4,
+        "mcp": 2}``. A task listing pools in ``Task.pools`` occupies one
+        slot of each while it runs and only starts when all of them
+        have a free slot (and the global limit allows it); meanwhile
+        tasks needing other pools keep the remaining workers busy.
+
+    Result caching:
+        With a ``result_cache``, tasks declaring ``Task.cache`` are keyed
+        by their input files and version tag before they run; a stored
+        result completes the task without calling it (``Task.cached``),
+        and successful results are stored for next time.
+
+    Scheduling modes:
+        waves: Groups run one after another; a slow task in group N
+            delays every task in group N+1.
+        streaming: Each task is submitted as soon as the tasks it
+            depends on have finished, so wall time approaches the
+            critical-path length instead of the sum of group maxima.
+
+    Timeouts and retries:
+        A task with ``timeout`` set is given up on once an attempt runs
+        longer than that; a task with ``retries`` is resubmitted after a
+        failure or timeout, waiting ``retry_backoff * 2**n`` seconds
+        (capped at ``retry_backoff_max``, with full jitter) before
+        attempt n + 1. Threads cannot be interrupted, so a timed-out
+        callable keeps its worker until it returns; cancellable tasks
+        should check their token. ``deadline`` bounds a whole execute()
+        call: when it passes, running tasks are marked TIMED_OUT and
+        everything else CANCELLED.
+
+    Adaptive concurrency:
+        With ``max_workers="auto"`` the in-flight limit starts at the
+        CPU count and is tuned between executions and within them by an
+        AIMDController fed with each task's throughput, run time and
+        queue delay. ``concurrency`` (and ``ExecutionPlan.workers``)
+        report the level in use.
     """
 
-    def __init__(self, max_workers: int = 10):
+    def __init__(
+        self,
+        max_workers: Union[int, str] = 10,
+        scheduling: str = "waves",
+        shared_pool: bool = False,
+        backend: str = "thread",
+        shared_memory_threshold: int = SHARED_MEMORY_THRESHOLD,
+        history: Optional[DurationHistory] = None,
+        ordering: str = "fifo",
+        failure_policy: str = "continue",
+        retry_backoff: float = 0.5,
+        retry_backoff_max: float = 30.0,
+        deadline: Optional[float] = None,
+        events: Optional[EventBus] = None,
+        plan_cache: Optional[PlanCache] = None,
+        distributed_pool: Optional[DistributedPool] = None,
+        result_cache: Optional[ResultCache] = None,
+        pool_limits: Optional[Dict[str, int]] = None,
+    ):
+        if scheduling not in SCHEDULING_MODES:
+            raise ValueError(
+                f"Unknown scheduling mode: {scheduling!r} "
+                f"(expected one of {', '.join(SCHEDULING_MODES)})"
+            )
+        if ordering not in ORDERING_MODES:
+            raise ValueError(
+                f"Unknown ordering: {ordering!r} "
+                f"(expected one of {', '.join(ORDERING_MODES)})"
+            )
+        if failure_policy not in FAILURE_POLICIES:
+            raise ValueError(
+                f"Unknown failure policy: {failure_policy!r} "
+                f"(expected one of {', '.join(FAILURE_POLICIES)})"
+            )
+        check_backend(backend)
+        for name, limit in (pool_limits or {}).items():
+            if not isinstance(limit, int) or limit < 1:
+                raise ValueError(
+                    f"Limit of pool {name!r} must be a positive int, got {limit!r}"
+                )
+
+        self.controller: Optional[AIMDController] = None
+        if max_workers == "auto":
+            # The pool is sized for the ceiling; the controller sets the limit
+            max_workers = AUTO_MAX_WORKERS
+            self.controller = AIMDController(
+                initial=os.cpu_count() or 1, maximum=max_workers
+            )
+        elif not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError(
+                f"max_workers must be a positive int or 'auto', got {max_workers!r}"
+            )
+
         self.max_workers = max_workers
+        self.scheduling = scheduling
+        self.shared_pool = shared_pool
+        self.backend = backend
+        self.shared_memory_threshold = shared_memory_threshold
+        self.history = history
+        self.ordering = ordering
+        self.failure_policy = failure_policy
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self.deadline = deadline
+        self.events = events if events is not None else EventBus()
+        self.plan_cache = plan_cache
+        self.distributed_pool = distributed_pool
+        self.result_cache = result_cache
+        self.pool_limits = dict(pool_limits or {})
+
+        self._cancel_token = CancellationToken()
+        self.last_profile: Optional[ExecutionProfile] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._own_distributed_pool: Optional[DistributedPool] = None
+        self._pool_lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> "ParallelExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def shutdown(self, wait: bool = True):
+        """
+        Release the executor's worker pools
+
+        Idempotent. The shared process-wide pool is left running; use
+        shutdown_shared_pool() for that. A ``distributed_pool`` passed in
+        belongs to the caller and is left running too. Calling execute() afterwards
+        raises RuntimeError.
+        """
+
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+            process_pool, self._process_pool = self._process_pool, None
+            distributed_pool = self._own_distributed_pool
+            self._own_distributed_pool = None
+            self._closed = True
+
+        if pool is not None:
+            pool.shutdown(wait=wait)
+        if process_pool is not None:
+            process_pool.shutdown(wait=wait)
+        if distributed_pool is not None:
+            distributed_pool.shutdown(wait=wait)
+
+    @property
+    def concurrency(self) -> int:
+        """Number of tasks allowed in flight right now"""
+        if self.controller is not None:
+            return self.controller.limit
+        return self.max_workers
+
+    def cancel(self):
+        """
+        Cancel the plan currently being executed
+
+        Queued tasks are marked CANCELLED and running ``cancellable``
+        tasks see their token set. Tasks already running to completion
+        without checking the token are still waited for.
+        """
+        self._cancel_token.cancel()
+
+    def _acquire_pool(self) -> ThreadPoolExecutor:
+        """Return the pool to submit to, creating it on first use"""
+
+        with self._pool_lock:
+            if self._closed:
+                raise RuntimeError("ParallelExecutor has been shut down")
+
+            # Nested execution from a shared worker gets a private pool,
+            # otherwise it could wait on the very threads it occupies
+            if self.shared_pool and not _in_shared_worker():
+                return get_shared_pool()
+
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="superclaude-parallel",
+                )
+            return self._pool
+
+    def _acquire_process_pool(self) -> ProcessPoolExecutor:
+        """Return the process pool, creating it on first use"""
+
+        with self._pool_lock:
+            if self._closed:
+                raise RuntimeError("ParallelExecutor has been shut down")
+
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=min(self.max_workers, os.cpu_count() or 1)
+                )
+            return self._process_pool
+
+    def _acquire_distributed_pool(self) -> DistributedPool:
+        """Return the distributed pool, starting local workers on first use"""
+
+        if self.distributed_pool is not None:
+            return self.distributed_pool
+
+        with self._pool_lock:
+            if self._closed:
+                raise RuntimeError("ParallelExecutor has been shut down")
+
+            if self._own_distributed_pool is None:
+                self._own_distributed_pool = DistributedPool(
+                    workers=min(self.max_workers, os.cpu_count() or 1)
+                )
+            return self._own_distributed_pool
+
+    def _backend_for(self, task: Task) -> str:
+        """Resolve the backend a task runs on"""
+        return task.backend or self.backend
+
+    def _check_backends(self, tasks: List[Task]):
+        """Validate backends up front so no task runs before a bad one fails"""
+
+        for task in tasks:
+            backend = self._backend_for(task)
+            check_backend(backend)
+            if backend in ("process", "distributed"):
+                if task.cancellable:
+                    raise BackendError(
+                        f"Task {task.id!r} is cancellable, which "
+                        f"backend={backend!r} does not support (tokens cannot "
+                        f"cross processes)"
+                    )
+            if backend == "process":
+                check_picklable(task.id, task.execute)
+            elif backend == "distributed":
+                check_importable(task.id, task.execute)
+
+    def _check_pools(self, tasks: List[Task]):
+        """Validate that every pool a task uses has a limit"""
+
+        for task in tasks:
+            for name in task.pools:
+                if name not in self.pool_limits:
+                    configured = ", ".join(sorted(self.pool_limits)) or "none"
+                    raise ValueError(
+                        f"Task {task.id!r} uses unknown pool {name!r} "
+                        f"(configured: {configured})"
+                    )
+
+    def _retry_delay(self, attempt: int) -> float:
+        """Backoff before retrying after the given (1-based) attempt"""
+        ceiling = min(self.retry_backoff_max, self.retry_backoff * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def _should_retry(self, task: Task, token: CancellationToken) -> bool:
+        """Check if a finished attempt should be retried"""
+        return (
+            task.status in FAILED_STATUSES
+            and task.attempts <= task.retries
+            and not token.cancelled
+        )
+
+    def _submit(self, task: Task, token: CancellationToken) -> Future:
+        """Start a task (or its result cache lookup) and return its future"""
+
+        task.attempts += 1
+        task.cached = False
+
+        if task.cache is not None and self.result_cache is not None:
+            return self._submit_cached(task, token, self.result_cache)
+        return self._submit_backend(task, token)
+
+    def _submit_backend(self, task: Task, token: CancellationToken) -> Future:
+        """Start a task on its backend and return its future"""
+
+        backend = self._backend_for(task)
+
+        if backend == "process":
+            return _relay_timed(
+                task,
+                self._acquire_process_pool().submit(
+                    run_in_process, task.execute, self.shared_memory_threshold
+                ),
+            )
+
+        if backend == "distributed":
+            return _relay_timed(
+                task, self._acquire_distributed_pool().submit_timed(task.execute)
+            )
+
+        if backend == "inline":
+            future: Future = Future()
+            try:
+                future.set_result(_run_timed(task, token))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        return self._acquire_pool().submit(_run_timed, task, token)
+
+    def _submit_cached(
+        self, task: Task, token: CancellationToken, cache: ResultCache
+    ) -> Future:
+        """
+        Look a task up in the result cache, running it on a miss
+
+        Keying hashes input files, so the lookup runs on a pool thread
+        (inline tasks look up in the scheduling thread). The returned
+        future can be cancelled until the lookup starts.
+        """
+
+        outer: Future = Future()
+
+        def lookup() -> Optional[Tuple[Optional[str], bool, Any]]:
+            if not outer.set_running_or_notify_cancel():
+                return None
+            return cache.lookup(task)
+
+        def looked_up(done: Future):
+            try:
+                found = done.result()
+            except Exception as e:
+                outer.set_exception(e)
+                return
+            if found is None:
+                return  # Cancelled before the lookup
+
+            key, hit, result = found
+            if hit:
+                task.cached = True
+                task.duration = 0.0
+                task.worker = "result cache"
+                outer.set_result(result)
+                return
+
+            def store(done: Future):
+                try:
+                    result = done.result()
+                except Exception as e:
+                    outer.set_exception(e)
+                    return
+                if key is not None:
+                    cache.put(key, result)
+                outer.set_result(result)
+
+            try:
+                self._submit_backend(task, token).add_done_callback(store)
+            except Exception as e:
+                outer.set_exception(e)
+
+        if self._backend_for(task) == "inline":
+            inline: Future = Future()
+            try:
+                inline.set_result(lookup())
+            except Exception as e:
+                inline.set_exception(e)
+            looked_up(inline)
+        else:
+            self._acquire_pool().submit(lookup).add_done_callback(looked_up)
+        return outer
+
+    def map(
+        self,
+        func: Callable,
+        items: Iterable,
+        chunk_size: int = 1,
+        ordered: bool = True,
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        Apply func to every item, streaming results back
+
+        An embarrassingly parallel map that needs no plan: ``items`` may
+        be any iterable (including a generator) and is consumed lazily.
+        At most ``max_in_flight`` chunks (default 2 x max_workers) are
+        submitted or buffered at once, so memory stays bounded no matter
+        how many items there are. Each chunk of ``chunk_size`` items is
+        one submission to the executor's backend.
+
+        Results are yielded in input order when ``ordered``, otherwise in
+        completion order (per chunk). An exception raised by func is
+        re-raised when its chunk is reached, and outstanding chunks are
+        cancelled; the same happens if the iterator is abandoned.
+
+        Example:
+            with ParallelExecutor(shared_pool=True) as executor:
+                for digest in executor.map(hash_file, iter_paths(), 64):
+                    ...
+        """
+
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        if self._closed:
+            raise RuntimeError("ParallelExecutor has been shut down")
+        if self.backend == "process":
+            check_picklable("map", func)
+        elif self.backend == "distributed":
+            check_importable("map", func)
+
+        limit = max_in_flight or 2 * self.concurrency
+        source = iter(items)
+        pending: Deque[Future] = deque()
+
+        def submit(chunk: List[Any]) -> Future:
+            if self.backend == "process":
+                return self._acquire_process_pool().submit(run_chunk, func, chunk)
+            if self.backend == "distributed":
+                return self._acquire_distributed_pool().submit(run_chunk, func, chunk)
+            if self.backend == "inline":
+                future: Future = Future()
+                try:
+                    future.set_result(run_chunk(func, chunk))
+                except Exception as e:
+                    future.set_exception(e)
+                return future
+            return self._acquire_pool().submit(run_chunk, func, chunk)
+
+        def refill():
+            while len(pending) < limit:
+                chunk = list(itertools.islice(source, chunk_size))
+                if not chunk:
+                    return
+                pending.append(submit(chunk))
+
+        try:
+            refill()
+            while pending:
+                if ordered:
+                    chunk_results = pending.popleft().result()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = next(iter(done))
+                    pending.remove(future)
+                    chunk_results = future.result()
+
+                refill()
+                yield from chunk_results
+                del chunk_results
+
+        finally:
+            for future in pending:
+                future.cancel()
 
     def plan(self, tasks: List[Task]) -> ExecutionPlan:
         """
         Create execution plan with automatic parallelization
 
-        Builds dependency graph and identifies parallel groups.
+        Builds dependency graph and identifies parallel groups. Tasks
+        declaring ``reads``/``writes`` get the implied dependencies added
+        to ``depends_on`` first.
         """
 
-        print(f"⚡ Parallel Executor: Planning {len(tasks)} tasks")
-        print("=" * 60)
-
-        # Find parallel groups using topological sort
-        groups = []
-        completed = set()
-        group_id = 0
-
-        while len(completed) < len(tasks):
-            # Find tasks that can execute now (dependencies met)
-            ready = [
-                task
-                for task in tasks
-                if task.id not in completed and task.can_execute(completed)
-            ]
-
-            if not ready:
-                # Circular dependency or logic error
-                remaining = [t.id for t in tasks if t.id not in completed]
-                raise ValueError(f"Circular dependency detected: {remaining}")
-
-            # Create parallel group
-            group = ParallelGroup(
+        # Declared reads/writes become dependencies, in list order
+        add_inferred_dependencies(tasks)
+
+        key = None
+        if self.plan_cache is not None:
+            # Only graphs that passed validation are cached, so a hit on
+            # the same ids and edges needs no re-check
+            key = plan_key(
+                tasks,
+                self.scheduling,
+                self.ordering,
+                "auto" if self.controller is not None else self.max_workers,
+                self.history is not None,
+            )
+            template = self.plan_cache.get(key)
+            if template is not None:
+                return self._announce(_plan_from_template(template, tasks))
+
+        # Find parallel groups using Kahn's topological sort.
+        # Each task's group is its dependency depth, computed in O(V + E).
+        _check_task_ids(tasks)
+        in_degree, dependents = _index_dependencies(tasks)
+        dependency_counts = dict(in_degree)
+
+        depth: Dict[str, int] = {}
+        frontier = [task for task in tasks if in_degree[task.id] == 0]
+        level = 0
+
+        while frontier:
+            next_frontier = []
+            for task in frontier:
+                depth[task.id] = level
+                for child in dependents[task.id]:
+                    child_id = child.id
+                    in_degree[child_id] -= 1
+                    if not in_degree[child_id]:
+                        next_frontier.append(child)
+            frontier = next_frontier
+            level += 1
+
+        if len(depth) < len(tasks):
+            raise CircularDependencyError(_find_cycles(tasks, depth, dependents))
+
+        # Bucket tasks by depth, preserving input order within each group
+        buckets: List[List[Task]] = [[] for _ in range(level)]
+        for task in tasks:
+            buckets[depth[task.id]].append(task)
+
+        groups = [
+            ParallelGroup(
                 group_id=group_id,
                 tasks=ready,
-                dependencies=set().union(*[set(t.depends_on) for t in ready]),
+                dependencies={dep for t in ready for dep in t.depends_on},
             )
-            groups.append(group)
+            for group_id, ready in enumerate(buckets)
+        ]
 
-            # Mark as completed for dependency resolution
-            completed.update(task.id for task in ready)
-            group_id += 1
+        # Calculate time estimates from per-task costs
+        order = [task for group in groups for task in group.tasks]
+        costs = estimate_costs(order, self.history)
 
-        # Calculate time estimates
-        # Assume each task takes 1 second (placeholder)
-        task_time = 1.0
+        sequential_time = sum(costs.values())
+        path_time, path = critical_path(order, costs)
 
-        sequential_time = len(tasks) * task_time
+        workers = self.concurrency
+        keys = None
+        if self.ordering == "critical_path":
+            keys = priority_keys(order, downstream_costs(order, costs, dependents))
 
-        # Parallel time = sum of slowest task in each group
-        parallel_time = sum(
-            max(1, len(group.tasks) // self.max_workers) * task_time for group in groups
-        )
+        if self.scheduling == "streaming":
+            parallel_time = streaming_makespan(
+                order, costs, dependency_counts, dependents, workers, keys
+            )
+        else:
+            parallel_time = waves_makespan(groups, costs, workers, keys)
 
         speedup = sequential_time / parallel_time if parallel_time > 0 else 1.0
 
@@ -159,88 +1099,506 @@ class ParallelExecutor:
             sequential_time_estimate=sequential_time,
             parallel_time_estimate=parallel_time,
             speedup=speedup,
+            critical_path=path,
+            critical_path_time=path_time,
+            workers=workers,
         )
 
-        print(plan)
-        print("=" * 60)
+        if key is not None and self.plan_cache is not None:
+            self.plan_cache.put(key, PlanTemplate.from_plan(plan))
+
+        return self._announce(plan)
 
+    def _announce(self, plan: ExecutionPlan) -> ExecutionPlan:
+        if self.events.listening:
+            self.events.emit(PlanCreated(plan))
         return plan
 
-    def execute(self, plan: ExecutionPlan) -> Dict[str, Any]:
+    def execute(
+        self, plan: ExecutionPlan, resume_from: Optional[ExecutionJournal] = None
+    ) -> Dict[str, Any]:
         """
         Execute plan with parallel groups
 
-        Returns dict of task_id -> result
-        """
-
-        print(f"\n🚀 Executing {plan.total_tasks} tasks in {len(plan.groups)} groups")
-        print("=" * 60)
+        Reuses the executor's worker pool across calls. In ``waves`` mode
+        groups run one at a time; in ``streaming`` mode tasks are
+        launched as soon as their dependencies are done.
 
-        results = {}
-        start_time = time.time()
+        With ``resume_from``, tasks the journal holds a result for are
+        completed from it without running, and every task completing
+        now is journaled (see journal.py).
 
-        for group in plan.groups:
-            print(f"\n📦 {group}")
-            group_start = time.time()
-
-            # Execute group in parallel
-            group_results = self._execute_group(group)
-            results.update(group_results)
-
-            group_time = time.time() - group_start
-            print(f"   Completed in {group_time:.2f}s")
-
-        total_time = time.time() - start_time
-        actual_speedup = plan.sequential_time_estimate / total_time
+        Returns dict of task_id -> result
+        """
 
-        print("\n" + "=" * 60)
-        print(f"✅ All tasks completed in {total_time:.2f}s")
-        print(f"   Estimated: {plan.parallel_time_estimate:.2f}s")
-        print(f"   Actual speedup: {actual_speedup:.1f}x")
-        print("=" * 60)
+        return {
+            outcome.task_id: outcome.result
+            for outcome in self.execute_iter(plan, resume_from=resume_from)
+        }
+
+    def execute_iter(
+        self,
+        plan: ExecutionPlan,
+        drop_results: bool = False,
+        resume_from: Optional[ExecutionJournal] = None,
+    ) -> Iterator[TaskOutcome]:
+        """
+        Execute plan, yielding each task's outcome as soon as it is final
 
-        return results
+        Outcomes arrive in completion order as
+        ``(task_id, result, status, duration)`` tuples. With
+        ``drop_results`` the executor forgets each result (``Task.result``
+        is reset to None) once every task depending on it has finished,
+        so only results still needed downstream are kept alive.
+        ``resume_from`` is a checkpoint journal as for execute().
 
-    def _execute_group(self, group: ParallelGroup) -> Dict[str, Any]:
-        """Execute single parallel group"""
+        Abandoning the iterator early cancels the rest of the plan.
 
-        results = {}
+        Example:
+            for task_id, result, status, _ in executor.execute_iter(plan):
+                if status == TaskStatus.COMPLETED:
+                    index.add(task_id, result)
+        """
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks in group
-            future_to_task = {
-                executor.submit(task.execute): task for task in group.tasks
-            }
+        if self._closed:
+            raise RuntimeError("ParallelExecutor has been shut down")
+
+        tasks = [task for group in plan.groups for task in group.tasks]
+        self._check_backends(tasks)
+        self._check_pools(tasks)
+
+        events = self.events
+        if events.listening:
+            events.emit(ExecutionStarted(plan, self.scheduling))
+
+        # Unfinished dependents per task id (only tracked when dropping)
+        waiting: Dict[str, int] = {}
+        by_id: Dict[str, Task] = {}
+        if drop_results:
+            _check_task_ids(tasks)
+            by_id = {task.id: task for task in tasks}
+            for task in tasks:
+                for dep in set(task.depends_on):
+                    waiting[dep] = waiting.get(dep, 0) + 1
+
+        restored: Dict[str, Any] = {}
+        if resume_from is not None:
+            restored = resume_from.restore(tasks)
+
+        profile = self.last_profile = ExecutionProfile(
+            self.concurrency, time.perf_counter()
+        )
+        finished = False
+
+        try:
+            for task, result in self._schedule(plan, profile, restored):
+                if (
+                    resume_from is not None
+                    and task.status == TaskStatus.COMPLETED
+                    and task.id not in restored
+                ):
+                    resume_from.record(task, result)
+
+                if events.listening:
+                    events.emit(TaskFinished(task))
+
+                yield TaskOutcome(task.id, result, task.status, task.duration)
+
+                if drop_results:
+                    del result  # Not pinned while waiting for the next task
+                    if not waiting.get(task.id):
+                        task.result = None
+                    for dep in set(task.depends_on):
+                        waiting[dep] -= 1
+                        if not waiting[dep]:
+                            by_id[dep].result = None
+
+            finished = True
+
+        finally:
+            if not finished:
+                self._cancel_token.cancel()
+
+            if self.history is not None:
+                self.history.save()
+            if self.result_cache is not None:
+                self.result_cache.save()
+            if resume_from is not None:
+                resume_from.compact()
+
+            profile.finish(time.perf_counter(), self.concurrency)
+
+        if events.listening:
+            events.emit(
+                ExecutionFinished(plan, profile.elapsed, self.concurrency, profile)
+            )
 
-            # Collect results as they complete
-            for future in as_completed(future_to_task):
-                task = future_to_task[future]
+    def _schedule(
+        self,
+        plan: ExecutionPlan,
+        profile: ExecutionProfile,
+        restored: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Tuple[Task, Any]]:
+        """
+        Core scheduling loop
+
+        Submits ready tasks to their backend and yields (task, result)
+        pairs in completion order. Skipped and cancelled tasks are
+        yielded with a None result; tasks being retried are yielded only
+        once their last attempt is done. Tasks in ``restored`` (id ->
+        result) complete with that result as soon as they are ready,
+        without running. Every attempt that ran is recorded in
+        ``profile``.
+        """
 
-                try:
-                    result = future.result()
+        streaming = self.scheduling == "streaming"
+        restored = restored or {}
+        tasks = [task for group in plan.groups for task in group.tasks]
+        policy = self.failure_policy
+        events = self.events
+
+        token = self._cancel_token = CancellationToken()
+        deadline = None
+        if self.deadline is not None:
+            deadline = time.monotonic() + self.deadline
+
+        remaining: Dict[str, int] = {}
+        dependents: Dict[str, List[Task]] = {}
+        waves = iter(plan.groups)
+        group: Optional[ParallelGroup] = None
+        group_start = 0.0
+
+        if streaming or self.ordering != "fifo":
+            _check_task_ids(tasks)
+            remaining, dependents = _index_dependencies(tasks)
+
+        # Ready heap of (ordering key, arrival sequence, task)
+        keys = self._ready_keys(tasks, dependents)
+        ready: List[Tuple[Any, int, Task]] = []
+        arrival = itertools.count()
+
+        incoming: Deque[Task] = deque()  # Dependencies done, not yet admitted
+        settled: Deque[Task] = deque()  # Settled without running, not reported
+        blocked: Set[str] = set()  # Failed, skipped or cancelled task ids
+        delayed: List[Tuple[float, int, Task]] = []  # Retries waiting on backoff
+
+        # Slots taken per concurrency pool, and ready tasks parked on the
+        # (first) full pool they need until one of its slots frees up
+        limits = self.pool_limits
+        in_use: Dict[str, int] = dict.fromkeys(limits, 0)
+        parked: Dict[str, List[Tuple[Any, int, Task]]] = {}
+        # Attempts given up on while running: a thread cannot be stopped,
+        # so their pool slots stay taken until they actually return
+        lingering: Dict[Future, Task] = {}
+
+        def enqueue(task: Task):
+            key = keys[task.id] if keys else ()
+            heapq.heappush(ready, (key, next(arrival), task))
+
+        def full_pool(task: Task) -> Optional[str]:
+            for name in task.pools:
+                if in_use[name] >= limits[name]:
+                    return name
+            return None
+
+        def free_pools(task: Task):
+            for name in task.pools:
+                in_use[name] -= 1
+                waiting = parked.get(name)
+                if waiting:
+                    heapq.heappush(ready, heapq.heappop(waiting))
+
+        def abandon(future: Future, task: Task):
+            # Stop waiting for an attempt, keeping its slots while it runs
+            if future.cancel():
+                free_pools(task)
+            elif task.pools:
+                lingering[future] = task
+
+        def release(task: Task):
+            if streaming:
+                for child in dependents.get(task.id, ()):
+                    remaining[child.id] -= 1
+                    if remaining[child.id] == 0:
+                        incoming.append(child)
+
+        def admit():
+            # Iterative, so pruning a long chain cannot hit the recursion limit
+            while incoming:
+                task = incoming.popleft()
+                if policy == "skip-dependents" and any(
+                    dep in blocked for dep in task.depends_on
+                ):
+                    task.status = TaskStatus.SKIPPED
+                    blocked.add(task.id)
+                    settled.append(task)
+                    release(task)
+                elif task.id in restored:
                     task.status = TaskStatus.COMPLETED
-                    task.result = result
-                    results[task.id] = result
-
-                    print(f"   ✅ {task.description}")
-
-                except Exception as e:
-                    task.status = TaskStatus.FAILED
-                    task.error = e
-                    results[task.id] = None
-
-                    print(f"   ❌ {task.description}: {e}")
-
-        return results
+                    task.result = restored[task.id]
+                    task.attempts = 0
+                    settled.append(task)
+                    release(task)
+                else:
+                    task.attempts = 0
+                    enqueue(task)
+
+        if streaming:
+            incoming.extend(task for task in tasks if remaining[task.id] == 0)
+
+        in_flight: Dict[Future, Task] = {}
+        timers: Dict[Future, float] = {}  # Attempt time limits (monotonic)
+        controller = self.controller
+        submitted: Dict[Future, float] = {}  # Submission times (perf_counter)
+        finished: Set[str] = set()
+
+        while True:
+            now = time.monotonic()
+            while delayed and delayed[0][0] <= now:
+                enqueue(heapq.heappop(delayed)[2])
+
+            for future in [f for f in lingering if f.done()]:
+                free_pools(lingering.pop(future))
+
+            admit()
+
+            while settled:
+                task = settled.popleft()
+                finished.add(task.id)
+                completed = task.status == TaskStatus.COMPLETED
+                yield task, task.result if completed else None
+
+            outcomes: List[Tuple[Task, Any]] = []
+
+            if deadline is not None and now >= deadline and not token.cancelled:
+                if events.listening and self.deadline is not None:
+                    events.emit(DeadlineExceeded(self.deadline))
+                end = time.perf_counter()
+                for future, task in in_flight.items():
+                    abandon(future, task)
+                    self._record_timeout(
+                        task, TaskTimeoutError("Plan deadline exceeded")
+                    )
+                    profile.record(task, submitted.pop(future), end)
+                    outcomes.append((task, None))
+                in_flight.clear()
+                timers.clear()
+                token.cancel()
+
+            if token.cancelled:
+                # Drop queued work; running tasks are waited for below
+                for future in [f for f in in_flight if f.cancel()]:
+                    task = in_flight.pop(future)
+                    timers.pop(future, None)
+                    submitted.pop(future, None)
+                    free_pools(task)
+                    task.status = TaskStatus.CANCELLED
+                    blocked.add(task.id)
+                    finished.add(task.id)
+                    yield task, None
+
+            else:
+                pending = ready or in_flight or delayed or any(parked.values())
+                if not streaming and not pending:
+                    # Barrier reached: release the next group
+                    if group is not None and events.listening:
+                        events.emit(GroupFinished(group, time.time() - group_start))
+                    group = next(waves, None)
+                    if group is None:
+                        break
+                    if events.listening:
+                        events.emit(GroupStarted(group))
+                    group_start = time.time()
+                    incoming.extend(group.tasks)
+                    continue
+
+                while ready and len(in_flight) < self.concurrency:
+                    entry = heapq.heappop(ready)
+                    task = entry[2]
+                    if task.pools:
+                        pool = full_pool(task)
+                        if pool is not None:
+                            heapq.heappush(parked.setdefault(pool, []), entry)
+                            continue
+                        for name in task.pools:
+                            in_use[name] += 1
+                    task.status = TaskStatus.RUNNING
+                    task.started = None  # Unknown for process/distributed runs
+                    submit_time = time.perf_counter()
+                    future = self._submit(task, token)
+                    in_flight[future] = task
+                    submitted[future] = submit_time
+                    if events.listening:
+                        events.emit(TaskStarted(task))
+                    if task.timeout is not None:
+                        timers[future] = time.monotonic() + task.timeout
+
+            # Parked tasks may only be waiting for abandoned attempts to end
+            slots_held = lingering and any(parked.values()) and not token.cancelled
+
+            if in_flight or slots_held:
+                # Wake for the next attempt time limit, retry or deadline
+                wake_times = list(timers.values())
+                if delayed:
+                    wake_times.append(delayed[0][0])
+                if deadline is not None:
+                    wake_times.append(deadline)
+
+                timeout = None
+                if wake_times:
+                    timeout = max(min(wake_times) - time.monotonic(), 0)
+
+                done, _ = wait(
+                    [*in_flight, *lingering],
+                    timeout=timeout,
+                    return_when=FIRST_COMPLETED,
+                )
+
+                end = time.perf_counter()
+                for future in done:
+                    if future in lingering:
+                        free_pools(lingering.pop(future))
+                        continue
+                    task = in_flight.pop(future)
+                    timers.pop(future, None)
+                    free_pools(task)
+                    outcomes.append((task, self._collect(task, future)))
+                    submit_time = submitted.pop(future)
+                    profile.record(task, submit_time, end)
+                    if controller is not None and not task.cached:
+                        queued = None
+                        if task.started is not None:
+                            queued = task.started - submit_time
+                        controller.record(
+                            end - submit_time,
+                            task.duration,
+                            backlog=bool(ready),
+                            queued=queued,
+                        )
+
+                # Give up on attempts that ran past their time limit
+                now = time.monotonic()
+                for future, limit in list(timers.items()):
+                    if limit <= now:
+                        task = in_flight.pop(future)
+                        del timers[future]
+                        abandon(future, task)
+                        self._record_timeout(
+                            task, TaskTimeoutError(f"Timed out after {task.timeout}s")
+                        )
+                        end = time.perf_counter()
+                        profile.record(task, submitted.pop(future), end)
+                        outcomes.append((task, None))
+
+            elif delayed and not token.cancelled:
+                # Only backoffs pending: sleep until the next retry is due
+                wake_at = delayed[0][0]
+                if deadline is not None:
+                    wake_at = min(wake_at, deadline)
+                token.wait(max(wake_at - time.monotonic(), 0))
+                continue
+
+            elif not outcomes:
+                break
+
+            for task, result in outcomes:
+                if self._should_retry(task, token):
+                    delay = self._retry_delay(task.attempts)
+                    if events.listening:
+                        events.emit(TaskRetrying(task, delay))
+                    heapq.heappush(
+                        delayed, (time.monotonic() + delay, next(arrival), task)
+                    )
+                    continue
+
+                finished.add(task.id)
+
+                yield task, result
+
+                if task.status != TaskStatus.COMPLETED:
+                    blocked.add(task.id)
+                    if policy == "fail-fast" and task.status in FAILED_STATUSES:
+                        token.cancel()
+
+                release(task)
+
+        if token.cancelled:
+            for task in tasks:
+                if task.id not in finished:
+                    task.status = TaskStatus.CANCELLED
+                    finished.add(task.id)
+                    yield task, None
+
+        if len(finished) < len(tasks):
+            stuck = [task.id for task in tasks if task.id not in finished]
+            raise ValueError(f"Unsatisfiable dependencies for tasks: {stuck}")
+
+    def _ready_keys(
+        self, tasks: List[Task], dependents: Dict[str, List[Task]]
+    ) -> Optional[Dict[str, Tuple[float, float]]]:
+        """Ordering key per task id (None for FIFO ordering)"""
+
+        if self.ordering == "fifo":
+            return None
+
+        costs = estimate_costs(tasks, self.history)
+        return priority_keys(tasks, downstream_costs(tasks, costs, dependents))
+
+    def _collect(self, task: Task, future: Future) -> Any:
+        """Record the outcome of a finished task and return its result"""
+
+        return self._record_outcome(task, future.result)
+
+    def _record_outcome(self, task: Task, outcome: Callable[[], Any]) -> Any:
+        """Record a task's result (or the error ``outcome`` raises)"""
+
+        try:
+            result = outcome()
+            task.status = TaskStatus.COMPLETED
+            task.result = result
+
+            if (
+                self.history is not None
+                and task.duration is not None
+                and not task.cached
+            ):
+                self.history.record(task_key(task), task.duration)
+
+        except TaskTimeoutError as e:
+            self._record_timeout(task, e)
+            result = None
+
+        except TaskCancelledError as e:
+            task.status = TaskStatus.CANCELLED
+            task.error = e
+            result = None
+
+        except Exception as e:
+            task.status = TaskStatus.FAILED
+            task.error = e
+            result = None
+
+        return result
+
+    def _record_timeout(self, task: Task, error: TaskTimeoutError):
+        """Mark a task's current attempt as timed out"""
+
+        task.status = TaskStatus.TIMED_OUT
+        task.error = error
 
 
 # Convenience functions for common patterns
 
 
-def parallel_file_operations(files: List[str], operation: Callable) -> List[Any]:
+def parallel_file_operations(
+    files: Iterable[str], operation: Callable, chunk_size: int = 1
+) -> List[Any]:
     """
     Execute operation on multiple files in parallel
 
+    Results are returned in input order; a file whose operation raises
+    gets None. See iter_file_operations() to stream results instead.
+
     Example:
         results = parallel_file_operations(
             ["file1.py", "file2.py", "file3.py"],
@@ -248,22 +1606,44 @@ def parallel_file_operations(files: List[str], operation: Callable) -> List[Any]
         )
     """
 
-    executor = ParallelExecutor()
+    return list(iter_file_operations(files, operation, chunk_size))
 
-    tasks = [
-        Task(
-            id=f"op_{i}",
-            description=f"Process {file}",
-            execute=lambda f=file: operation(f),
-            depends_on=[],
+
+def iter_file_operations(
+    files: Iterable[str],
+    operation: Callable,
+    chunk_size: int = 1,
+    ordered: bool = True,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[Any]:
+    """
+    Stream operation results over any iterable of paths
+
+    Memory stays bounded by the number of chunks in flight, so this
+    suits repository-scale inputs (e.g. a generator from Path.rglob).
+    A file whose operation raises yields None.
+
+    Example:
+        for tree in iter_file_operations(repo.rglob("*.py"), parse, 32):
+            index(tree)
+    """
+
+    with ParallelExecutor(shared_pool=True) as executor:
+        yield from executor.map(
+            functools.partial(_none_on_error, operation),
+            files,
+            chunk_size=chunk_size,
+            ordered=ordered,
+            max_in_flight=max_in_flight,
         )
-        for i, file in enumerate(files)
-    ]
 
-    plan = executor.plan(tasks)
-    results = executor.execute(plan)
 
-    return [results[task.id] for task in tasks]
+def _none_on_error(operation: Callable, item: Any) -> Any:
+    """Call operation(item), mapping any exception to None"""
+    try:
+        return operation(item)
+    except Exception:
+        return None
 
 
 def should_parallelize(items: List[Any], threshold: int = 3) -> bool:
@@ -283,7 +1663,7 @@ def example_parallel_read():
 
     files = ["file1.py", "file2.py", "file3.py", "file4.py", "file5.py"]
 
-    executor = ParallelExecutor()
+    executor = ParallelExecutor(events=EventBus(ConsoleRenderer()))
 
     tasks = [
         Task(
@@ -304,7 +1684,7 @@ def example_parallel_read():
 def example_dependent_tasks():
     """Example: Tasks with dependencies"""
 
-    executor = ParallelExecutor()
+    executor = ParallelExecutor(events=EventBus(ConsoleRenderer()))
 
     tasks = [
         # Wave 1: Independent reads (parallel)
@@ -0,0 +1,206 @@
+"""
+Plan Cache - Reuse Plans for Structurally Identical Task Graphs
+
+Planning a large graph (topological grouping, cost estimates, makespan
+simulation) is repeated work when the same graph is planned again and
+again, as in CI. PlanCache keeps the outcome of planning keyed by a
+structural hash of the graph, so later plan() calls only rebind the
+cached groups to the new Task objects.
+
+The key covers task ids in order, their dependency edges (after
+resource inference), costs and priorities, and the executor settings
+that shape the estimates (scheduling, ordering, configured worker count
+or "auto", whether history is used). Duration estimates, and in "auto"
+mode the worker count, are those of the plan as first built.
+
+Usage:
+    cache = PlanCache(maxsize=64, path=Path(".cache/plans"))
+    executor = ParallelExecutor(plan_cache=cache)
+    executor.plan(tasks)  # miss: planned and stored
+    executor.plan(tasks)  # hit: rebuilt from the cache
+    cache.hits, cache.misses
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Optional
+
+if TYPE_CHECKING:
+    from .parallel import ExecutionPlan, Task
+
+# Share of disk_maxsize kept when the on-disk cache is pruned
+PRUNE_TO = 0.75
+
+
+@dataclass
+class PlanTemplate:
+    """Task-independent part of an ExecutionPlan (what gets cached)"""
+
+    groups: List[List[str]]  # Task ids per parallel group
+    sequential_time_estimate: float
+    parallel_time_estimate: float
+    speedup: float
+    critical_path: List[str]
+    critical_path_time: float
+    workers: int
+
+    @classmethod
+    def from_plan(cls, plan: "ExecutionPlan") -> "PlanTemplate":
+        return cls(
+            groups=[[task.id for task in group.tasks] for group in plan.groups],
+            sequential_time_estimate=plan.sequential_time_estimate,
+            parallel_time_estimate=plan.parallel_time_estimate,
+            speedup=plan.speedup,
+            critical_path=list(plan.critical_path),
+            critical_path_time=plan.critical_path_time,
+            workers=plan.workers,
+        )
+
+
+def plan_key(tasks: List["Task"], *settings: Any) -> str:
+    """Structural hash of a task graph and the settings planning used"""
+
+    digest = hashlib.blake2b(repr(settings).encode(), digest_size=16)
+    graph = "\x1e".join(
+        "\x1f".join((task.id, repr(task.cost), repr(task.priority), *task.depends_on))
+        for task in tasks
+    )
+    digest.update(graph.encode())
+    return digest.hexdigest()
+
+
+class PlanCache:
+    """
+    LRU cache of plan templates, optionally backed by a directory
+
+    Thread-safe; one cache can be shared by several executors. With a
+    ``path``, templates are also written there as <key>.json and read
+    back on an in-memory miss, so they survive across processes. The
+    directory keeps at most ``disk_maxsize`` files: once it grows past
+    that, the least recently used are dropped down to PRUNE_TO of it, so
+    the directory is only scanned every few hundred puts.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        path: Optional[Path] = None,
+        disk_maxsize: int = 1024,
+    ):
+        """
+        Args:
+            maxsize: Templates kept in memory
+            path: Directory for the on-disk cache (None = memory only)
+            disk_maxsize: Templates kept on disk
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+
+        self.maxsize = maxsize
+        self.path = path
+        self.disk_maxsize = disk_maxsize
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[str, PlanTemplate]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_count: Optional[int] = None  # Files on disk (counted lazily)
+
+    @classmethod
+    def for_repo(cls, repo_path: Path, maxsize: int = 128) -> "PlanCache":
+        """Cache stored in the repository's docs/memory directory"""
+        return cls(maxsize, repo_path / "docs" / "memory" / "plan_cache")
+
+    def get(self, key: str) -> Optional[PlanTemplate]:
+        """Cached template for ``key`` (counts a hit or a miss)"""
+        with self._lock:
+            template = self._entries.get(key)
+            if template is not None:
+                self._entries.move_to_end(key)
+            else:
+                template = self._load(key)
+                if template is not None:
+                    self._remember(key, template)
+
+            if template is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return template
+
+    def put(self, key: str, template: PlanTemplate):
+        """Store a template in memory and, if configured, on disk"""
+        with self._lock:
+            self._remember(key, template)
+            self._store(key, template)
+
+    def clear(self):
+        """Drop every cached template (memory and disk) and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+            if self.path is not None and self.path.is_dir():
+                for file in self.path.glob("*.json"):
+                    file.unlink(missing_ok=True)
+            self._disk_count = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, template: PlanTemplate):
+        self._entries[key] = template
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[PlanTemplate]:
+        if self.path is None:
+            return None
+        file = self.path / f"{key}.json"
+        try:
+            with open(file) as f:
+                template = PlanTemplate(**json.load(f))
+            os.utime(file)  # Recently used
+        except (OSError, ValueError, TypeError):
+            return None
+        return template
+
+    def _store(self, key: str, template: PlanTemplate):
+        if self.path is None:
+            return
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path / f"{key}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(asdict(template), f)
+            tmp_path.replace(self.path / f"{key}.json")
+
+            if self._disk_count is None:
+                self._disk_count = sum(1 for _ in self.path.glob("*.json"))
+            else:
+                self._disk_count += 1  # Overcounts overwrites until a prune
+            if self._disk_count > self.disk_maxsize:
+                self._prune()
+        except OSError:
+            pass  # The on-disk cache is an optimization only
+
+    def _prune(self):
+        """Drop least recently used files down to PRUNE_TO of disk_maxsize"""
+        if self.path is None:
+            return
+        stamped = []
+        for file in self.path.glob("*.json"):
+            try:
+                stamped.append((file.stat().st_mtime, file))
+            except OSError:
+                continue
+        keep = int(self.disk_maxsize * PRUNE_TO)
+        stamped.sort(key=lambda entry: entry[0])
+        for _, file in stamped[: max(0, len(stamped) - keep)]:
+            file.unlink(missing_ok=True)
+        self._disk_count = min(len(stamped), keep)
@@ -0,0 +1,306 @@
+"""
+Execution Profiling - Where the Time of a Run Went
+
+Every execute() / execute_iter() / execute_async() call collects an
+ExecutionProfile: one span per task attempt with its queue wait, run
+time, worker and timestamps, plus pool-level utilization and the gaps
+where nothing was running at all.
+
+Profiles export as JSON and in Chrome trace-event format, which opens
+in chrome://tracing or https://ui.perfetto.dev: each worker is a track,
+queue waits show as async slices and counter tracks plot how many tasks
+were running and queued, so a collapse in parallelism is visible at a
+glance.
+
+Usage:
+    executor.execute(plan)
+    profile = executor.last_profile
+    print(f"{profile.utilization:.0%} of {profile.workers} workers busy")
+    profile.save_chrome_trace(Path("trace.json"))
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .parallel import Task, TaskStatus
+
+
+@dataclass
+class TaskSpan:
+    """One task attempt; times are seconds since the run started"""
+
+    task_id: str
+    description: str
+    attempt: int
+    status: str
+    worker: str  # Thread name, process id or distributed worker name
+    submitted: float
+    started: float
+    finished: float
+
+    @property
+    def queue_wait(self) -> float:
+        """Seconds between submission and the callable starting"""
+        return self.started - self.submitted
+
+    @property
+    def run_time(self) -> float:
+        """Seconds the callable ran (until given up on, for timeouts)"""
+        return self.finished - self.started
+
+
+@dataclass
+class ExecutionProfile:
+    """
+    Timing profile of one execution
+
+    ``workers`` is the concurrency limit at the end of the run;
+    utilization is busy time over elapsed time times that limit.
+    """
+
+    workers: int
+    origin: float  # perf_counter() at the start of the run
+    elapsed: float = 0.0
+    spans: List[TaskSpan] = field(default_factory=list)
+
+    def record(
+        self,
+        task: "Task",
+        submitted: float,
+        finished: float,
+        started: Optional[float] = None,
+        status: Optional["TaskStatus"] = None,
+    ):
+        """
+        Add a span for the task's last attempt (perf_counter() times)
+
+        Without ``started``, the start is derived from ``task.duration``
+        as measured where the callable ran (the whole attempt counts as
+        running if that is unknown). ``status`` defaults to the task's.
+        """
+        if started is None:
+            duration = task.duration
+            started = submitted if duration is None else finished - duration
+        started = min(max(started, submitted), finished)
+        origin = self.origin
+
+        self.spans.append(
+            TaskSpan(
+                task.id,
+                task.description,
+                task.attempts,
+                (status or task.status).value,
+                task.worker or "unknown",
+                submitted - origin,
+                started - origin,
+                finished - origin,
+            )
+        )
+
+    def finish(self, now: float, workers: int):
+        """Close the profile at perf_counter() time ``now``"""
+        self.elapsed = now - self.origin
+        self.workers = workers
+
+    @property
+    def busy_time(self) -> float:
+        """Total seconds spent running task callables"""
+        return sum(span.run_time for span in self.spans)
+
+    @property
+    def queue_time(self) -> float:
+        """Total seconds tasks waited between submission and start"""
+        return sum(span.queue_wait for span in self.spans)
+
+    @property
+    def parallelism(self) -> float:
+        """Average number of tasks running (measured speedup over serial)"""
+        return self.busy_time / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of worker capacity spent running tasks"""
+        return self.parallelism / self.workers if self.workers else 0.0
+
+    def timeline(self) -> List[Tuple[float, int, int]]:
+        """
+        Step function of pool occupancy
+
+        Returns:
+            (time, tasks running, tasks queued) at every change
+        """
+        changes: Dict[float, List[int]] = {}
+        for span in self.spans:
+            for at, running, queued in (
+                (span.submitted, 0, 1),
+                (span.started, 1, -1),
+                (span.finished, -1, 0),
+            ):
+                delta = changes.setdefault(at, [0, 0])
+                delta[0] += running
+                delta[1] += queued
+
+        steps = []
+        running = queued = 0
+        for at in sorted(changes):
+            running += changes[at][0]
+            queued += changes[at][1]
+            steps.append((at, running, queued))
+        return steps
+
+    def idle_gaps(self, min_gap: float = 0.0) -> List[Tuple[float, float]]:
+        """Intervals (start, end) during the run when no task was running"""
+        gaps = []
+        idle_since: Optional[float] = 0.0
+        for at, running, _ in self.timeline():
+            if running and idle_since is not None:
+                if at - idle_since > min_gap:
+                    gaps.append((idle_since, at))
+                idle_since = None
+            elif not running and idle_since is None:
+                idle_since = at
+        if idle_since is not None and self.elapsed - idle_since > min_gap:
+            gaps.append((idle_since, self.elapsed))
+        return gaps
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary and spans as plain data"""
+        return {
+            "elapsed": self.elapsed,
+            "workers": self.workers,
+            "busy_time": self.busy_time,
+            "queue_time": self.queue_time,
+            "parallelism": self.parallelism,
+            "utilization": self.utilization,
+            "idle_gaps": [list(gap) for gap in self.idle_gaps()],
+            "tasks": [
+                {
+                    **asdict(span),
+                    "queue_wait": span.queue_wait,
+                    "run_time": span.run_time,
+                }
+                for span in self.spans
+            ],
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Profile in Chrome trace-event format
+
+        Spans of one worker that overlap (e.g. coroutines on one event
+        loop) are spread over numbered lanes of that worker.
+        """
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": "SuperClaude execution"},
+            }
+        ]
+
+        lanes: Dict[str, List[Tuple[int, float]]] = {}  # worker -> (tid, free at)
+        tids = 0
+
+        for index, span in enumerate(sorted(self.spans, key=lambda s: s.started)):
+            worker_lanes = lanes.setdefault(span.worker, [])
+            for slot, (tid, free_at) in enumerate(worker_lanes):
+                if free_at <= span.started:
+                    worker_lanes[slot] = (tid, span.finished)
+                    break
+            else:
+                tids += 1
+                tid = tids
+                name = span.worker
+                if worker_lanes:
+                    name = f"{span.worker} #{len(worker_lanes) + 1}"
+                worker_lanes.append((tid, span.finished))
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": pid,
+                        "tid": tid,
+                        "args": {"name": name},
+                    }
+                )
+
+            args = {
+                "task_id": span.task_id,
+                "attempt": span.attempt,
+                "status": span.status,
+                "queue_wait_ms": span.queue_wait * 1e3,
+            }
+            events.append(
+                {
+                    "name": span.description,
+                    "cat": span.status,
+                    "ph": "X",
+                    "ts": span.started * 1e6,
+                    "dur": span.run_time * 1e6,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": args,
+                }
+            )
+            if span.queue_wait > 0:
+                for phase, at in (("b", span.submitted), ("e", span.started)):
+                    events.append(
+                        {
+                            "name": f"queued: {span.description}",
+                            "cat": "queue",
+                            "ph": phase,
+                            "id": index,
+                            "ts": at * 1e6,
+                            "pid": pid,
+                            "tid": tid,
+                        }
+                    )
+
+        for at, running, queued in self.timeline():
+            events.append(
+                {
+                    "name": "tasks",
+                    "ph": "C",
+                    "ts": at * 1e6,
+                    "pid": pid,
+                    "args": {"running": running, "queued": queued},
+                }
+            )
+
+        summary = self.to_dict()
+        del summary["tasks"]
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": summary,
+        }
+
+    def save_json(self, path: Path):
+        """Write to_dict() to path"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2))
+
+    def save_chrome_trace(self, path: Path):
+        """Write to_chrome_trace() to path"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace()))
+
+    def __repr__(self) -> str:
+        gaps = self.idle_gaps()
+        longest = max((end - start for start, end in gaps), default=0.0)
+        return (
+            f"Execution Profile:\n"
+            f"  Tasks run: {len(self.spans)}\n"
+            f"  Elapsed: {self.elapsed:.2f}s\n"
+            f"  Busy: {self.busy_time:.2f}s on {self.workers} workers "
+            f"({self.utilization:.0%} utilization)\n"
+            f"  Parallelism: {self.parallelism:.1f}x\n"
+            f"  Queue wait: {self.queue_time:.2f}s\n"
+            f"  Idle gaps: {len(gaps)} (longest {longest:.2f}s)"
+        )
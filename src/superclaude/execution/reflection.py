@@ -15,6 +15,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .events import EventBus, Notice, ReflectionScored
+from .reflexion_store import DATABASE_NAME, LEGACY_JSON_NAME, ReflexionStore
+
 
 @dataclass
 class ReflectionResult:
@@ -72,8 +75,9 @@ class ReflectionEngine:
     5. BLOCK if <70%, PROCEED if ≥70%
     """
 
-    def __init__(self, repo_path: Path):
+    def __init__(self, repo_path: Path, events: Optional[EventBus] = None):
         self.repo_path = repo_path
+        self.events = events if events is not None else EventBus()
         self.memory_path = repo_path / "docs" / "memory"
         self.memory_path.mkdir(parents=True, exist_ok=True)
 
@@ -96,20 +100,14 @@ class ReflectionEngine:
         Returns confidence score with decision to proceed or block.
         """
 
-        print("🧠 Reflection Engine: 3-Stage Analysis")
-        print("=" * 60)
-
         # Stage 1: Requirement Clarity
         clarity = self._reflect_clarity(task, context)
-        print(f"1️⃣ {clarity}")
 
         # Stage 2: Past Mistakes
         mistakes = self._reflect_mistakes(task, context)
-        print(f"2️⃣ {mistakes}")
 
         # Stage 3: Context Readiness
         context_ready = self._reflect_context(task, context)
-        print(f"3️⃣ {context_ready}")
 
         # Calculate overall confidence
         confidence = (
@@ -147,9 +145,8 @@ class ReflectionEngine:
             recommendations=recommendations,
         )
 
-        print("=" * 60)
-        print(result)
-        print("=" * 60)
+        if self.events.listening:
+            self.events.emit(ReflectionScored(task, result))
 
         return result
 
@@ -232,31 +229,21 @@ class ReflectionEngine:
         concerns = []
         score = 1.0  # Start optimistic (no mistakes known)
 
-        # Load reflexion memory
-        reflexion_file = self.memory_path / "reflexion.json"
-
-        if not reflexion_file.exists():
+        # Load reflexion memory (without creating it)
+        if not any(
+            (self.memory_path / name).exists()
+            for name in (DATABASE_NAME, LEGACY_JSON_NAME)
+        ):
             evidence.append("No past mistakes recorded")
             return ReflectionResult(
                 stage="Past Mistakes", score=score, evidence=evidence, concerns=concerns
             )
 
         try:
-            with open(reflexion_file) as f:
-                reflexion_data = json.load(f)
-
-            past_mistakes = reflexion_data.get("mistakes", [])
-
-            # Search for similar mistakes
-            similar_mistakes = []
-            task_keywords = set(task.lower().split())
-
-            for mistake in past_mistakes:
-                mistake_keywords = set(mistake.get("task", "").lower().split())
-                overlap = task_keywords & mistake_keywords
-
-                if len(overlap) >= 2:  # At least 2 common words
-                    similar_mistakes.append(mistake)
+            # Search for similar mistakes (at least 2 common words)
+            with ReflexionStore.for_repo(self.repo_path) as store:
+                past_mistakes = len(store)
+                similar_mistakes = store.similar(task=task)
 
             if similar_mistakes:
                 score -= 0.3 * min(len(similar_mistakes), 3)  # Max -0.9
@@ -265,9 +252,7 @@ class ReflectionEngine:
                 for mistake in similar_mistakes[:3]:  # Show max 3
                     concerns.append(f"  ⚠️ {mistake.get('mistake', 'Unknown')}")
             else:
-                evidence.append(
-                    f"Checked {len(past_mistakes)} past mistakes - none similar"
-                )
+                evidence.append(f"Checked {past_mistakes} past mistakes - none similar")
 
         except Exception as e:
             concerns.append(f"Could not load reflexion memory: {e}")
@@ -368,7 +353,8 @@ class ReflectionEngine:
                 json.dump(log_data, f, indent=2)
 
         except Exception as e:
-            print(f"⚠️ Could not record reflection: {e}")
+            if self.events.listening:
+                self.events.emit(Notice(f"Could not record reflection: {e}"))
 
 
 # Singleton instance
@@ -0,0 +1,493 @@
+"""
+Reflexion Store - Indexed Storage for Reflexion Memory
+
+Reflexion memory used to be a single JSON file that was loaded, scanned
+and rewritten whole for every learned failure, so each write cost time
+proportional to the whole history and concurrent writers lost each
+other's updates. ReflexionStore keeps it in an SQLite database
+(stdlib sqlite3) instead:
+
+- mistakes are rows keyed by id: lookups and updates are O(log n)
+- recording a failure is one transaction (recurrence count, prevention
+  rule), so concurrent writers serialize instead of clobbering
+- WAL mode lets readers run while a write is in progress
+- every ``compact_every`` writes the WAL is checkpointed and the file
+  vacuumed
+- an inverted index (posting lists of mistake ids per word of the task
+  and of the error message, with document frequencies) answers
+  similarity queries from the candidates sharing words with the query,
+  ranked by IDF, instead of comparing against every stored mistake
+
+The legacy JSON layout (``{"mistakes": [...], "prevention_rules":
+[...], ...}``) is still supported through import_json() / export_json();
+for_repo() imports an existing docs/memory/reflexion.json the first time
+the database is created.
+
+Usage:
+    store = ReflexionStore.for_repo(Path.cwd())
+    recurrence, rule_added = store.record(entry.to_dict(), rule)
+    store.get(entry.id)
+    store.similar(task="Deploy auth service", error="connection refused")
+    store.export_json(Path("reflexion.json"))
+"""
+
+import json
+import math
+import sqlite3
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+DATABASE_NAME = "reflexion.db"
+LEGACY_JSON_NAME = "reflexion.json"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mistakes (
+    id TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    task TEXT NOT NULL,
+    failure_type TEXT NOT NULL,
+    error_message TEXT NOT NULL,
+    root_cause TEXT NOT NULL,
+    fixed INTEGER NOT NULL,
+    fix_description TEXT,
+    recurrence_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS prevention_rules (rule TEXT PRIMARY KEY);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS postings (
+    field INTEGER NOT NULL,
+    term TEXT NOT NULL,
+    mistake_id TEXT NOT NULL,
+    PRIMARY KEY (field, term, mistake_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS terms (
+    field INTEGER NOT NULL,
+    term TEXT NOT NULL,
+    df INTEGER NOT NULL,
+    PRIMARY KEY (field, term)
+) WITHOUT ROWID;
+"""
+
+# Indexed fields of a mistake
+TASK_FIELD = 0
+ERROR_FIELD = 1
+
+# Bumped when the tokenization changes (the index is rebuilt on open)
+_INDEX_VERSION = "1"
+
+# Ids per "IN (...)" query
+_CHUNK = 500
+
+_COLUMNS = (
+    "id",
+    "timestamp",
+    "task",
+    "failure_type",
+    "error_message",
+    "root_cause",
+    "fixed",
+    "fix_description",
+    "recurrence_count",
+)
+
+
+def _to_row(entry: Dict[str, Any]) -> Tuple[Any, ...]:
+    """FailureEntry dict -> mistakes row"""
+    return (
+        entry["id"],
+        entry.get("timestamp") or datetime.now().isoformat(),
+        entry.get("task", ""),
+        entry.get("failure_type", "unknown"),
+        entry.get("error_message", ""),
+        json.dumps(entry.get("root_cause", {})),
+        int(bool(entry.get("fixed", False))),
+        entry.get("fix_description"),
+        int(entry.get("recurrence_count", 0)),
+    )
+
+
+def keywords(text: str) -> Set[str]:
+    """Words a text is indexed and matched by"""
+    return set(text.lower().split())
+
+
+def _chunks(items: List[Any]) -> Iterator[List[Any]]:
+    for start in range(0, len(items), _CHUNK):
+        yield items[start : start + _CHUNK]
+
+
+def _from_row(row: Tuple[Any, ...]) -> Dict[str, Any]:
+    """mistakes row -> FailureEntry dict"""
+    entry = dict(zip(_COLUMNS, row))
+    entry["root_cause"] = json.loads(entry["root_cause"])
+    entry["fixed"] = bool(entry["fixed"])
+    return entry
+
+
+class ReflexionStore:
+    """
+    SQLite-backed reflexion memory
+
+    Mistakes are handled as FailureEntry.to_dict() dicts. Safe to share
+    between threads; separate processes coordinate through SQLite's own
+    locking (writers wait up to ``timeout`` seconds for each other).
+    """
+
+    def __init__(self, path: Path, compact_every: int = 1000, timeout: float = 30.0):
+        self.path = path
+        self.compact_every = compact_every
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(
+            str(path), timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        with self._transaction() as db:
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    db.execute(statement)
+            db.execute(
+                "INSERT OR IGNORE INTO meta VALUES ('created', ?)",
+                (datetime.now().isoformat(),),
+            )
+            self._ensure_index(db)
+
+    @classmethod
+    def for_repo(cls, repo_path: Path, **kwargs) -> "ReflexionStore":
+        """
+        Store in the repository's docs/memory directory
+
+        A legacy reflexion.json next to it is imported when the database
+        is first created.
+        """
+        memory_path = repo_path / "docs" / "memory"
+        path = memory_path / DATABASE_NAME
+        created = not path.exists()
+
+        store = cls(path, **kwargs)
+        legacy = memory_path / LEGACY_JSON_NAME
+        if created and legacy.exists():
+            try:
+                store.import_json(legacy)
+            except (OSError, ValueError, KeyError, TypeError):
+                pass  # Unreadable legacy memory: start empty
+        return store
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "ReflexionStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # Reads
+
+    def get(self, failure_id: str) -> Optional[Dict[str, Any]]:
+        """Mistake with the given id, or None"""
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM mistakes WHERE id = ?",
+                (failure_id,),
+            ).fetchone()
+        return _from_row(row) if row else None
+
+    def mistakes(self) -> Iterator[Dict[str, Any]]:
+        """Every stored mistake, oldest first"""
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM mistakes ORDER BY rowid"
+            ).fetchall()
+        return (_from_row(row) for row in rows)
+
+    def prevention_rules(self) -> List[str]:
+        """Prevention rules in the order they were learned"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT rule FROM prevention_rules ORDER BY rowid"
+            ).fetchall()
+        return [rule for (rule,) in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._db.execute("SELECT COUNT(*) FROM mistakes").fetchone()
+        return int(count)
+
+    def similar(
+        self, task: str = "", error: str = "", min_overlap: int = 2
+    ) -> List[Dict[str, Any]]:
+        """
+        Mistakes sharing at least ``min_overlap`` words with ``task`` (in
+        their task) or with ``error`` (in their error message)
+
+        Only mistakes on the posting lists of the query's words are
+        looked at. Results are ranked by the summed inverse document
+        frequency of the shared words, so matches on rare words come
+        first; ties keep the order mistakes were recorded in.
+        """
+        queries = [(TASK_FIELD, keywords(task)), (ERROR_FIELD, keywords(error))]
+        overlaps: Dict[str, List[int]] = {}  # mistake id -> overlap per field
+        scores: DefaultDict[str, float] = defaultdict(float)
+
+        with self._lock:
+            (total,) = self._db.execute("SELECT COUNT(*) FROM mistakes").fetchone()
+            for field, terms in queries:
+                if not terms:
+                    continue
+                terms_list = sorted(terms)
+                marks = ", ".join("?" for _ in terms_list)
+                idf = {
+                    term: math.log(1 + total / df)
+                    for term, df in self._db.execute(
+                        f"SELECT term, df FROM terms WHERE field = ? "
+                        f"AND term IN ({marks})",
+                        (field, *terms_list),
+                    )
+                }
+                for term, mistake_id in self._db.execute(
+                    f"SELECT term, mistake_id FROM postings WHERE field = ? "
+                    f"AND term IN ({marks})",
+                    (field, *terms_list),
+                ):
+                    overlaps.setdefault(mistake_id, [0, 0])[field] += 1
+                    scores[mistake_id] += idf.get(term, 0.0)
+
+            matched = [
+                mistake_id
+                for mistake_id, counts in overlaps.items()
+                if max(counts) >= min_overlap
+            ]
+            rows: List[Tuple[Any, ...]] = []
+            for chunk in _chunks(matched):
+                marks = ", ".join("?" for _ in chunk)
+                rows.extend(
+                    self._db.execute(
+                        f"SELECT rowid, {', '.join(_COLUMNS)} FROM mistakes "
+                        f"WHERE id IN ({marks})",
+                        chunk,
+                    )
+                )
+
+        rows.sort(key=lambda row: (-scores[row[1]], row[0]))
+        return [_from_row(row[1:]) for row in rows]
+
+    # Writes
+
+    def record(
+        self, entry: Dict[str, Any], prevention_rule: Optional[str] = None
+    ) -> Tuple[int, bool]:
+        """
+        Store a failure, or count a recurrence of a known one
+
+        A known id gets its recurrence count incremented and timestamp
+        refreshed; a new one is inserted as given.
+
+        Returns:
+            (recurrence count, whether prevention_rule was new)
+        """
+        with self._transaction() as db:
+            updated = db.execute(
+                "UPDATE mistakes SET recurrence_count = recurrence_count + 1, "
+                "timestamp = ? WHERE id = ?",
+                (entry.get("timestamp") or datetime.now().isoformat(), entry["id"]),
+            ).rowcount
+
+            if updated:
+                (recurrence,) = db.execute(
+                    "SELECT recurrence_count FROM mistakes WHERE id = ?",
+                    (entry["id"],),
+                ).fetchone()
+            else:
+                db.execute(self._insert_sql("INSERT"), _to_row(entry))
+                self._index(db, [entry])
+                recurrence = int(entry.get("recurrence_count", 0))
+
+            rule_added = False
+            if prevention_rule is not None:
+                rule_added = bool(
+                    db.execute(
+                        "INSERT OR IGNORE INTO prevention_rules VALUES (?)",
+                        (prevention_rule,),
+                    ).rowcount
+                )
+
+            writes = self._bump_writes(db)
+
+        if self.compact_every and writes % self.compact_every == 0:
+            self.compact()
+
+        return recurrence, rule_added
+
+    def compact(self):
+        """Fold the write-ahead log into the database and reclaim free pages"""
+        with self._lock:
+            self._db.execute("VACUUM")
+            self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    # Legacy JSON format
+
+    def import_json(self, path: Path) -> int:
+        """
+        Merge a legacy reflexion.json into the store
+
+        Mistakes replace stored ones with the same id. Returns the number
+        of mistakes imported.
+        """
+        with open(path) as f:
+            data = json.load(f)
+
+        # Last entry wins for ids listed twice
+        by_id = {entry["id"]: entry for entry in data.get("mistakes", [])}
+        mistakes = list(by_id.values())
+        with self._transaction() as db:
+            self._unindex(db, [entry["id"] for entry in mistakes])
+            db.executemany(
+                self._insert_sql("INSERT OR REPLACE"),
+                (_to_row(entry) for entry in mistakes),
+            )
+            self._index(db, mistakes)
+            db.executemany(
+                "INSERT OR IGNORE INTO prevention_rules VALUES (?)",
+                ((rule,) for rule in data.get("prevention_rules", [])),
+            )
+            for key in ("version", "created"):
+                if key in data:
+                    db.execute(
+                        "INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, data[key])
+                    )
+            if data.get("patterns"):
+                db.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('patterns', ?)",
+                    (json.dumps(data["patterns"]),),
+                )
+        return len(mistakes)
+
+    def export_json(self, path: Path):
+        """Write the store in the legacy reflexion.json format (atomically)"""
+        with self._lock:
+            meta = dict(self._db.execute("SELECT key, value FROM meta").fetchall())
+        data = {
+            "version": meta.get("version", "1.0"),
+            "created": meta.get("created", datetime.now().isoformat()),
+            "mistakes": list(self.mistakes()),
+            "patterns": json.loads(meta.get("patterns", "[]")),
+            "prevention_rules": self.prevention_rules(),
+        }
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        tmp_path.replace(path)
+
+    # Internals
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction, taking the database write lock up front"""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    @staticmethod
+    def _index(db: sqlite3.Connection, entries: Iterable[Dict[str, Any]]):
+        """Add mistakes to the posting lists and document frequencies"""
+        postings = []
+        df: Counter = Counter()
+        for entry in entries:
+            for field, text in (
+                (TASK_FIELD, entry.get("task", "")),
+                (ERROR_FIELD, entry.get("error_message", "")),
+            ):
+                for term in keywords(text):
+                    postings.append((field, term, entry["id"]))
+                    df[field, term] += 1
+
+        postings.sort()  # Key order: appends instead of random B-tree inserts
+        db.executemany("INSERT INTO postings VALUES (?, ?, ?)", postings)
+        db.executemany(
+            "INSERT INTO terms VALUES (?, ?, ?) "
+            "ON CONFLICT(field, term) DO UPDATE SET df = df + excluded.df",
+            ((field, term, count) for (field, term), count in df.items()),
+        )
+
+    @staticmethod
+    def _unindex(db: sqlite3.Connection, mistake_ids: List[str]):
+        """Remove mistakes (if present) from the index"""
+        removed: List[Tuple[int, str, str]] = []
+        for chunk in _chunks(mistake_ids):
+            marks = ", ".join("?" for _ in chunk)
+            for mistake_id, task, error in db.execute(
+                f"SELECT id, task, error_message FROM mistakes WHERE id IN ({marks})",
+                chunk,
+            ):
+                for field, text in ((TASK_FIELD, task), (ERROR_FIELD, error)):
+                    removed.extend((field, term, mistake_id) for term in keywords(text))
+        if not removed:
+            return
+
+        db.executemany(
+            "DELETE FROM postings WHERE field = ? AND term = ? AND mistake_id = ?",
+            removed,
+        )
+        db.executemany(
+            "UPDATE terms SET df = df - 1 WHERE field = ? AND term = ?",
+            ((field, term) for field, term, _ in removed),
+        )
+        db.execute("DELETE FROM terms WHERE df <= 0")
+
+    def _ensure_index(self, db: sqlite3.Connection):
+        """(Re)build the index of a database written without it"""
+        row = db.execute("SELECT value FROM meta WHERE key = 'index'").fetchone()
+        if row is not None and row[0] == _INDEX_VERSION:
+            return
+
+        db.execute("DELETE FROM postings")
+        db.execute("DELETE FROM terms")
+        self._index(
+            db,
+            (
+                {"id": mistake_id, "task": task, "error_message": error}
+                for mistake_id, task, error in db.execute(
+                    "SELECT id, task, error_message FROM mistakes"
+                ).fetchall()
+            ),
+        )
+        db.execute("INSERT OR REPLACE INTO meta VALUES ('index', ?)", (_INDEX_VERSION,))
+
+    @staticmethod
+    def _insert_sql(verb: str) -> str:
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        return f"{verb} INTO mistakes ({', '.join(_COLUMNS)}) VALUES ({placeholders})"
+
+    @staticmethod
+    def _bump_writes(db: sqlite3.Connection) -> int:
+        db.execute(
+            "INSERT INTO meta VALUES ('writes', '1') "
+            "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+        )
+        (writes,) = db.execute("SELECT value FROM meta WHERE key = 'writes'").fetchone()
+        return int(writes)
@@ -0,0 +1,217 @@
+"""
+Resource Dependencies - Derive Task Ordering from Reads and Writes
+
+Tasks may declare the resources they read and write instead of listing
+``depends_on`` by hand. In list order (the order the caller would run
+them sequentially):
+
+- a reader waits for the last earlier writer of an overlapping resource
+- a writer waits for the last earlier writer and every earlier reader
+  of an overlapping resource since then
+- readers of the same resource never wait for each other
+
+Resources are strings (or os.PathLike) compared as "/"-separated paths:
+
+- "src/app.py" and "src/app.py" overlap (same file)
+- "src" and "src/app.py" overlap (a directory contains its files)
+- "src/*.py" and "src/app.py" overlap (glob components: *, ?, [...]);
+  "**" matches any number of components
+- "db" or "service:github" name any other shared resource
+
+Usage:
+    tasks = [
+        Task("read", "Read config", load, [], reads=["config.yaml"]),
+        Task("lint", "Lint", lint, [], reads=["src/**/*.py"]),
+        Task("fmt", "Format", fmt, [], writes=["src/**/*.py"]),
+    ]
+    executor.plan(tasks)  # fmt now depends on lint; read is independent
+"""
+
+import os
+import posixpath
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .result_cache import CacheKey
+
+if TYPE_CHECKING:
+    from .parallel import Task
+
+Resource = Union[str, "os.PathLike[str]"]
+Key = Tuple[str, ...]
+
+_PATTERN_CHARS = frozenset("*?[")
+
+
+@dataclass
+class Operation:
+    """
+    Callable with declared resource accesses, for intelligent_execute()
+
+    Example:
+        intelligent_execute(
+            "Update docs",
+            operations=[
+                Operation(build_index, reads=["docs/**/*.md"]),
+                Operation(rewrite_links, writes=["docs/**/*.md"]),
+            ],
+        )
+
+    ``cache`` makes the operation's result reusable across runs while
+    its input files are unchanged (see result_cache.py); ``pools`` names
+    the concurrency pools (intelligent_execute's ``pool_limits``) it uses.
+    """
+
+    func: Callable
+    reads: Sequence[Resource] = ()
+    writes: Sequence[Resource] = ()
+    description: Optional[str] = None
+    cache: Optional[CacheKey] = None
+    pools: Sequence[str] = ()
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+
+def resource_key(resource: Resource) -> Key:
+    """Normalize a resource to its path components ("." is the empty key)"""
+    path = posixpath.normpath(os.fspath(resource).replace("\\", "/"))
+    if path == ".":
+        return ()
+    return tuple(path.split("/"))
+
+
+def _is_pattern(key: Key) -> bool:
+    return any(not _PATTERN_CHARS.isdisjoint(part) for part in key)
+
+
+def _parts_match(a: str, b: str) -> bool:
+    """Whether two path components can name the same entry"""
+    if a == b:
+        return True
+    a_pattern = not _PATTERN_CHARS.isdisjoint(a)
+    b_pattern = not _PATTERN_CHARS.isdisjoint(b)
+    if a_pattern and b_pattern:
+        return True  # Two patterns: assume they may intersect
+    if a_pattern:
+        return fnmatchcase(b, a)
+    if b_pattern:
+        return fnmatchcase(a, b)
+    return False
+
+
+def keys_overlap(a: Key, b: Key) -> bool:
+    """
+    Whether two resource keys may refer to overlapping data
+
+    Keys overlap when they match component by component until one of
+    them ends (one contains the other). "**" in either is treated as
+    overlapping whatever follows.
+    """
+    for x, y in zip(a, b):
+        if x == "**" or y == "**":
+            return True
+        if not _parts_match(x, y):
+            return False
+    return True
+
+
+class _AccessIndex:
+    """Last writer and readers since then, per resource key"""
+
+    def __init__(self):
+        self.writer: Dict[Key, str] = {}
+        self.readers: Dict[Key, List[str]] = {}
+        self.keys: Set[Key] = set()
+        self.patterns: Set[Key] = set()
+        self.below: Dict[Key, Set[Key]] = {}  # Literal keys under each prefix
+
+    def overlapping(self, key: Key) -> List[Key]:
+        """Known keys overlapping ``key``"""
+        if _is_pattern(key):
+            return [known for known in self.keys if keys_overlap(key, known)]
+
+        keys = self.keys
+        found = [key[:i] for i in range(len(key) + 1) if key[:i] in keys]
+        found.extend(self.below.get(key, ()))
+        found.extend(p for p in self.patterns if keys_overlap(key, p))
+        return found
+
+    def add(self, key: Key):
+        if key in self.keys:
+            return
+        self.keys.add(key)
+        if _is_pattern(key):
+            self.patterns.add(key)
+            return
+        for i in range(len(key)):
+            self.below.setdefault(key[:i], set()).add(key)
+
+
+def infer_dependencies(tasks: List["Task"]) -> Dict[str, List[str]]:
+    """
+    Derive dependencies from the tasks' ``reads`` and ``writes``
+
+    Tasks are taken in list order. Literal paths are looked up through
+    their ancestors and descendants, so the cost grows with the number
+    of overlapping accesses rather than with the number of tasks; glob
+    resources are compared against every known resource.
+
+    Returns:
+        Task id -> ids of earlier tasks it must wait for (in list order)
+    """
+
+    index = _AccessIndex()
+    position = {task.id: i for i, task in enumerate(tasks)}
+    inferred: Dict[str, List[str]] = {}
+
+    for task in tasks:
+        reads = {resource_key(resource) for resource in task.reads}
+        writes = {resource_key(resource) for resource in task.writes}
+        deps: Set[str] = set()
+
+        for key in reads | writes:
+            for known in index.overlapping(key):
+                writer = index.writer.get(known)
+                if writer is not None:
+                    deps.add(writer)
+                if key in writes:
+                    deps.update(index.readers.get(known, ()))
+
+        deps.discard(task.id)
+        inferred[task.id] = sorted(deps, key=position.__getitem__)
+
+        for key in reads - writes:
+            index.add(key)
+            index.readers.setdefault(key, []).append(task.id)
+        for key in writes:
+            index.add(key)
+            index.writer[key] = task.id
+            index.readers[key] = []
+
+    return inferred
+
+
+def add_inferred_dependencies(tasks: List["Task"]):
+    """Merge inferred dependencies into each task's ``depends_on``"""
+
+    if not any(task.reads or task.writes for task in tasks):
+        return
+
+    inferred = infer_dependencies(tasks)
+    for task in tasks:
+        explicit = set(task.depends_on)
+        extra = [dep for dep in inferred[task.id] if dep not in explicit]
+        if extra:
+            task.depends_on = list(task.depends_on) + extra
@@ -0,0 +1,392 @@
+"""
+Result Cache - Memoize Tasks that are Pure Functions of Input Files
+
+A task declaring ``cache=CacheKey(inputs=[...], version="...")`` is
+looked up in a content-addressed on-disk cache before it runs. The key
+hashes the task's operation (see cost_model.operation_key), the version
+tag and every input file (directories are walked), so editing an input
+or bumping the version produces a new key; nothing is ever invalidated
+in place. Tasks without a stable identity (lambdas with no explicit
+fingerprint) are never cached.
+
+Relative input paths are resolved against the cache's ``root`` (the
+repository for ResultCache.for_repo), and keys name the inputs relative
+to it, so checkouts at different paths share keys.
+
+Input files are fingerprinted by content (SHA-256) or, with
+``validate="mtime"``, by size and modification time. Content hashes are
+remembered per (path, size, mtime) so re-runs over an unchanged tree
+only stat their inputs. Files modified within a couple of seconds of
+being hashed are always re-hashed (coarse timestamps could hide an edit).
+
+Stored results are JSON files under <path>/objects, so a cache checked
+out with a repository is only ever parsed as data. Results JSON cannot
+represent exactly are not stored unless the cache was created with
+``allow_pickle=True``, which must only be used for a directory outside
+any repository (unpickling runs code). The directory is kept under
+``max_bytes`` by evicting the least recently used results.
+
+Usage:
+    cache = ResultCache.for_repo(Path.cwd())
+    executor = ParallelExecutor(result_cache=cache)
+    tasks = [
+        Task("parse", "Parse app.py", parse_app, [],
+             cache=CacheKey(inputs=["src/app.py"], version="parser-3")),
+    ]
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .parallel import Task
+
+# File modified this close to being hashed: don't trust its memoized hash
+_RACY_NS = 2_000_000_000
+
+VALIDATION_MODES = ("content", "mtime")
+
+# Stored result formats and their file suffixes
+_SUFFIXES = {"json": ".json", "pickle": ".pkl"}
+
+
+def dump_result(result: Any, allow_pickle: bool = False) -> Optional[Tuple[str, bytes]]:
+    """
+    (kind, data) of a result to store, None if it cannot be stored
+
+    JSON when it round-trips the result exactly (tuples, non-string
+    keys and custom objects do not), else a pickle if allowed.
+    """
+    try:
+        data = json.dumps(result).encode()
+        if json.loads(data) == result:
+            return "json", data
+    except Exception:
+        pass
+    if not allow_pickle:
+        return None
+    try:
+        return "pickle", pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+
+
+def load_result(kind: str, data: bytes, allow_pickle: bool = False) -> Any:
+    """Result stored by dump_result(); pickles only load when allowed"""
+    if kind == "json":
+        return json.loads(data)
+    if kind == "pickle" and allow_pickle:
+        return pickle.loads(data)
+    raise ValueError(f"Refusing to load a {kind!r} result")
+
+
+def _key_name(path: str, root: str) -> str:
+    """Name of an input file in cache keys: relative to root if inside it"""
+    try:
+        relative = os.path.relpath(path, root)
+    except ValueError:  # Another drive (Windows)
+        return path
+    if relative == os.pardir or relative.startswith(os.pardir + os.sep):
+        return path
+    return Path(relative).as_posix()
+
+
+@dataclass(frozen=True)
+class CacheKey:
+    """
+    What a cacheable task's result depends on
+
+    Anything besides the input files and the task's identity (arguments
+    bound into the callable, tool versions, ...) belongs in ``version``.
+    """
+
+    inputs: Sequence[Union[str, "os.PathLike[str]"]] = ()
+    version: str = ""
+    validate: str = "content"  # content / mtime
+
+    def __post_init__(self):
+        if self.validate not in VALIDATION_MODES:
+            raise ValueError(
+                f"Unknown validation mode: {self.validate!r} "
+                f"(expected one of {', '.join(VALIDATION_MODES)})"
+            )
+
+
+class ResultCache:
+    """
+    Content-addressed, size-bounded store of task results
+
+    Thread-safe. Hit and miss counts are kept in ``hits`` and
+    ``misses``; results that cannot be serialized are simply not stored.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = 256 << 20,
+        allow_pickle: bool = False,
+        root: Optional[Path] = None,
+    ):
+        """
+        Args:
+            path: Cache directory
+            max_bytes: Upper bound on the size of stored results
+            allow_pickle: Also store (and load) pickled results. Only for
+                a private directory outside any repository
+            root: Directory relative inputs are resolved against and keys
+                name inputs relative to (None = the current directory)
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.allow_pickle = allow_pickle
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+
+        self._objects = path / "objects"
+        self._hashes_path = path / "file_hashes.json"
+        self._lock = threading.Lock()
+        self._hashes: Dict[str, List[Any]] = {}  # path -> [size, mtime, sha, at]
+        self._dirty = False
+        self._size: Optional[int] = None  # Bytes stored (scanned lazily)
+
+        try:
+            with open(self._hashes_path) as f:
+                self._hashes = json.load(f)
+        except (OSError, ValueError):
+            self._hashes = {}
+
+    @classmethod
+    def for_repo(cls, repo_path: Path, max_bytes: int = 256 << 20) -> "ResultCache":
+        """Cache stored in the repository's docs/memory directory (JSON only)"""
+        return cls(
+            repo_path / "docs" / "memory" / "result_cache", max_bytes, root=repo_path
+        )
+
+    def key_for(self, task: "Task") -> Optional[str]:
+        """
+        Content-addressed key for a cacheable task's current inputs
+
+        None if the task has no stable identity to key it by.
+        """
+        from .cost_model import operation_key
+
+        spec = task.cache
+        if spec is None:
+            raise ValueError(f"Task {task.id!r} declares no cache key")
+        identity = operation_key(task)
+        if identity is None:
+            return None
+
+        digest = hashlib.sha256()
+        digest.update(json.dumps([identity, spec.version]).encode())
+        for name, file in self._input_files(spec.inputs):
+            digest.update(
+                json.dumps([name, self._fingerprint(file, spec.validate)]).encode()
+            )
+        return digest.hexdigest()
+
+    def lookup(self, task: "Task") -> Tuple[Optional[str], bool, Any]:
+        """
+        Key a task and look it up: (key, found, result)
+
+        The key is None (and nothing is looked up) for tasks that cannot
+        be cached; the caller then runs the task and stores nothing.
+        """
+        key = self.key_for(task)
+        if key is None:
+            return None, False, None
+        found, result = self.get(key)
+        return key, found, result
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """(True, result) for a stored key, else (False, None)"""
+        formats = ("json", "pickle") if self.allow_pickle else ("json",)
+        for kind in formats:
+            file = self._object_path(key, kind)
+            try:
+                data = file.read_bytes()
+            except OSError:
+                continue
+            try:
+                result = load_result(kind, data, self.allow_pickle)
+            except Exception:
+                # Corrupt, or its classes moved or changed: drop the entry
+                file.unlink(missing_ok=True)
+                break
+            try:
+                os.utime(file)  # Recently used
+            except OSError:
+                pass
+            with self._lock:
+                self.hits += 1
+            return True, result
+
+        with self._lock:
+            self.misses += 1
+        return False, None
+
+    def put(self, key: str, result: Any):
+        """Store a result (skipped if it cannot be serialized)"""
+        dumped = dump_result(result, self.allow_pickle)
+        if dumped is None:
+            return
+        kind, data = dumped
+        if len(data) > self.max_bytes:
+            return
+
+        file = self._object_path(key, kind)
+        tmp_path = file.with_name(f"{file.name}.{threading.get_ident()}.tmp")
+        try:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+            tmp_path.replace(file)
+        except OSError:
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def save(self):
+        """Persist memoized input hashes (if any changed)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self.path.mkdir(parents=True, exist_ok=True)
+                tmp_path = self._hashes_path.with_suffix(".tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump(self._hashes, f)
+                tmp_path.replace(self._hashes_path)
+                self._dirty = False
+            except OSError:
+                pass
+
+    def clear(self):
+        """Remove every stored result and reset counters"""
+        with self._lock:
+            for file in self._object_files():
+                file.unlink(missing_ok=True)
+            self._size = 0
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._object_files())
+
+    # Internals
+
+    def _object_path(self, key: str, kind: str) -> Path:
+        return self._objects / key[:2] / f"{key}{_SUFFIXES[kind]}"
+
+    def _object_files(self) -> List[Path]:
+        if not self._objects.is_dir():
+            return []
+        return [
+            file
+            for suffix in _SUFFIXES.values()
+            for file in self._objects.glob(f"*/*{suffix}")
+        ]
+
+    def _scan_size(self) -> int:
+        total = 0
+        for file in self._object_files():
+            try:
+                total += file.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _evict(self):
+        """Drop least recently used results until under max_bytes (locked)"""
+        entries = []
+        for file in self._object_files():
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, file))
+
+        entries.sort(key=lambda entry: entry[0])
+        total = sum(size for _, size, _ in entries)
+        for _, size, file in entries:
+            if total <= self.max_bytes:
+                break
+            file.unlink(missing_ok=True)
+            total -= size
+        self._size = total
+
+    def _input_files(
+        self, inputs: Sequence[Union[str, "os.PathLike[str]"]]
+    ) -> List[Tuple[str, str]]:
+        """
+        (name in the key, absolute path) of every input file, sorted
+
+        Directories are expanded. Names are relative to ``root`` (POSIX
+        separators); files outside it are named by absolute path.
+        """
+        root = os.path.abspath(self.root if self.root is not None else os.curdir)
+        files: Set[str] = set()
+        for entry in inputs:
+            path = os.path.normpath(os.path.join(root, os.fspath(entry)))
+            if os.path.isdir(path):
+                for base, dirs, names in os.walk(path):
+                    dirs.sort()
+                    files.update(os.path.join(base, name) for name in names)
+            else:
+                files.add(path)
+        return sorted((_key_name(file, root), file) for file in files)
+
+    def _fingerprint(self, file: str, validate: str) -> List[Any]:
+        try:
+            stat = os.stat(file)
+        except OSError:
+            return ["missing"]
+
+        if validate == "mtime":
+            return [stat.st_size, stat.st_mtime_ns]
+
+        with self._lock:
+            memo = self._hashes.get(file)
+        if (
+            memo is not None
+            and memo[0] == stat.st_size
+            and memo[1] == stat.st_mtime_ns
+            and memo[3] - stat.st_mtime_ns > _RACY_NS
+        ):
+            return [memo[2]]
+
+        digest = hashlib.sha256()
+        try:
+            with open(file, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+        except OSError:
+            return ["unreadable"]
+
+        sha = digest.hexdigest()
+        with self._lock:
+            self._hashes[file] = [stat.st_size, stat.st_mtime_ns, sha, time.time_ns()]
+            self._dirty = True
+        return [sha]
@@ -9,16 +9,18 @@ Key features:
 - Root cause analysis
 - Pattern recognition across failures
 - Prevention rule generation
-- Persistent learning memory
+- Persistent learning memory (indexed store, see reflexion_store.py)
 """
 
 import hashlib
-import json
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .events import EventBus, FailureLearned, Notice, RootCauseFound
+from .reflexion_store import ReflexionStore
+
 
 @dataclass
 class RootCause:
@@ -79,29 +81,24 @@ class SelfCorrectionEngine:
     5. Apply automatically in future executions
     """
 
-    def __init__(self, repo_path: Path):
+    def __init__(self, repo_path: Path, events: Optional[EventBus] = None):
         self.repo_path = repo_path
+        self.events = events if events is not None else EventBus()
         self.memory_path = repo_path / "docs" / "memory"
         self.memory_path.mkdir(parents=True, exist_ok=True)
 
-        self.reflexion_file = self.memory_path / "reflexion.json"
+        # Imports a legacy reflexion.json on first use
+        self.store = ReflexionStore.for_repo(repo_path)
 
-        # Initialize reflexion memory if needed
-        if not self.reflexion_file.exists():
-            self._init_reflexion_memory()
+    def close(self):
+        """Close the reflexion store"""
+        self.store.close()
 
-    def _init_reflexion_memory(self):
-        """Initialize empty reflexion memory"""
-        initial_data = {
-            "version": "1.0",
-            "created": datetime.now().isoformat(),
-            "mistakes": [],
-            "patterns": [],
-            "prevention_rules": [],
-        }
+    def __enter__(self) -> "SelfCorrectionEngine":
+        return self
 
-        with open(self.reflexion_file, "w") as f:
-            json.dump(initial_data, f, indent=2)
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def detect_failure(self, execution_result: Dict[str, Any]) -> bool:
         """
@@ -120,21 +117,18 @@ class SelfCorrectionEngine:
         the fundamental cause.
         """
 
-        print("🔍 Self-Correction: Analyzing root cause")
-        print("=" * 60)
-
         error_msg = failure.get("error", "Unknown error")
         stack_trace = failure.get("stack_trace", "")
 
-        # Pattern recognition
-        category = self._categorize_failure(error_msg, stack_trace)
+        # Pattern recognition (timeouts are reported by the executor)
+        if failure.get("type") == "timeout":
+            category = "timeout"
+        else:
+            category = self._categorize_failure(error_msg, stack_trace)
 
         # Load past similar failures
         similar = self._find_similar_failures(task, error_msg)
 
-        if similar:
-            print(f"Found {len(similar)} similar past failures")
-
         # Generate prevention rule
         prevention_rule = self._generate_prevention_rule(category, error_msg, similar)
 
@@ -149,8 +143,8 @@ class SelfCorrectionEngine:
             validation_tests=validation_tests,
         )
 
-        print(root_cause)
-        print("=" * 60)
+        if self.events.listening:
+            self.events.emit(RootCauseFound(task, root_cause, len(similar)))
 
         return root_cause
 
@@ -183,38 +177,26 @@ class SelfCorrectionEngine:
         if "type" in error_lower:
             return "type"
 
+        # Timeouts, checked last: the executor reports its own with type
+        # "timeout", and "missing timeout param" is a validation error
+        if any(word in error_lower for word in ["timed out", "timeout", "deadline"]):
+            return "timeout"
+
         return "unknown"
 
     def _find_similar_failures(self, task: str, error_msg: str) -> List[FailureEntry]:
         """Find similar past failures"""
 
         try:
-            with open(self.reflexion_file) as f:
-                data = json.load(f)
-
-            past_failures = [
-                FailureEntry.from_dict(entry) for entry in data.get("mistakes", [])
+            # Keyword overlap (2+ words in task or error), rarest words first
+            return [
+                FailureEntry.from_dict(entry)
+                for entry in self.store.similar(task=task, error=error_msg)
             ]
 
-            # Simple similarity: keyword overlap
-            task_keywords = set(task.lower().split())
-            error_keywords = set(error_msg.lower().split())
-
-            similar = []
-            for failure in past_failures:
-                failure_keywords = set(failure.task.lower().split())
-                error_keywords_past = set(failure.error_message.lower().split())
-
-                task_overlap = len(task_keywords & failure_keywords)
-                error_overlap = len(error_keywords & error_keywords_past)
-
-                if task_overlap >= 2 or error_overlap >= 2:
-                    similar.append(failure)
-
-            return similar
-
         except Exception as e:
-            print(f"⚠️ Could not load reflexion memory: {e}")
+            if self.events.listening:
+                self.events.emit(Notice(f"Could not load reflexion memory: {e}"))
             return []
 
     def _generate_prevention_rule(
@@ -228,6 +210,7 @@ class SelfCorrectionEngine:
             "logic": "ALWAYS verify assumptions with assertions",
             "assumption": "NEVER assume - always verify with checks",
             "type": "ALWAYS use type hints and runtime type checking",
+            "timeout": "ALWAYS bound slow operations with a timeout and retries",
             "unknown": "ALWAYS add error handling for unknown cases",
         }
 
@@ -268,6 +251,11 @@ class SelfCorrectionEngine:
                 "Add runtime type checking",
                 "Use dataclass with validation",
             ],
+            "timeout": [
+                "Set a per-task timeout on slow operations",
+                "Check external services respond before relying on them",
+                "Measure operation duration under load",
+            ],
         }
 
         return tests.get(category, ["Add defensive check", "Add error handling"])
@@ -286,8 +274,6 @@ class SelfCorrectionEngine:
         Updates Reflexion memory with new learning.
         """
 
-        print("📚 Self-Correction: Learning from failure")
-
         # Generate unique ID for this failure
         failure_id = hashlib.md5(
             f"{task}{failure.get('error', '')}".encode()
@@ -306,48 +292,20 @@ class SelfCorrectionEngine:
             recurrence_count=0,
         )
 
-        # Load current reflexion memory
-        with open(self.reflexion_file) as f:
-            data = json.load(f)
-
-        # Check if similar failure exists (increment recurrence)
-        existing_failures = data.get("mistakes", [])
-        updated = False
-
-        for existing in existing_failures:
-            if existing.get("id") == failure_id:
-                existing["recurrence_count"] += 1
-                existing["timestamp"] = entry.timestamp
-                updated = True
-                print(f"⚠️ Recurring failure (count: {existing['recurrence_count']})")
-                break
-
-        if not updated:
-            # New failure - add to memory
-            data["mistakes"].append(entry.to_dict())
-            print(f"✅ New failure recorded: {failure_id}")
-
-        # Add prevention rule if not already present
-        if root_cause.prevention_rule not in data.get("prevention_rules", []):
-            if "prevention_rules" not in data:
-                data["prevention_rules"] = []
-            data["prevention_rules"].append(root_cause.prevention_rule)
-            print("📝 Prevention rule added")
-
-        # Save updated memory
-        with open(self.reflexion_file, "w") as f:
-            json.dump(data, f, indent=2)
+        # Known failure: count the recurrence; new failure: store it.
+        # The prevention rule is added if not already present.
+        recurrence_count, rule_added = self.store.record(
+            entry.to_dict(), root_cause.prevention_rule
+        )
 
-        print("💾 Reflexion memory updated")
+        if self.events.listening:
+            self.events.emit(FailureLearned(failure_id, recurrence_count, rule_added))
 
     def get_prevention_rules(self) -> List[str]:
         """Get all active prevention rules"""
 
         try:
-            with open(self.reflexion_file) as f:
-                data = json.load(f)
-
-            return data.get("prevention_rules", [])
+            return self.store.prevention_rules()
 
         except Exception:
             return []
@@ -360,25 +318,8 @@ class SelfCorrectionEngine:
         """
 
         try:
-            with open(self.reflexion_file) as f:
-                data = json.load(f)
-
-            past_failures = [
-                FailureEntry.from_dict(entry) for entry in data.get("mistakes", [])
-            ]
-
-            # Find similar tasks
-            task_keywords = set(task.lower().split())
-
-            relevant = []
-            for failure in past_failures:
-                failure_keywords = set(failure.task.lower().split())
-                overlap = len(task_keywords & failure_keywords)
-
-                if overlap >= 2:
-                    relevant.append(failure)
-
-            return relevant
+            # Tasks sharing 2+ words, rarest words first
+            return [FailureEntry.from_dict(e) for e in self.store.similar(task=task)]
 
         except Exception:
             return []
@@ -5,15 +5,25 @@ Provides core functionality for PM Agent:
 - Pre-execution confidence checking
 - Post-implementation self-check protocol
 - Reflexion error learning pattern
+- Near-duplicate error signature index
+- Precomputed error signature sidecar
+- Pluggable semantic search of past errors
 - Token budget management
 """
 
 from .confidence import ConfidenceChecker
 from .reflexion import ReflexionPattern
 from .self_check import SelfCheckProtocol
+from .signature_index import SignatureIndex
+from .signature_sidecar import SignatureSidecar
+from .vector_search import LocalVectorBackend, VectorBackend
 
 __all__ = [
     "ConfidenceChecker",
     "SelfCheckProtocol",
     "ReflexionPattern",
+    "SignatureIndex",
+    "SignatureSidecar",
+    "VectorBackend",
+    "LocalVectorBackend",
 ]
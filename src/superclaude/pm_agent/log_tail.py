@@ -0,0 +1,149 @@
+"""
+Log Tail - Follow an Append-Only JSONL Log from a Byte Offset
+
+The signature index, the signature sidecar and the local vector
+backend are all derived from solutions_learned.jsonl and kept current
+the same way, implemented once here:
+
+- each derived file stores how many bytes of the log it covers and a
+  CRC32 of the TAIL_BYTES before that offset
+- sync() is a no-op while the log's (size, mtime, inode) is unchanged
+- otherwise the log is read from the covered offset; complete lines are
+  handed over with their offsets, and a partial last line (still being
+  written) is left for the next sync
+- a log that shrank below the covered offset, or whose bytes before it
+  changed, was truncated or replaced: reading restarts from offset 0
+  and the derived file is expected to start over
+
+Usage:
+    class Derived(LogFollower):
+        def _catch_up(self) -> int:
+            with follow(self.source, covered, crc) as tail:
+                if tail is None:
+                    ...  # No log (yet)
+                if tail.restarted:
+                    ...  # Drop what was derived so far
+                for position, line in tail:
+                    ...
+                store(tail.end, tail.crc())
+"""
+
+import os
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from types import ModuleType
+from typing import IO, Iterator, Optional, Tuple
+
+fcntl: Optional[ModuleType]
+try:
+    import fcntl
+except ImportError:  # Windows: writers only serialize within a process
+    fcntl = None
+
+# Bytes before the covered offset compared to notice a replaced log
+TAIL_BYTES = 256
+
+# CRC stored with offset 0 (nothing covered yet)
+EMPTY_CRC = zlib.crc32(b"")
+
+
+def tail_crc(f: IO[bytes], end: int) -> int:
+    """Checksum of the TAIL_BYTES of an open log just before ``end``"""
+    start = max(0, end - TAIL_BYTES)
+    f.seek(start)
+    return zlib.crc32(f.read(end - start))
+
+
+def log_state(path: Path) -> Tuple[int, int, int]:
+    """(size, mtime, inode) of a log, zeros if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return 0, 0, 0
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+@contextmanager
+def writer_lock(path: Path) -> Iterator[None]:
+    """Serialize writers of a file derived from the log across processes"""
+    with open(path.with_name(f"{path.name}.lock"), "a+b") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        yield  # Closing the file releases the lock
+
+
+class TailReader:
+    """Complete lines of an open log past a covered offset"""
+
+    def __init__(self, f: IO[bytes], start: int, restarted: bool):
+        self.start = start  # Offset reading starts at
+        self.end = start  # Offset covered after the lines read so far
+        self.restarted = restarted  # Log truncated or replaced: start is 0
+        self._f = f
+
+    def __iter__(self) -> Iterator[Tuple[int, bytes]]:
+        """(offset, line) of each complete line, advancing ``end``"""
+        self._f.seek(self.end)
+        for line in self._f:
+            if not line.endswith(b"\n"):
+                return  # Still being written
+            position = self.end
+            self.end += len(line)
+            yield position, line
+
+    def crc(self) -> int:
+        """tail_crc() to store with ``end`` (once done iterating)"""
+        return tail_crc(self._f, self.end)
+
+
+@contextmanager
+def follow(source: Path, covered: int, crc: int) -> Iterator[Optional[TailReader]]:
+    """
+    Reader of the lines of ``source`` past ``covered``
+
+    ``crc`` is the tail_crc() stored when ``covered`` was reached. None
+    if the log does not exist.
+    """
+    try:
+        f = open(source, "rb")
+    except OSError:
+        f = None
+    if f is None:
+        yield None
+        return
+
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        restarted = covered > size or tail_crc(f, covered) != crc
+        yield TailReader(f, 0 if restarted else covered, restarted)
+
+
+class LogFollower(ABC):
+    """
+    Base of files derived from a JSONL log
+
+    Subclasses implement _catch_up(), which folds in the lines past what
+    they cover (see follow()); sync() calls it whenever the log changed.
+    """
+
+    def __init__(self, source: Path):
+        self.source = source
+        self._lock = threading.RLock()
+        self._synced: Tuple[int, int, int] = (-1, -1, -1)  # log_state() at sync
+
+    def sync(self) -> int:
+        """Fold in the records appended to the log; returns how many"""
+        state = log_state(self.source)
+        with self._lock:
+            if state == self._synced:
+                return 0
+            added = self._catch_up()
+            self._synced = state
+        return added
+
+    @abstractmethod
+    def _catch_up(self) -> int:
+        """Fold in complete lines past the covered offset (locked)"""
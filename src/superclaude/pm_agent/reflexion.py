@@ -13,8 +13,14 @@ Performance:
 
 Storage Strategy:
     - Primary: docs/memory/solutions_learned.jsonl (local file)
-    - Secondary: mindbase (if available, semantic search)
-    - Fallback: grep-based text search
+    - Secondary: MinHash/LSH index over the local file
+      (docs/memory/solutions_learned.lsh, see signature_index.py)
+    - Fallback: mindbase-style semantic search through a pluggable
+      VectorBackend (with the ``vector`` extra installed, local n-gram
+      vectors in docs/memory/solutions_learned.vec by default, see
+      vector_search.py)
+    - Precomputed signatures and statistics
+      (docs/memory/solutions_learned.sig, see signature_sidecar.py)
 
 Process:
     1. Error detected → Check past errors (smart lookup)
@@ -26,13 +32,28 @@ Process:
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import AbstractSet, Any, BinaryIO, Dict, List, Optional, Sequence
+
+from .signature_index import INDEX_NAME, SignatureIndex
+from .signature_sidecar import SIDECAR_NAME, SignatureSidecar, token_hashes
+from .vector_search import (
+    NUMPY_AVAILABLE,
+    VECTORS_NAME,
+    LocalVectorBackend,
+    VectorBackend,
+)
+
+# Nearest stored errors verified per semantic lookup, best first
+VECTOR_CANDIDATES = 5
 
 
 class ReflexionPattern:
     """
     Error learning and prevention through reflexion
 
+    Holds the signature index, the sidecar's map and the vector
+    backend open; close() (or a with block) releases them.
+
     Usage:
         reflexion = ReflexionPattern()
 
@@ -53,13 +74,20 @@ class ReflexionPattern:
             reflexion.record_error(error_info)
     """
 
-    def __init__(self, memory_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        memory_dir: Optional[Path] = None,
+        vector_backend: Optional[VectorBackend] = None,
+    ):
         """
         Initialize reflexion pattern
 
         Args:
             memory_dir: Directory for storing error solutions
                        (defaults to docs/memory/ in current project)
+            vector_backend: Semantic search backend (defaults to local
+                       vectors next to the solutions file if NumPy, the
+                       ``vector`` extra, is installed, else none)
         """
         if memory_dir is None:
             # Default to docs/memory/ in current working directory
@@ -68,18 +96,50 @@ class ReflexionPattern:
         self.memory_dir = memory_dir
         self.solutions_file = memory_dir / "solutions_learned.jsonl"
         self.mistakes_dir = memory_dir.parent / "mistakes"
+        self._index: Optional[SignatureIndex] = None  # Opened on first use
+        self._sidecar: Optional[SignatureSidecar] = None
+        self.vector_backend: Optional[VectorBackend] = vector_backend
+        if vector_backend is None and NUMPY_AVAILABLE:
+            self.vector_backend = LocalVectorBackend(
+                memory_dir / VECTORS_NAME,
+                self.solutions_file,
+                self._create_error_signature,
+            )
 
         # Ensure directories exist
         self.memory_dir.mkdir(parents=True, exist_ok=True)
         self.mistakes_dir.mkdir(parents=True, exist_ok=True)
 
+    def close(self):
+        """Close the signature index, sidecar and vector backend"""
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        if self._sidecar is not None:
+            self._sidecar.close()
+            self._sidecar = None
+        if self.vector_backend is not None:
+            self.vector_backend.close()
+
+    def __enter__(self) -> "ReflexionPattern":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def get_solution(self, error_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Get known solution for similar error
 
         Lookup strategy:
-            1. Try mindbase semantic search (if available)
-            2. Fallback to grep-based text search
+            1. Try the local file's signature index: only its
+               near-duplicate candidates are checked
+            2. Fallback to mindbase semantic search (if available): the
+               nearest stored errors by cosine similarity, best first,
+               and the first one passing the word overlap check wins.
+               Scores every stored error, so it only runs when the
+               index found nothing. Needs a vector backend, by default
+               only created with the ``vector`` extra (NumPy) installed
             3. Return None if no match found
 
         Args:
@@ -90,14 +150,38 @@ class ReflexionPattern:
         """
         error_signature = self._create_error_signature(error_info)
 
-        # Try mindbase first (semantic search, 500 tokens)
-        solution = self._search_mindbase(error_signature)
+        # Try file-based search first (0 tokens, local index)
+        solution = self._search_local_files(error_signature)
         if solution:
             return solution
 
-        # Fallback to file-based search (0 tokens, local grep)
-        solution = self._search_local_files(error_signature)
-        return solution
+        # Fallback to mindbase (semantic search, local vectors by default)
+        return self._search_mindbase(error_signature)
+
+    def get_solutions(
+        self, error_infos: Sequence[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get known solutions for many errors at once
+
+        Same lookup strategy as get_solution(), but the errors the index
+        has no match for go to the semantic search in one batched query
+        (e.g. every failure of a test session).
+
+        Args:
+            error_infos: Error information dicts
+
+        Returns:
+            Solution dict or None per error, in order
+        """
+        signatures = [self._create_error_signature(info) for info in error_infos]
+        solutions = [self._search_local_files(signature) for signature in signatures]
+        missing = [i for i, solution in enumerate(solutions) if not solution]
+        if missing:
+            found = self._search_mindbase_batch([signatures[i] for i in missing])
+            for i, solution in zip(missing, found):
+                solutions[i] = solution
+        return solutions
 
     def record_error(self, error_info: Dict[str, Any]) -> None:
         """
@@ -107,6 +191,9 @@ class ReflexionPattern:
             1. docs/memory/solutions_learned.jsonl (append-only log)
             2. docs/mistakes/[feature]-[date].md (detailed analysis)
 
+        The record's signature is computed here, once, into the sidecar,
+        the signature index and the vector backend.
+
         Args:
             error_info: Error information dict containing:
                 - test_name: Name of failing test
@@ -122,6 +209,10 @@ class ReflexionPattern:
         # Append to solutions log (JSONL format)
         with self.solutions_file.open("a") as f:
             f.write(json.dumps(error_info) + "\n")
+        self.sidecar.sync()
+        self.index.sync()
+        if self.vector_backend is not None:
+            self.vector_backend.sync()
 
         # If this is a significant error with analysis, create mistake doc
         if error_info.get("root_cause") or error_info.get("solution"):
@@ -171,15 +262,73 @@ class ReflexionPattern:
         Returns:
             Solution dict if found, None if mindbase unavailable or no match
         """
-        # TODO: Implement mindbase integration
-        # For now, return None (fallback to file search)
-        return None
+        return self._search_mindbase_batch([error_signature])[0]
+
+    def _search_mindbase_batch(
+        self, error_signatures: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Semantic search for many signatures in one backend query
+
+        The VECTOR_CANDIDATES nearest records of each signature are
+        verified in order with the same word overlap check as the local
+        index; cosine similarity only ranks them.
+
+        Args:
+            error_signatures: Error signatures to search
+
+        Returns:
+            Solution dict or None per signature
+        """
+        backend = self.vector_backend
+        if backend is None or not self.solutions_file.exists():
+            return [None] * len(error_signatures)
+
+        backend.sync()
+        matches = backend.search(error_signatures, k=VECTOR_CANDIDATES)
+
+        self.sidecar.sync()
+        solutions: List[Optional[Dict[str, Any]]] = []
+        with self.solutions_file.open("rb") as f:
+            for signature, ranked in zip(error_signatures, matches):
+                query = token_hashes(signature)
+                solution = None
+                for match in ranked:
+                    record = self._matching_record(f, match.position, signature, query)
+                    if record is not None:
+                        solution = self._solution_from(record)
+                        break
+                solutions.append(solution)
+        return solutions
+
+    @property
+    def index(self) -> SignatureIndex:
+        """MinHash/LSH index of the signatures in the solutions file"""
+        if self._index is None:
+            self._index = SignatureIndex(
+                self.memory_dir / INDEX_NAME,
+                self.solutions_file,
+                self._create_error_signature,
+            )
+        return self._index
+
+    @property
+    def sidecar(self) -> SignatureSidecar:
+        """Precomputed signatures of the records in the solutions file"""
+        if self._sidecar is None:
+            self._sidecar = SignatureSidecar(
+                self.memory_dir / SIDECAR_NAME,
+                self.solutions_file,
+                self._create_error_signature,
+            )
+        return self._sidecar
 
     def _search_local_files(self, error_signature: str) -> Optional[Dict[str, Any]]:
         """
         Search for similar error in local JSONL file
 
-        Uses simple text matching on error signatures.
+        The signature index narrows the file down to near-duplicate
+        candidates; the earliest one passing the word overlap check wins.
 
         Args:
             error_signature: Error signature to search
@@ -190,26 +339,63 @@ class ReflexionPattern:
         if not self.solutions_file.exists():
             return None
 
-        # Read JSONL file and search
-        with self.solutions_file.open("r") as f:
-            for line in f:
-                try:
-                    record = json.loads(line)
-                    stored_signature = self._create_error_signature(record)
-
-                    # Simple similarity check
-                    if self._signatures_match(error_signature, stored_signature):
-                        return {
-                            "solution": record.get("solution"),
-                            "root_cause": record.get("root_cause"),
-                            "prevention": record.get("prevention"),
-                            "timestamp": record.get("timestamp"),
-                        }
-                except json.JSONDecodeError:
-                    continue
+        candidates = self.index.candidates(error_signature)
+        if not candidates:
+            return None
+
+        self.sidecar.sync()
+        query = token_hashes(error_signature)
+        with self.solutions_file.open("rb") as f:
+            for position in candidates:
+                record = self._matching_record(f, position, error_signature, query)
+                if record is not None:
+                    return self._solution_from(record)
 
         return None
 
+    def _matching_record(
+        self,
+        f: BinaryIO,
+        position: int,
+        error_signature: str,
+        query: AbstractSet[int],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Record at ``position`` if it passes the word overlap check
+
+        Records are checked against their precomputed word hashes
+        (``query`` holds the signature's), so only matching records are
+        read from the file.
+        """
+        entry = self.sidecar.entry(position)
+        if entry is not None and not entry.complete:
+            entry = None  # Too many words: verified from the record instead
+        if entry is not None and not self._sets_match(query, entry.tokens):
+            return None
+
+        f.seek(position)
+        try:
+            record = json.loads(f.readline())
+            if not isinstance(record, dict):
+                return None
+            if entry is None and not self._signatures_match(
+                error_signature, self._create_error_signature(record)
+            ):
+                return None
+        except (ValueError, TypeError, AttributeError):
+            return None
+        return record
+
+    @staticmethod
+    def _solution_from(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Solution dict of a stored record"""
+        return {
+            "solution": record.get("solution"),
+            "root_cause": record.get("root_cause"),
+            "prevention": record.get("prevention"),
+            "timestamp": record.get("timestamp"),
+        }
+
     def _signatures_match(self, sig1: str, sig2: str, threshold: float = 0.7) -> bool:
         """
         Check if two error signatures match
@@ -227,11 +413,18 @@ class ReflexionPattern:
         words1 = set(sig1.lower().split())
         words2 = set(sig2.lower().split())
 
-        if not words1 or not words2:
+        return self._sets_match(words1, words2, threshold)
+
+    @staticmethod
+    def _sets_match(
+        set1: AbstractSet, set2: AbstractSet, threshold: float = 0.7
+    ) -> bool:
+        """Jaccard check of two word sets (or sets of word hashes)"""
+        if not set1 or not set2:
             return False
 
-        overlap = len(words1 & words2)
-        total = len(words1 | words2)
+        overlap = len(set1 & set2)
+        total = len(set1 | set2)
 
         return (overlap / total) >= threshold
 
@@ -311,31 +504,16 @@ class ReflexionPattern:
         """
         Get reflexion pattern statistics
 
+        Read from the sidecar's header, not by scanning the log.
+
         Returns:
             Dict with statistics:
                 - total_errors: Total errors recorded
                 - errors_with_solutions: Errors with documented solutions
                 - solution_reuse_rate: Percentage of reused solutions
         """
-        if not self.solutions_file.exists():
-            return {
-                "total_errors": 0,
-                "errors_with_solutions": 0,
-                "solution_reuse_rate": 0.0,
-            }
-
-        total = 0
-        with_solutions = 0
-
-        with self.solutions_file.open("r") as f:
-            for line in f:
-                try:
-                    record = json.loads(line)
-                    total += 1
-                    if record.get("solution"):
-                        with_solutions += 1
-                except json.JSONDecodeError:
-                    continue
+        self.sidecar.sync()
+        total, with_solutions = self.sidecar.statistics()
 
         return {
             "total_errors": total,
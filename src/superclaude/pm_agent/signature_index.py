@@ -0,0 +1,253 @@
+"""
+Signature Index - MinHash/LSH Lookup of Similar Error Signatures
+
+ReflexionPattern used to answer get_solution() by streaming the whole
+solutions_learned.jsonl, re-parsing every record and comparing word
+sets, so every lookup cost time proportional to the history.
+SignatureIndex keeps a locality-sensitive hashing index of the stored
+signatures next to the JSONL (stdlib sqlite3):
+
+- every signature gets a MinHash sketch of its word set: NUM_PERM
+  minimums of independent per-word hashes
+- the sketch is cut into BANDS bands of ROWS values and each band is
+  hashed to a bucket key; records sharing a bucket with the query are
+  its candidates. Word sets with Jaccard similarity s share a bucket
+  with probability 1 - (1 - s^ROWS)^BANDS: 99.98% at 0.7, 5% at 0.2
+- candidates come back as byte offsets into the JSONL, in file order,
+  for the caller to verify with its exact word-overlap check
+
+The JSONL stays the source of truth: sync() indexes only the lines
+appended since the last sync, and the index is rebuilt when the file
+was truncated or replaced (see log_tail.py).
+
+Usage:
+    index = SignatureIndex(memory_dir / INDEX_NAME, solutions_file, signature)
+    for offset in index.candidates("TypeError | expected str, got int"):
+        ...  # Read the record at offset and verify it
+"""
+
+import hashlib
+import json
+import sqlite3
+import struct
+import sys
+from array import array
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Sequence, Tuple
+
+from .log_tail import EMPTY_CRC, LogFollower, follow
+
+INDEX_NAME = "solutions_learned.lsh"
+
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+
+# Stored with the index; an index built with other parameters is rebuilt
+_SCHEME = f"minhash-{NUM_PERM}x{BANDS}"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    key INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (key, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+# Records indexed per batch of inserts
+_BATCH = 10_000
+
+
+def keywords(signature: str) -> FrozenSet[str]:
+    """Words a signature is sketched and matched by"""
+    return frozenset(signature.lower().split())
+
+
+@lru_cache(maxsize=1 << 16)
+def _word_hashes(word: str) -> array:
+    """NUM_PERM independent 32-bit hashes of a word"""
+    hashes = array("I")
+    hashes.frombytes(hashlib.shake_128(word.encode()).digest(NUM_PERM * 4))
+    if sys.byteorder == "big":
+        hashes.byteswap()  # Same sketches (and index) on every platform
+    return hashes
+
+
+def minhash(words: FrozenSet[str]) -> List[int]:
+    """MinHash sketch of a non-empty word set"""
+    return list(map(min, zip(*map(_word_hashes, words))))
+
+
+def band_keys(sketch: Sequence[int]) -> List[int]:
+    """Bucket key of each band of a sketch (signed 64-bit)"""
+    raw = struct.pack(f"<{NUM_PERM}I", *sketch)
+    width = ROWS * 4
+    return [
+        int.from_bytes(
+            hashlib.blake2b(
+                bytes((band,)) + raw[band * width : (band + 1) * width],
+                digest_size=8,
+            ).digest(),
+            "little",
+            signed=True,
+        )
+        for band in range(BANDS)
+    ]
+
+
+class SignatureIndex(LogFollower):
+    """
+    LSH index over the error signatures of a JSONL solutions log
+
+    ``signature`` turns a parsed record into its signature (the same
+    function lookups use). Safe to share between threads; separate
+    processes coordinate through SQLite's own locking.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        source: Path,
+        signature: Callable[[Dict[str, Any]], str],
+        timeout: float = 30.0,
+    ):
+        """
+        Args:
+            path: Index database
+            source: JSONL file indexed (one record per line)
+            signature: Record -> error signature
+            timeout: Seconds to wait for another process's write
+        """
+        super().__init__(source)
+        self.path = path
+        self.signature = signature
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(
+            str(path), timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        with self._transaction() as db:
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    db.execute(statement)
+            if self._meta(db, "scheme") != _SCHEME:
+                self._reset(db)
+                self._set_meta(db, scheme=_SCHEME)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "SignatureIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def candidates(self, signature: str) -> List[int]:
+        """
+        Offsets of the records likely similar to a signature
+
+        Syncs first, so records appended by anyone are included.
+        Candidates are in file order and still need verifying.
+        """
+        words = keywords(signature)
+        if not words:
+            return []
+        self.sync()
+
+        keys = band_keys(minhash(words))
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT DISTINCT position FROM buckets "
+                f"WHERE key IN ({', '.join('?' * len(keys))}) ORDER BY position",
+                keys,
+            ).fetchall()
+        return [position for (position,) in rows]
+
+    def __len__(self) -> int:
+        """Records indexed"""
+        with self._lock:
+            return int(self._meta(self._db, "records") or 0)
+
+    # Internals
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Serialize writers across threads and processes"""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def _catch_up(self) -> int:
+        """Index complete lines past the indexed end"""
+        with self._transaction() as db:
+            indexed = int(self._meta(db, "indexed") or 0)
+            records = int(self._meta(db, "records") or 0)
+            crc = int(self._meta(db, "crc") or -1)
+            with follow(self.source, indexed, crc) as tail:
+                if tail is None:
+                    if indexed:
+                        self._reset(db)
+                    return 0
+                if tail.restarted:
+                    self._reset(db)  # Truncated or replaced: start over
+                    records = 0
+
+                added = 0
+                rows: List[Tuple[int, int]] = []
+                pending = 0
+                for position, line in tail:
+                    words = self._words(line)
+                    if not words:
+                        continue
+                    rows.extend((key, position) for key in band_keys(minhash(words)))
+                    pending += 1
+                    if pending == _BATCH:
+                        self._insert(db, rows)
+                        added += pending
+                        rows, pending = [], 0
+                self._insert(db, rows)
+                added += pending
+
+                records += added
+                self._set_meta(db, indexed=tail.end, records=records, crc=tail.crc())
+            return added
+
+    def _words(self, line: bytes) -> FrozenSet[str]:
+        try:
+            record = json.loads(line)
+            return keywords(self.signature(record))
+        except (ValueError, TypeError, AttributeError):
+            return frozenset()  # Not a record: never a candidate
+
+    @staticmethod
+    def _insert(db: sqlite3.Connection, rows: List[Tuple[int, int]]):
+        rows.sort()  # Appends to the B-tree in key order
+        db.executemany("INSERT OR IGNORE INTO buckets VALUES (?, ?)", rows)
+
+    def _reset(self, db: sqlite3.Connection):
+        db.execute("DELETE FROM buckets")
+        self._set_meta(db, indexed=0, records=0, crc=EMPTY_CRC)
+
+    @staticmethod
+    def _meta(db: sqlite3.Connection, key: str) -> Any:
+        row = db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(db: sqlite3.Connection, **values: Any):
+        db.executemany(
+            "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+            [(key, str(value)) for key, value in values.items()],
+        )
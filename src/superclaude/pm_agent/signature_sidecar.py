@@ -0,0 +1,272 @@
+"""
+Signature Sidecar - Precomputed Error Signatures of the Solutions Log
+
+get_solution() and get_statistics() used to re-parse
+solutions_learned.jsonl and rebuild signatures of records that never
+change. The sidecar (solutions_learned.sig) keeps what they need from
+every record, computed once when the record is written:
+
+- a fixed-size header: record count, records with a solution, how much
+  of the JSONL is covered and a checksum of its last covered bytes
+- one fixed-width entry per record, in file order: the byte offset of
+  its line, a has-solution flag, the size of its signature's word set
+  and the sorted 32-bit hashes of (up to MAX_TOKENS of) those words
+
+Lookups memory-map the file and binary-search entries by offset;
+statistics are a header read. Lines appended to the JSONL by anything
+else are picked up by sync(), and a truncated or replaced JSONL
+rebuilds the sidecar (see log_tail.py). Entries are written before the header counting
+them, so a crash mid-write leaves the previous consistent state.
+
+Usage:
+    sidecar = SignatureSidecar(memory_dir / SIDECAR_NAME, solutions_file, signature)
+    sidecar.sync()
+    records, with_solutions = sidecar.statistics()
+    entry = sidecar.entry(offset)
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+from .log_tail import EMPTY_CRC, LogFollower, follow, writer_lock
+from .signature_index import keywords
+
+SIDECAR_NAME = "solutions_learned.sig"
+
+# Word hashes stored per entry; longer signatures are verified from the log
+MAX_TOKENS = 29
+
+_MAGIC = b"SCSIG\x00\x00\x01"
+# magic, records, records with a solution, JSONL bytes covered, tail CRC32
+_HEADER = struct.Struct("<8sQQQI4x")
+# line offset, word count, flags, word hashes (zero padded): 128 bytes
+_ENTRY = struct.Struct(f"<QHBx{MAX_TOKENS}I")
+_OFFSET = struct.Struct("<Q")
+
+_HAS_SOLUTION = 1
+
+
+@lru_cache(maxsize=1 << 16)
+def _token_hash(word: str) -> int:
+    digest = hashlib.blake2b(word.encode(), digest_size=4).digest()
+    return int.from_bytes(digest, "little")
+
+
+def token_hashes(signature: str) -> FrozenSet[int]:
+    """32-bit hashes of the words of a signature"""
+    return frozenset(map(_token_hash, keywords(signature)))
+
+
+@dataclass(frozen=True)
+class SidecarEntry:
+    """Precomputed view of one record of the solutions log"""
+
+    position: int  # Byte offset of the record's line
+    word_count: int
+    tokens: FrozenSet[int]  # Hashes of the words (up to MAX_TOKENS)
+    has_solution: bool
+
+    @property
+    def complete(self) -> bool:
+        """Whether ``tokens`` holds every word of the signature"""
+        return self.word_count <= MAX_TOKENS
+
+
+class SignatureSidecar(LogFollower):
+    """
+    Memory-mapped table of precomputed signatures for a JSONL log
+
+    ``signature`` turns a parsed record into its signature. Safe to
+    share between threads; writers in separate processes serialize on a
+    lock file (POSIX), while readers never block.
+    """
+
+    def __init__(
+        self, path: Path, source: Path, signature: Callable[[Dict[str, Any]], str]
+    ):
+        """
+        Args:
+            path: Sidecar file
+            source: JSONL file described (one record per line)
+            signature: Record -> error signature
+        """
+        super().__init__(source)
+        self.path = path
+        self.signature = signature
+
+        self._map: Optional[mmap.mmap] = None
+
+    def close(self):
+        with self._lock:
+            self._unmap()
+
+    def __enter__(self) -> "SignatureSidecar":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def statistics(self) -> Tuple[int, int]:
+        """(records, records with a solution) as of the last sync"""
+        with self._lock:
+            view = self._view()
+            if view is None:
+                return 0, 0
+            _, records, with_solutions, _, _ = _HEADER.unpack_from(view)
+            return records, with_solutions
+
+    def entry(self, position: int) -> Optional[SidecarEntry]:
+        """Entry of the record whose line starts at ``position``"""
+        with self._lock:
+            view = self._view()
+            if view is None:
+                return None
+            records = min(
+                _HEADER.unpack_from(view)[1],
+                (len(view) - _HEADER.size) // _ENTRY.size,
+            )
+
+            low, high = 0, records
+            while low < high:
+                middle = (low + high) // 2
+                at = _HEADER.size + middle * _ENTRY.size
+                if _OFFSET.unpack_from(view, at)[0] < position:
+                    low = middle + 1
+                else:
+                    high = middle
+            if low == records:
+                return None
+
+            fields = _ENTRY.unpack_from(view, _HEADER.size + low * _ENTRY.size)
+        if fields[0] != position:
+            return None
+        word_count = fields[1]
+        return SidecarEntry(
+            position=position,
+            word_count=word_count,
+            tokens=frozenset(fields[3 : 3 + min(word_count, MAX_TOKENS)]),
+            has_solution=bool(fields[2] & _HAS_SOLUTION),
+        )
+
+    def __len__(self) -> int:
+        """Records described"""
+        return self.statistics()[0]
+
+    # Internals
+
+    def _catch_up(self) -> int:
+        """Append entries for complete lines past the covered end (locked)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with writer_lock(self.path):
+                return self._append_entries()
+        finally:
+            self._unmap()  # Remapped on the next read
+
+    def _append_entries(self) -> int:
+        header = self._read_header()
+        if header is None:
+            header = self._reset()
+        _, records, with_solutions, covered, crc = header
+
+        with follow(self.source, covered, crc) as tail:
+            if tail is None:
+                if records or covered:
+                    self._reset()
+                return 0
+            if tail.restarted:
+                _, records, with_solutions, _, _ = self._reset()
+
+            added = 0
+            with open(self.path, "r+b") as sidecar:
+                sidecar.seek(_HEADER.size + records * _ENTRY.size)
+                for position, line in tail:
+                    packed = self._pack(position, line)
+                    if packed is None:
+                        continue
+                    entry, has_solution = packed
+                    sidecar.write(entry)
+                    added += 1
+                    with_solutions += has_solution
+                if tail.end == tail.start:
+                    return 0
+
+                sidecar.truncate()  # Entries torn by an earlier crash
+                sidecar.flush()
+                sidecar.seek(0)
+                sidecar.write(
+                    _HEADER.pack(
+                        _MAGIC, records + added, with_solutions, tail.end, tail.crc()
+                    )
+                )
+        return added
+
+    def _pack(self, position: int, line: bytes) -> Optional[Tuple[bytes, bool]]:
+        """(entry, has solution) for a line of the log, None if not a record"""
+        try:
+            record = json.loads(line)
+        except ValueError:
+            return None
+        if not isinstance(record, dict):
+            return None
+        try:
+            tokens = sorted(token_hashes(self.signature(record)))
+        except (TypeError, AttributeError):
+            tokens = []  # Counted, but never matches
+
+        has_solution = bool(record.get("solution"))
+        kept = tokens[:MAX_TOKENS]
+        entry = _ENTRY.pack(
+            position,
+            min(len(tokens), 0xFFFF),
+            _HAS_SOLUTION if has_solution else 0,
+            *kept,
+            *[0] * (MAX_TOKENS - len(kept)),
+        )
+        return entry, has_solution
+
+    def _read_header(self) -> Optional[Tuple[Any, ...]]:
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read(_HEADER.size)
+        except OSError:
+            return None
+        if len(data) < _HEADER.size:
+            return None
+        header = _HEADER.unpack(data)
+        return header if header[0] == _MAGIC else None
+
+    def _reset(self) -> Tuple[Any, ...]:
+        """Replace the sidecar with an empty one (readers keep the old map)"""
+        header = (_MAGIC, 0, 0, 0, EMPTY_CRC)
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_bytes(_HEADER.pack(*header))
+        tmp_path.replace(self.path)
+        return header
+
+    def _view(self) -> Optional[mmap.mmap]:
+        """Read-only map of the sidecar as of the last sync"""
+        if self._map is not None:
+            return self._map
+        try:
+            with open(self.path, "rb") as f:
+                if os.fstat(f.fileno()).st_size < _HEADER.size:
+                    return None
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError:
+            return None
+        if self._map[: len(_MAGIC)] != _MAGIC:
+            self._unmap()
+        return self._map
+
+    def _unmap(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
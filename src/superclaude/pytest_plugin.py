@@ -169,9 +169,6 @@ def pytest_runtest_makereport(item, call):
         marker = item.get_closest_marker("reflexion")
 
         if marker and call.excinfo is not None:
-            # Test failed - apply reflexion pattern
-            reflexion = ReflexionPattern()
-
             # Record error for future learning
             error_info = {
                 "test_name": item.name,
@@ -181,7 +178,9 @@ def pytest_runtest_makereport(item, call):
                 "traceback": str(call.excinfo.traceback),
             }
 
-            reflexion.record_error(error_info)
+            # Test failed - apply reflexion pattern
+            with ReflexionPattern() as reflexion:
+                reflexion.record_error(error_info)
 
 
 def pytest_report_header(config):
@@ -5,6 +5,8 @@ This file is automatically loaded by pytest and provides
 shared fixtures available to all test modules.
 """
 
+import json
+
 import pytest
 
 
@@ -114,3 +116,48 @@ def temp_memory_dir(tmp_path):
     (memory_dir / "reflexion.jsonl").write_text("")
 
     return memory_dir
+
+
+class SolutionsLog:
+    """JSONL solutions log the signature index and sidecars are built from"""
+
+    def __init__(self, path):
+        self.path = path
+        path.write_text("")
+
+    @staticmethod
+    def signature(record):
+        """Error signature of a record (the log stores it as is)"""
+        return record["signature"]
+
+    def append(self, *records):
+        """Append records, given as dicts or as bare signatures"""
+        with self.path.open("a") as f:
+            for record in records:
+                if isinstance(record, str):
+                    record = {"signature": record}
+                f.write(json.dumps(record) + "\n")
+
+    def write(self, text):
+        """Append raw text, e.g. a record still being written"""
+        with self.path.open("a") as f:
+            f.write(text)
+
+    def offsets(self):
+        """Byte offset of each line"""
+        offsets, position = [], 0
+        for line in self.path.read_bytes().splitlines(keepends=True):
+            offsets.append(position)
+            position += len(line)
+        return offsets
+
+
+@pytest.fixture
+def solutions_log(tmp_path):
+    """
+    Provide an empty solutions log
+
+    Returns:
+        SolutionsLog writing to tmp_path / "solutions.jsonl"
+    """
+    return SolutionsLog(tmp_path / "solutions.jsonl")
@@ -0,0 +1,159 @@
+"""
+Unit tests for adaptive concurrency
+
+Tests the AIMD controller against synthetic workloads and the
+executor's max_workers="auto" mode.
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from superclaude.execution.adaptive import AUTO_MAX_WORKERS, AIMDController
+from superclaude.execution.parallel import ParallelExecutor, Task
+
+
+class FakeClock:
+    """Manually advanced time source"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _simulate(controller, clock, service_time, windows=100):
+    """
+    Drive the controller with a synthetic workload
+
+    service_time(limit) gives the per-task run time at a concurrency
+    level; tasks complete limit at a time with a backlog always waiting.
+    """
+    for _ in range(windows):
+        limit = controller.limit
+        run = service_time(limit)
+        for _ in range(limit):
+            clock.now += run / limit
+            controller.record(wall=run, duration=run, backlog=True)
+    return controller.limit
+
+
+class TestAIMDController:
+    """Test suite for AIMDController"""
+
+    def test_grows_while_throughput_scales(self):
+        """Test that independent I/O-bound work climbs to the maximum"""
+        clock = FakeClock()
+        controller = AIMDController(initial=2, maximum=24, clock=clock)
+
+        assert _simulate(controller, clock, lambda limit: 0.05) == 24
+
+    def test_shrinks_under_contention(self):
+        """Test that work serialized on a shared resource backs off"""
+        clock = FakeClock()
+        controller = AIMDController(initial=16, maximum=32, clock=clock)
+
+        # Two slots: beyond two tasks, each one just waits longer
+        _simulate(controller, clock, lambda limit: 0.01 * max(limit, 2) / 2)
+
+        levels = [limit for _, limit in controller.history[-10:]]
+        assert max(levels) <= 4
+
+    def test_backs_off_when_queued_longer_than_running(self):
+        """Test that queue delay alone triggers a multiplicative decrease"""
+        clock = FakeClock()
+        controller = AIMDController(initial=10, clock=clock)
+
+        for _ in range(10):
+            clock.now += 0.01
+            controller.record(wall=0.5, duration=0.1, backlog=True)
+
+        assert controller.limit == 7
+
+    def test_dispatch_latency_is_not_queue_delay(self):
+        """Test that time after the callable started never counts as queued"""
+        clock = FakeClock()
+        controller = AIMDController(initial=10, clock=clock)
+
+        for _ in range(10):
+            clock.now += 0.01
+            controller.record(wall=0.5, duration=0.1, backlog=True, queued=0.01)
+
+        assert controller.limit == 11
+
+    def test_holds_without_backlog(self):
+        """Test that the limit does not grow when nothing is waiting"""
+        clock = FakeClock()
+        controller = AIMDController(initial=4, clock=clock)
+
+        for _ in range(40):
+            clock.now += 0.01
+            controller.record(wall=0.04, duration=0.04, backlog=False)
+
+        assert controller.limit == 4
+
+    def test_bounds(self):
+        """Test that the limit stays within [minimum, maximum]"""
+        clock = FakeClock()
+        controller = AIMDController(initial=50, minimum=2, maximum=8, clock=clock)
+        assert controller.limit == 8
+
+        _simulate(controller, clock, lambda limit: 0.01 * limit)
+        assert all(2 <= limit <= 8 for _, limit in controller.history)
+
+
+class TestAutoWorkers:
+    """Test ParallelExecutor(max_workers="auto")"""
+
+    def test_starts_from_cpu_count(self):
+        """Test the initial level and its report in the plan"""
+        with ParallelExecutor(max_workers="auto") as executor:
+            plan = executor.plan([Task("a", "A", lambda: 1, [])])
+
+        assert executor.max_workers == AUTO_MAX_WORKERS
+        assert executor.concurrency == min(os.cpu_count() or 1, AUTO_MAX_WORKERS)
+        assert plan.workers == executor.concurrency
+
+    def test_invalid_max_workers(self):
+        """Test that bad max_workers values are rejected"""
+        for value in (0, "many", 2.5):
+            with pytest.raises(ValueError):
+                ParallelExecutor(max_workers=value)
+
+    def test_adapts_to_contended_workload(self):
+        """Test that a serialized workload lowers the in-flight limit"""
+        lock = threading.Lock()
+
+        def serialized():
+            with lock:
+                time.sleep(0.002)
+
+        tasks = [Task(f"t{i}", "Serialized", serialized, []) for i in range(400)]
+
+        with ParallelExecutor(max_workers="auto", scheduling="streaming") as executor:
+            executor.controller = AIMDController(initial=12, maximum=32)
+            results = executor.execute(executor.plan(tasks))
+
+        assert len(results) == 400
+        assert min(limit for _, limit in executor.controller.history) <= 3
+
+    def test_queue_delay_ends_when_the_callable_starts(self):
+        """Test that the executor reports hand-off-to-start delay"""
+        reports = []
+
+        with ParallelExecutor(max_workers="auto", scheduling="streaming") as executor:
+            record = executor.controller.record
+            executor.controller.record = lambda *args, **kw: (
+                reports.append((args[0], kw["queued"])) or record(*args, **kw)
+            )
+            tasks = [
+                Task(f"t{i}", "Nap", lambda: time.sleep(0.01), []) for i in range(4)
+            ]
+            executor.execute(executor.plan(tasks))
+
+        assert len(reports) == 4
+        for wall, queued in reports:
+            assert 0 <= queued < wall - 0.009
@@ -0,0 +1,292 @@
+"""
+Unit tests for AsyncParallelExecutor
+
+Tests coroutine execution, mixed sync/async plans and the event-loop
+benchmark against thread-based execution.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from superclaude.execution.async_parallel import AsyncParallelExecutor
+from superclaude.execution.parallel import ParallelExecutor, Task, TaskStatus
+
+
+async def _async_value(value, seconds=0.0):
+    await asyncio.sleep(seconds)
+    return value
+
+
+class TestAsyncParallelExecutor:
+    """Test suite for AsyncParallelExecutor class"""
+
+    def test_coroutines_run_on_one_loop(self):
+        """Test that coroutine tasks share the caller's event loop"""
+        loops = []
+
+        async def record():
+            loops.append(asyncio.get_running_loop())
+            return len(loops)
+
+        async def main():
+            with AsyncParallelExecutor() as executor:
+                tasks = [Task(f"t{i}", f"T{i}", record, []) for i in range(5)]
+                results = await executor.execute_async(executor.plan(tasks))
+            return results, asyncio.get_running_loop()
+
+        results, loop = asyncio.run(main())
+
+        assert sorted(results.values()) == [1, 2, 3, 4, 5]
+        assert all(task_loop is loop for task_loop in loops)
+
+    def test_dependencies_are_honoured(self):
+        """Test that a task waits for its async and sync dependencies"""
+        order = []
+
+        async def slow_fetch():
+            await asyncio.sleep(0.05)
+            order.append("fetch")
+            return 2
+
+        def sync_parse():
+            order.append("parse")
+            return 3
+
+        async def combine():
+            order.append("combine")
+            return "done"
+
+        with AsyncParallelExecutor() as executor:
+            tasks = [
+                Task("fetch", "Fetch", slow_fetch, []),
+                Task("parse", "Parse", sync_parse, []),
+                Task("combine", "Combine", combine, ["fetch", "parse"]),
+            ]
+            results = executor.run(executor.plan(tasks))
+
+        assert results == {"fetch": 2, "parse": 3, "combine": "done"}
+        assert order[-1] == "combine"
+
+    def test_sync_tasks_offloaded_to_threads(self):
+        """Test that sync callables do not block the event loop thread"""
+        loop_thread = []
+
+        async def on_loop():
+            loop_thread.append(threading.get_ident())
+
+        with AsyncParallelExecutor() as executor:
+            tasks = [
+                Task("loop", "Loop", on_loop, []),
+                Task("sync", "Sync", threading.get_ident, []),
+            ]
+            results = executor.run(executor.plan(tasks))
+
+        assert results["sync"] != loop_thread[0]
+
+    def test_semaphore_bounds_concurrency(self):
+        """Test that max_concurrency caps simultaneously running coroutines"""
+        active = [0, 0]  # current, peak
+
+        async def work():
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+
+        with AsyncParallelExecutor(max_concurrency=4) as executor:
+            tasks = [Task(f"t{i}", f"T{i}", work, []) for i in range(40)]
+            executor.run(executor.plan(tasks))
+
+        assert active[1] == 4
+
+    def test_failed_coroutine(self):
+        """Test that a raising coroutine is recorded as failed"""
+
+        async def boom():
+            raise RuntimeError("boom")
+
+        with AsyncParallelExecutor() as executor:
+            tasks = [Task("bad", "Bad", boom, [])]
+            results = executor.run(executor.plan(tasks))
+
+        assert results == {"bad": None}
+        assert tasks[0].status == TaskStatus.FAILED
+
+    @pytest.mark.performance
+    def test_10k_concurrent_sleeps_benchmark(self):
+        """Benchmark: 10k sleeps on one loop versus a 100-thread pool"""
+        count, delay = 10_000, 0.02
+
+        async def nap():
+            await asyncio.sleep(delay)
+
+        with AsyncParallelExecutor(max_concurrency=count) as executor:
+            plan = executor.plan([Task(f"a{i}", "nap", nap, []) for i in range(count)])
+            start = time.perf_counter()
+            executor.run(plan)
+            async_time = time.perf_counter() - start
+
+        with ParallelExecutor(max_workers=100) as executor:
+            plan = executor.plan(
+                [
+                    Task(f"t{i}", "nap", lambda: time.sleep(delay), [])
+                    for i in range(count)
+                ]
+            )
+            start = time.perf_counter()
+            executor.execute(plan)
+            thread_time = time.perf_counter() - start
+
+        # Threads need at least count / workers sequential sleeps
+        assert thread_time >= count / 100 * delay
+        assert async_time < thread_time
+
+
+class TestAsyncFailurePolicies:
+    """Test failure policies on the event loop"""
+
+    def test_skip_dependents(self):
+        """Test that dependents of a failed coroutine are skipped"""
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        tasks = [
+            Task("bad", "Fails", fail, []),
+            Task("child", "Child", lambda: "child", ["bad"]),
+            Task("grandchild", "Grandchild", lambda: "grandchild", ["child"]),
+            Task("ok", "Independent", lambda: "ok", []),
+        ]
+
+        executor = AsyncParallelExecutor(failure_policy="skip-dependents")
+        results = executor.run(executor.plan(tasks))
+
+        assert [task.status for task in tasks] == [
+            TaskStatus.FAILED,
+            TaskStatus.SKIPPED,
+            TaskStatus.SKIPPED,
+            TaskStatus.COMPLETED,
+        ]
+        assert results["ok"] == "ok"
+
+    def test_fail_fast_cancels_running_coroutines(self):
+        """Test that fail-fast cancels in-flight coroutines"""
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        tasks = [
+            Task("slow", "Slow", lambda: _async_value("slow", 5), []),
+            Task("bad", "Fails", fail, []),
+            Task("after", "After", lambda: "after", ["bad"]),
+        ]
+
+        executor = AsyncParallelExecutor(failure_policy="fail-fast")
+        start = time.perf_counter()
+        executor.run(executor.plan(tasks))
+
+        assert time.perf_counter() - start < 2
+        assert tasks[0].status == TaskStatus.CANCELLED
+        assert tasks[1].status == TaskStatus.FAILED
+        assert tasks[2].status == TaskStatus.CANCELLED
+
+
+class TestAsyncTimeouts:
+    """Test timeouts, retries and deadlines on the event loop"""
+
+    def test_coroutine_timeout_and_retry(self):
+        """Test that a slow coroutine attempt is timed out and retried"""
+        calls = []
+
+        async def slow_once():
+            calls.append(1)
+            await asyncio.sleep(5 if len(calls) == 1 else 0)
+            return len(calls)
+
+        tasks = [
+            Task("t", "Slow once", slow_once, [], timeout=0.1, retries=1),
+            Task("hung", "Hung", lambda: _async_value("x", 5), [], timeout=0.1),
+        ]
+
+        executor = AsyncParallelExecutor(retry_backoff=0.01)
+        results = executor.run(executor.plan(tasks))
+
+        assert results["t"] == 2
+        assert tasks[0].attempts == 2
+        assert tasks[1].status == TaskStatus.TIMED_OUT
+
+    def test_plan_deadline(self):
+        """Test that the deadline stops running coroutines"""
+        tasks = [Task("slow", "Slow", lambda: _async_value("slow", 5), [])]
+
+        executor = AsyncParallelExecutor(deadline=0.1)
+        start = time.perf_counter()
+        executor.run(executor.plan(tasks))
+
+        assert time.perf_counter() - start < 1
+        assert tasks[0].status == TaskStatus.TIMED_OUT
+
+
+class TestAsyncConcurrencyPools:
+    """Test named concurrency pools on the event loop"""
+
+    def test_pool_limits(self):
+        """Test that coroutines respect their pool limit"""
+        running = {"mcp": 0}
+        peak = {"mcp": 0}
+
+        async def call(pools):
+            for name in pools:
+                running[name] += 1
+                peak[name] = max(peak[name], running[name])
+            await asyncio.sleep(0.02)
+            for name in pools:
+                running[name] -= 1
+
+        tasks = [
+            Task(f"m{i}", "MCP call", lambda: call(["mcp"]), [], pools=["mcp"])
+            for i in range(6)
+        ]
+        tasks += [Task(f"o{i}", "Other", lambda: call([]), []) for i in range(6)]
+
+        executor = AsyncParallelExecutor(pool_limits={"mcp": 2})
+        start = time.perf_counter()
+        executor.run(executor.plan(tasks))
+
+        assert peak["mcp"] == 2
+        assert time.perf_counter() - start < 0.5
+
+    def test_timed_out_threads_keep_their_slot(self):
+        """Test that an abandoned attempt still running in a thread holds its slot"""
+        lock = threading.Lock()
+        running = {"mcp": 0}
+        peak = {"mcp": 0}
+
+        def call(task_id, seconds):
+            def run():
+                with lock:
+                    running["mcp"] += 1
+                    peak["mcp"] = max(peak["mcp"], running["mcp"])
+                time.sleep(seconds)
+                with lock:
+                    running["mcp"] -= 1
+                return task_id
+
+            return run
+
+        slow = Task("slow", "Slow", call("slow", 0.3), [], pools=["mcp"], timeout=0.05)
+        tasks = [slow, Task("next", "Next", call("next", 0.01), [], pools=["mcp"])]
+
+        with AsyncParallelExecutor(max_workers=4, pool_limits={"mcp": 1}) as executor:
+            start = time.perf_counter()
+            results = executor.run(executor.plan(tasks))
+            elapsed = time.perf_counter() - start
+
+        assert results == {"slow": None, "next": "next"}
+        assert peak == {"mcp": 1}
+        assert slow.status == TaskStatus.TIMED_OUT
+        assert elapsed >= 0.3
@@ -0,0 +1,123 @@
+"""
+Unit tests for the execution cost model
+
+Tests cost resolution, critical path, makespan simulation and the
+persisted duration history.
+"""
+
+import time
+
+import pytest
+
+from superclaude.execution.cost_model import (
+    DurationHistory,
+    callable_fingerprint,
+    critical_path,
+    estimate_costs,
+)
+from superclaude.execution.parallel import ParallelExecutor, Task
+
+
+def _task(task_id, depends_on=(), cost=None, description=None):
+    return Task(
+        task_id, description or task_id, lambda: None, list(depends_on), cost=cost
+    )
+
+
+class TestCostModel:
+    """Test suite for plan estimates"""
+
+    def test_critical_path_follows_most_expensive_chain(self):
+        """Test that the critical path is weighted by cost, not length"""
+        tasks = [
+            _task("a", cost=1.0),
+            _task("b", cost=5.0),
+            _task("c", ["a"], cost=1.0),
+            _task("d", ["c"], cost=1.0),
+            _task("e", ["b", "d"], cost=2.0),
+        ]
+        costs = estimate_costs(tasks)
+
+        length, path = critical_path(tasks, costs)
+
+        assert length == 7.0
+        assert path == ["b", "e"]
+
+    def test_makespan_rounds_up_partial_worker_batches(self):
+        """Test that 15 unit tasks on 10 workers take two rounds, not one"""
+        executor = ParallelExecutor(max_workers=10)
+        plan = executor.plan([_task(f"t{i}") for i in range(15)])
+
+        assert plan.sequential_time_estimate == 15.0
+        assert plan.parallel_time_estimate == 2.0
+        assert plan.speedup == 7.5
+
+    @pytest.mark.parametrize(
+        "scheduling, expected", [("waves", 8.0), ("streaming", 5.0)]
+    )
+    def test_makespan_matches_scheduling_mode(self, scheduling, expected):
+        """Test that estimates reflect the wave barrier versus streaming"""
+        tasks = [
+            _task("slow", cost=4.0),
+            _task("fast", cost=1.0),
+            _task("after_slow", ["slow"], cost=1.0),
+            _task("after_fast", ["fast"], cost=4.0),
+        ]
+        plan = ParallelExecutor(max_workers=4, scheduling=scheduling).plan(tasks)
+
+        assert plan.parallel_time_estimate == expected
+        assert plan.critical_path_time == 5.0
+
+    def test_history_supplies_missing_costs(self):
+        """Test that measured durations replace the default cost"""
+        history = DurationHistory()
+        history.record("Parse module", 3.0)
+
+        tasks = [_task("p", description="Parse module"), _task("q", cost=0.5)]
+        costs = estimate_costs(tasks, history)
+
+        assert costs == {"p": 3.0, "q": 0.5}
+
+    def test_history_moving_average(self):
+        """Test that new samples are blended into the estimate"""
+        history = DurationHistory(smoothing=0.5)
+        history.record("k", 2.0)
+        history.record("k", 4.0)
+
+        assert history.estimate("k") == 3.0
+        assert history.estimate("missing") is None
+
+    def test_history_persists(self, tmp_path):
+        """Test that history round-trips through disk"""
+        path = tmp_path / "task_durations.json"
+        history = DurationHistory(path)
+        history.record("k", 1.5)
+        history.save()
+
+        assert DurationHistory(path).estimate("k") == 1.5
+
+    def test_executor_records_measured_durations(self):
+        """Test that execute() feeds run times back into the history"""
+        history = DurationHistory()
+
+        def nap():
+            time.sleep(0.05)
+
+        with ParallelExecutor(history=history) as executor:
+            task = Task("n", "Nap", nap, [], fingerprint="tests.nap")
+            executor.execute(executor.plan([task]))
+
+            replanned = executor.plan(
+                [Task("n", "Nap", nap, [], fingerprint="tests.nap")]
+            )
+
+        assert task.duration >= 0.05
+        assert history.estimate("tests.nap") == pytest.approx(task.duration)
+        assert replanned.parallel_time_estimate == pytest.approx(task.duration)
+
+    def test_callable_fingerprint(self):
+        """Test that named callables are fingerprinted and lambdas are not"""
+        assert callable_fingerprint(critical_path) == (
+            "superclaude.execution.cost_model.critical_path"
+        )
+        assert callable_fingerprint(lambda: None) is None
@@ -0,0 +1,228 @@
+"""
+Unit tests for the distributed backend
+
+Tests DistributedPool with local worker processes over a localhost
+socket: the job protocol, worker-loss recovery and ParallelExecutor
+integration. Job callables live at module level so workers can import
+them by name.
+"""
+
+import functools
+import math
+import os
+import signal
+import sys
+import time
+
+import pytest
+
+from superclaude.execution.async_parallel import AsyncParallelExecutor
+from superclaude.execution.backends import BackendError
+from superclaude.execution.distributed import (
+    DistributedPool,
+    WorkerLostError,
+    callable_ref,
+    resolve_callable,
+)
+from superclaude.execution.parallel import ParallelExecutor, Task
+
+
+def _pid_after(delay):
+    time.sleep(delay)
+    return os.getpid()
+
+
+def _crash_once(marker):
+    """Kill the worker the first time, succeed on the re-queued run"""
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        os._exit(1)
+    return "recovered"
+
+
+def _crash():
+    os._exit(1)
+
+
+def _stall_once(marker, delay):
+    """Record the pid of the first attempt, then take a while"""
+    if not os.path.exists(marker):
+        with open(marker, "w") as f:
+            f.write(str(os.getpid()))
+    time.sleep(delay)
+    return os.getpid()
+
+
+def _fail(message):
+    raise RuntimeError(message)
+
+
+@pytest.fixture
+def pool():
+    with DistributedPool(
+        workers=2, heartbeat_interval=0.05, heartbeat_timeout=1.0
+    ) as pool:
+        yield pool
+
+
+class TestCallableRefs:
+    """Test suite for importable callable references"""
+
+    def test_round_trip(self):
+        """Test that module-level callables resolve back to themselves"""
+        for func in (math.factorial, _pid_after, os.path.join):
+            assert resolve_callable(callable_ref(func)) is func
+
+    @pytest.mark.parametrize(
+        "func", [lambda: None, functools.partial(lambda x: x, 1).func, print.__call__]
+    )
+    def test_rejects_unimportable(self, func):
+        """Test that lambdas and other anonymous callables are refused"""
+        with pytest.raises(BackendError):
+            callable_ref(func)
+
+
+class TestDistributedPool:
+    """Test suite for DistributedPool"""
+
+    def test_results_and_errors(self, pool):
+        """Test results, partial arguments and remote exceptions"""
+        assert pool.submit(pow, 2, 10).result(timeout=30) == 1024
+
+        futures = [pool.submit(math.factorial, n) for n in range(50)]
+        assert [f.result(timeout=30) for f in futures] == [
+            math.factorial(n) for n in range(50)
+        ]
+
+        square = functools.partial(pow, exp=2)
+        assert pool.submit(square, 12).result(timeout=30) == 144
+
+        with pytest.raises(RuntimeError, match="remote boom"):
+            pool.submit(_fail, "remote boom").result(timeout=30)
+
+    def test_submit_timed(self, pool):
+        """Test that timed futures report the worker-side run time"""
+        pid, seconds, worker = pool.submit_timed(_pid_after, 0.05).result(timeout=30)
+
+        assert pid != os.getpid()
+        assert seconds >= 0.05
+        assert worker.endswith(f":{pid}")
+
+    def test_spreads_across_workers(self, pool):
+        """Test that concurrent jobs land on different worker processes"""
+        futures = [pool.submit(_pid_after, 0.2) for _ in range(4)]
+
+        assert len({f.result(timeout=30) for f in futures}) == 2
+
+    def test_requeues_after_worker_crash(self, pool, tmp_path):
+        """Test that a job whose worker dies runs again elsewhere"""
+        future = pool.submit(_crash_once, str(tmp_path / "crashed"))
+
+        assert future.result(timeout=30) == "recovered"
+        assert pool.requeued == 1
+
+        # The lost worker was replaced
+        futures = [pool.submit(_pid_after, 0.2) for _ in range(2)]
+        assert len({f.result(timeout=30) for f in futures}) == 2
+
+    def test_gives_up_after_max_requeues(self):
+        """Test that a job killing every worker eventually fails"""
+        with DistributedPool(workers=1, max_requeues=1) as pool:
+            with pytest.raises(WorkerLostError):
+                pool.submit(_crash).result(timeout=30)
+            assert pool.requeued == 1
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="needs SIGSTOP")
+    def test_requeues_after_missed_heartbeats(self, pool, tmp_path):
+        """Test that a hung worker is dropped and its job re-queued"""
+        marker = tmp_path / "first_pid"
+        future = pool.submit(_stall_once, str(marker), 0.5)
+
+        deadline = time.monotonic() + 30
+        while not marker.exists() or not marker.read_text():
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        stalled = int(marker.read_text())
+        os.kill(stalled, signal.SIGSTOP)
+
+        try:
+            assert future.result(timeout=30) != stalled
+            assert pool.requeued == 1
+        finally:
+            os.kill(stalled, signal.SIGKILL)
+
+    def test_rejects_unimportable_jobs(self, pool):
+        """Test that unimportable callables fail at submission"""
+        with pytest.raises(BackendError):
+            pool.submit(lambda: 1)
+
+    def test_submit_after_shutdown(self):
+        """Test that a shut-down pool refuses new jobs"""
+        pool = DistributedPool(workers=0)
+        pool.shutdown()
+
+        with pytest.raises(RuntimeError):
+            pool.submit(pow, 2, 2)
+
+
+class TestDistributedExecutor:
+    """Test ParallelExecutor(backend="distributed")"""
+
+    def test_executes_plan(self, pool):
+        """Test a dependent plan with results and failures on workers"""
+        tasks = [
+            Task("a", "Factorial", functools.partial(math.factorial, 10), []),
+            Task("b", "Pid", functools.partial(_pid_after, 0), ["a"]),
+            Task("c", "Fails", functools.partial(_fail, "bad"), ["a"]),
+        ]
+
+        with ParallelExecutor(
+            backend="distributed", distributed_pool=pool, scheduling="streaming"
+        ) as executor:
+            results = executor.execute(executor.plan(tasks))
+
+        assert results["a"] == 3628800
+        assert results["b"] != os.getpid()
+        assert results["c"] is None
+        assert str(tasks[2].error) == "bad"
+        assert tasks[0].duration is not None
+
+    def test_async_executor(self, pool):
+        """Test that the event-loop executor awaits distributed tasks"""
+        tasks = [
+            Task("a", "Pow", functools.partial(pow, 2, 8), []),
+            Task("b", "Pid", functools.partial(_pid_after, 0), ["a"]),
+        ]
+        executor = AsyncParallelExecutor(backend="distributed", distributed_pool=pool)
+
+        results = executor.run(executor.plan(tasks))
+
+        assert results["a"] == 256
+        assert results["b"] != os.getpid()
+
+    def test_map(self, pool):
+        """Test that map() sends chunks to the workers"""
+        executor = ParallelExecutor(backend="distributed", distributed_pool=pool)
+
+        squares = list(executor.map(functools.partial(pow, exp=2), range(100), 10))
+
+        assert squares == [n * n for n in range(100)]
+
+    def test_rejects_lambdas_up_front(self):
+        """Test that unimportable tasks fail before anything runs"""
+        tasks = [Task("a", "Lambda", lambda: 1, [])]
+
+        with ParallelExecutor(backend="distributed") as executor:
+            with pytest.raises(BackendError, match="distributed"):
+                executor.execute(executor.plan(tasks))
+
+    def test_owns_local_pool(self):
+        """Test that an executor starts and stops its own local workers"""
+        tasks = [Task("a", "Pow", functools.partial(pow, 3, 3), [])]
+
+        with ParallelExecutor(max_workers=2, backend="distributed") as executor:
+            assert executor.execute(executor.plan(tasks)) == {"a": 27}
+            pool = executor._own_distributed_pool
+
+        with pytest.raises(RuntimeError):
+            pool.submit(pow, 2, 2)
@@ -0,0 +1,209 @@
+"""
+Unit tests for execution events
+
+Tests event emission from the executors and engines, the console
+renderer and the overhead of emitting with no listeners.
+"""
+
+import io
+import time
+
+import pytest
+
+from superclaude.execution.async_parallel import AsyncParallelExecutor
+from superclaude.execution.events import ConsoleRenderer, EventBus, TaskStarted
+from superclaude.execution.parallel import ParallelExecutor, Task
+from superclaude.execution.reflection import ReflectionEngine
+
+
+def _fail():
+    raise RuntimeError("boom")
+
+
+def _chain():
+    return [
+        Task("a", "Task A", lambda: "a", []),
+        Task("b", "Task B", lambda: "b", ["a"]),
+        Task("c", "Task C", _fail, ["b"]),
+    ]
+
+
+class TestEventBus:
+    """Test suite for EventBus and event emission"""
+
+    def test_silent_by_default(self, capsys):
+        """Test that executors print nothing without a listener"""
+        with ParallelExecutor() as executor:
+            executor.execute(executor.plan(_chain()))
+
+        assert capsys.readouterr().out == ""
+
+    def test_subscribe_and_unsubscribe(self):
+        """Test that listening follows the listener list"""
+        events = EventBus()
+        assert not events.listening
+
+        listener = events.subscribe(lambda event: None)
+        assert events.listening
+
+        events.unsubscribe(listener)
+        assert not events.listening
+
+    @pytest.mark.parametrize("scheduling", ["waves", "streaming"])
+    def test_executor_event_sequence(self, scheduling):
+        """Test the typed events emitted for one plan"""
+        seen = []
+        events = EventBus(seen.append)
+
+        with ParallelExecutor(scheduling=scheduling, events=events) as executor:
+            executor.execute(executor.plan(_chain()))
+
+        kinds = [event.kind for event in seen]
+        assert kinds[0] == "plan_created"
+        assert kinds[1] == "execution_started"
+        assert kinds[-1] == "execution_finished"
+        assert kinds.count("task_started") == 3
+        assert kinds.count("task_finished") == 3
+
+        finished = [e.task.id for e in seen if e.kind == "task_finished"]
+        assert finished == ["a", "b", "c"]
+
+        if scheduling == "waves":
+            assert kinds.count("group_started") == 3
+            assert kinds.count("group_finished") == 3
+        else:
+            assert "group_started" not in kinds
+
+    def test_async_executor_events(self):
+        """Test that the event-loop executor reports every task"""
+        seen = []
+        executor = AsyncParallelExecutor(events=EventBus(seen.append))
+        executor.run(executor.plan(_chain()))
+
+        kinds = [event.kind for event in seen]
+        assert kinds.count("task_started") == 3
+        assert kinds.count("task_finished") == 3
+        assert kinds[-1] == "execution_finished"
+
+    def test_retry_event(self):
+        """Test that retried attempts are reported before the final status"""
+        seen = []
+        tasks = [Task("bad", "Fails", _fail, [], retries=1)]
+
+        events = EventBus(seen.append)
+        with ParallelExecutor(retry_backoff=0.01, events=events) as executor:
+            executor.execute(executor.plan(tasks))
+
+        kinds = [event.kind for event in seen if event.kind.startswith("task_")]
+        assert kinds == [
+            "task_started",
+            "task_retrying",
+            "task_started",
+            "task_finished",
+        ]
+
+    def test_reflection_scored(self, tmp_path):
+        """Test that ReflectionEngine reports its confidence score"""
+        seen = []
+        engine = ReflectionEngine(tmp_path, events=EventBus(seen.append))
+
+        confidence = engine.reflect("Add a docstring to utils.py")
+
+        assert [event.kind for event in seen] == ["reflection_scored"]
+        assert seen[0].confidence is confidence
+
+
+class TestConsoleRenderer:
+    """Test suite for ConsoleRenderer"""
+
+    def test_renders_task_outcomes(self):
+        """Test that the renderer writes the classic progress lines"""
+        stream = io.StringIO()
+        events = EventBus(ConsoleRenderer(stream))
+
+        with ParallelExecutor(events=events) as executor:
+            executor.execute(executor.plan(_chain()))
+
+        output = stream.getvalue()
+        assert "🚀 Executing 3 tasks" in output
+        assert "✅ Task A" in output
+        assert "❌ Task C: boom" in output
+        assert "❌ 2/3 tasks completed" in output
+        assert "Failed: 1" in output
+        assert "All tasks completed" not in output
+
+    def test_summary_of_a_clean_run(self):
+        """Test that only a run without failures reports full completion"""
+        stream = io.StringIO()
+        tasks = [Task(name, name, lambda: None, []) for name in "ab"]
+
+        with ParallelExecutor(events=EventBus(ConsoleRenderer(stream))) as executor:
+            executor.execute(executor.plan(tasks))
+
+        assert "✅ All tasks completed" in stream.getvalue()
+        assert "Failed" not in stream.getvalue()
+
+    def test_ignores_unknown_events(self):
+        """Test that events without a renderer are skipped"""
+        stream = io.StringIO()
+        renderer = ConsoleRenderer(stream)
+
+        class Custom:
+            kind = "custom"
+
+        renderer(Custom())
+        assert stream.getvalue() == ""
+
+
+class TestEventOverhead:
+    """Benchmarks for event emission cost"""
+
+    @pytest.mark.performance
+    def test_unobserved_emit_site_is_free(self):
+        """Benchmark: a guarded emit site costs ~nothing with no listeners"""
+        events = EventBus()
+        task = Task("t", "Task", lambda: None, [])
+        rounds = 200_000
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            pass
+        baseline = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            if events.listening:
+                events.emit(TaskStarted(task))
+        guarded = time.perf_counter() - start
+
+        # An attribute check: tens of nanoseconds, no event is built
+        assert (guarded - baseline) / rounds < 0.5e-6
+
+    @pytest.mark.performance
+    def test_no_listener_execution_overhead(self):
+        """Benchmark: unobserved execution is no slower than observed"""
+        count = 20_000
+        tasks = [
+            Task(f"t{i}", f"Task {i}", lambda: None, [], backend="inline")
+            for i in range(count)
+        ]
+
+        received = []
+        silent_events, observed_events = EventBus(), EventBus(received.append)
+        best = {}
+
+        with ParallelExecutor(scheduling="streaming") as executor:
+            plan = executor.plan(tasks)
+            # Interleave runs so machine noise hits both sides alike
+            for _ in range(5):
+                for events in (silent_events, observed_events):
+                    executor.events = events
+                    start = time.perf_counter()
+                    executor.execute(plan)
+                    elapsed = time.perf_counter() - start
+                    best[events] = min(best.get(events, elapsed), elapsed)
+
+        silent, observed = best[silent_events], best[observed_events]
+        assert len(received) > 2 * count
+        assert silent < observed * 1.25
+        assert silent / count < 100e-6
@@ -0,0 +1,170 @@
+"""
+Unit tests for the execution journal
+
+Tests journal records, torn-write recovery, compaction and resuming
+interrupted executions.
+"""
+
+import pytest
+
+from superclaude.execution.journal import ExecutionJournal
+from superclaude.execution.parallel import ParallelExecutor, Task, TaskStatus
+
+
+def _chain(calls, fail_at=None):
+    """Three dependent tasks recording their calls; one may fail"""
+
+    def step(name):
+        def run():
+            calls.append(name)
+            if name == fail_at:
+                raise RuntimeError(f"{name} crashed")
+            return name.upper()
+
+        return run
+
+    return [
+        Task("a", "Step a", step("a"), []),
+        Task("b", "Step b", step("b"), ["a"]),
+        Task("c", "Step c", step("c"), ["b"]),
+    ]
+
+
+def _job(task_id, description=None):
+    """Task with a stable identity but no callable"""
+    return Task(task_id, description or task_id.upper(), None, [], fingerprint="job")
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return ExecutionJournal(tmp_path / "run.journal")
+
+
+class TestExecutionJournal:
+    """Test suite for ExecutionJournal"""
+
+    def test_record_and_restore(self, journal):
+        """Test that results come back only for tasks with the same key"""
+        journal.record(_job("a", "Parse"), {"lines": 3})
+        other = _job("a", "Parse")
+        other.fingerprint = "other-job"
+
+        assert journal.restore([_job("a", "Parse")]) == {"a": {"lines": 3}}
+        assert journal.restore([_job("a", "Reparse")]) == {}
+        assert journal.restore([_job("b", "Parse")]) == {}
+        assert journal.restore([other]) == {}
+
+    def test_unstorable_results_are_not_recorded(self, journal):
+        """Test that results JSON cannot hold exactly are skipped"""
+        assert not journal.record(_job("a"), lambda: None)
+        assert not journal.record(_job("b"), ("a", 1))
+        assert len(journal) == 0
+
+    def test_anonymous_tasks_are_not_recorded(self, journal):
+        """Test that tasks without an identity never reuse results"""
+        anonymous = Task("a", "Operation 1", lambda: 1, [])
+
+        assert not journal.record(anonymous, 1)
+        anonymous.fingerprint = "count"
+        assert journal.record(anonymous, 1)
+        assert journal.restore([Task("a", "Operation 1", lambda: 2, [])]) == {}
+
+    def test_pickles_are_opt_in(self, journal, monkeypatch):
+        """Test that pickled results are only written and read when allowed"""
+        private = ExecutionJournal(journal.path, allow_pickle=True)
+        assert private.record(_job("a"), ("a", 1))
+        assert private.restore([_job("a")]) == {"a": ("a", 1)}
+
+        monkeypatch.setattr(
+            "pickle.loads", lambda *args: pytest.fail("pickle was loaded")
+        )
+        assert journal.restore([_job("a")]) == {}
+
+    def test_torn_tail_is_dropped(self, journal):
+        """Test that a record cut short by a crash is ignored and repaired"""
+        journal.record(_job("a"), "first")
+        journal.record(_job("b"), "second")
+        data = journal.path.read_bytes()
+        journal.path.write_bytes(data[:-3])
+
+        reopened = ExecutionJournal(journal.path)
+        assert len(reopened) == 1
+
+        reopened.record(_job("c"), "third")
+        tasks = [_job(name) for name in "abc"]
+        assert reopened.restore(tasks) == {"a": "first", "c": "third"}
+
+    def test_compact_keeps_last_record_per_task(self, journal):
+        """Test that compaction shrinks the file to one record per task"""
+        task = _job("a")
+        for i in range(20):
+            journal.record(task, "x" * 100 + str(i))
+        size = journal.path.stat().st_size
+
+        journal.compact()
+
+        assert journal.path.stat().st_size < size / 10
+        assert journal.restore([task]) == {"a": "x" * 100 + "19"}
+
+    def test_for_repo(self, tmp_path):
+        """Test that named journals live under docs/memory"""
+        journal = ExecutionJournal.for_repo(tmp_path, "nightly index")
+        journal.record(_job("a"), 1)
+
+        assert journal.path.parent == tmp_path / "docs" / "memory" / "journals"
+        assert journal.path != ExecutionJournal.for_repo(tmp_path, "other").path
+
+        journal.discard()
+        assert not journal.path.exists()
+
+
+class TestResume:
+    """Test resuming executions from a journal"""
+
+    @pytest.mark.parametrize("scheduling", ["waves", "streaming"])
+    def test_resume_skips_finished_tasks(self, journal, scheduling):
+        """Test that a rerun after a failure only runs what is left"""
+        calls = []
+        with ParallelExecutor(scheduling=scheduling) as executor:
+            tasks = _chain(calls, fail_at="b")
+            results = executor.execute(executor.plan(tasks), resume_from=journal)
+            assert results == {"a": "A", "b": None, "c": "C"}
+
+            calls.clear()
+            tasks = _chain(calls)
+            results = executor.execute(executor.plan(tasks), resume_from=journal)
+
+        assert results == {"a": "A", "b": "B", "c": "C"}
+        assert calls == ["b"]
+        assert tasks[0].status == TaskStatus.COMPLETED
+        assert tasks[0].attempts == 0
+
+    def test_interrupted_iteration_resumes(self, journal):
+        """Test that abandoning execute_iter keeps what completed"""
+        calls = []
+        with ParallelExecutor() as executor:
+            for outcome in executor.execute_iter(
+                executor.plan(_chain(calls)), resume_from=journal
+            ):
+                if outcome.task_id == "b":
+                    break
+
+            calls.clear()
+            tasks = _chain(calls)
+            results = executor.execute(executor.plan(tasks), resume_from=journal)
+
+        assert results == {"a": "A", "b": "B", "c": "C"}
+        assert calls == ["c"]
+
+    def test_changed_task_is_rerun(self, journal):
+        """Test that a task whose description changed runs again"""
+        calls = []
+        with ParallelExecutor() as executor:
+            executor.execute(executor.plan(_chain(calls)), resume_from=journal)
+
+            calls.clear()
+            tasks = _chain(calls)
+            tasks[2].description = "Step c, revised"
+            executor.execute(executor.plan(tasks), resume_from=journal)
+
+        assert calls == ["c"]
@@ -0,0 +1,1045 @@
+"""
+Unit tests for ParallelExecutor
+
+Tests dependency planning and scheduling of the parallel execution engine.
+"""
+
+import functools
+import hashlib
+import os
+import random
+import threading
+import time
+
+import pytest
+
+from superclaude.execution.backends import BackendError, SharedBytes
+from superclaude.execution.parallel import (
+    CancellationToken,
+    CircularDependencyError,
+    ParallelExecutor,
+    Task,
+    TaskCancelledError,
+    TaskStatus,
+    TaskTimeoutError,
+    get_shared_pool,
+    iter_file_operations,
+    parallel_file_operations,
+    shutdown_shared_pool,
+)
+
+
+def _sleeper(value, seconds):
+    """Build a task callable that sleeps then returns value"""
+
+    def run():
+        time.sleep(seconds)
+        return value
+
+    return run
+
+
+def _digest(data: bytes) -> str:
+    """CPU-bound, picklable task body for the process backend"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _big_payload(size: int) -> bytes:
+    """Picklable task body returning a large bytes payload"""
+    return b"x" * size
+
+
+def _uneven_graph():
+    """
+    Two independent chains with uneven durations
+
+    slow (0.4s) -> after_slow (0s)
+    fast (0s)   -> after_fast (0.4s)
+
+    Waves: max(0.4, 0) + max(0, 0.4) = 0.8s
+    Streaming: critical path = 0.4s
+    """
+    return [
+        Task("slow", "Slow root", _sleeper("slow", 0.4), []),
+        Task("fast", "Fast root", _sleeper("fast", 0.0), []),
+        Task("after_slow", "After slow", _sleeper("after_slow", 0.0), ["slow"]),
+        Task("after_fast", "After fast", _sleeper("after_fast", 0.4), ["fast"]),
+    ]
+
+
+class TestParallelExecutor:
+    """Test suite for ParallelExecutor class"""
+
+    def test_plan_groups_by_dependency_level(self):
+        """Test that plan() groups tasks into dependency waves"""
+        executor = ParallelExecutor()
+        tasks = [
+            Task("a", "A", lambda: 1, []),
+            Task("b", "B", lambda: 2, []),
+            Task("c", "C", lambda: 3, ["a", "b"]),
+            Task("d", "D", lambda: 4, ["c"]),
+        ]
+
+        plan = executor.plan(tasks)
+
+        assert [[t.id for t in g.tasks] for g in plan.groups] == [
+            ["a", "b"],
+            ["c"],
+            ["d"],
+        ]
+
+    def test_plan_reports_exact_cycle_members(self):
+        """Test that only tasks on a cycle are reported, not their dependents"""
+        executor = ParallelExecutor()
+        tasks = [
+            Task("root", "Root", lambda: 0, []),
+            Task("a", "A", lambda: 1, ["root", "c"]),
+            Task("b", "B", lambda: 2, ["a"]),
+            Task("c", "C", lambda: 3, ["b"]),
+            Task("downstream", "Downstream", lambda: 4, ["c"]),
+            Task("self", "Self loop", lambda: 5, ["self"]),
+        ]
+
+        with pytest.raises(CircularDependencyError) as exc_info:
+            executor.plan(tasks)
+
+        assert sorted(exc_info.value.cycles) == [["a", "b", "c"], ["self"]]
+
+    def test_plan_rejects_unknown_dependency(self):
+        """Test that depending on a missing task is reported explicitly"""
+        executor = ParallelExecutor()
+
+        with pytest.raises(ValueError, match="Unknown dependencies"):
+            executor.plan([Task("a", "A", lambda: 1, ["ghost"])])
+
+    def test_plan_rejects_duplicate_ids(self):
+        """Test that duplicate task ids are rejected"""
+        executor = ParallelExecutor()
+
+        with pytest.raises(ValueError, match="Duplicate task id"):
+            executor.plan(
+                [Task("a", "A", lambda: 1, []), Task("a", "A", lambda: 2, [])]
+            )
+
+    @pytest.mark.performance
+    def test_plan_100k_tasks_benchmark(self):
+        """Benchmark: planning 100k tasks is linear and well under a second"""
+        count, width = 100_000, 1_000
+        tasks = []
+        for i in range(count):
+            layer, column = divmod(i, width)
+            depends_on = []
+            if layer:
+                base = (layer - 1) * width
+                depends_on = [f"t{base + column}", f"t{base + (column + 1) % width}"]
+            tasks.append(Task(f"t{i}", f"Task {i}", None, depends_on))
+        executor = ParallelExecutor()
+
+        start = time.perf_counter()
+        plan = executor.plan(tasks)
+        elapsed = time.perf_counter() - start
+
+        assert plan.total_tasks == count
+        assert len(plan.groups) == count // width
+        assert elapsed < 1.0
+
+    def test_unknown_scheduling_mode(self):
+        """Test that an unknown scheduling mode is rejected"""
+        with pytest.raises(ValueError):
+            ParallelExecutor(scheduling="eager")
+
+    @pytest.mark.parametrize("scheduling", ["waves", "streaming"])
+    def test_execute_returns_all_results(self, scheduling):
+        """Test that both scheduling modes produce every result"""
+        executor = ParallelExecutor(max_workers=4, scheduling=scheduling)
+        tasks = _uneven_graph()
+
+        results = executor.execute(executor.plan(tasks))
+
+        assert results == {t.id: t.id for t in tasks}
+        assert all(t.status == TaskStatus.COMPLETED for t in tasks)
+
+    def test_streaming_respects_dependencies(self):
+        """Test that a dependent task never starts before its dependency ends"""
+        finished = {}
+
+        def record(name, seconds):
+            def run():
+                time.sleep(seconds)
+                finished[name] = time.perf_counter()
+                return name
+
+            return run
+
+        started = {}
+
+        def child():
+            started["child"] = time.perf_counter()
+            return "child"
+
+        executor = ParallelExecutor(max_workers=4, scheduling="streaming")
+        tasks = [
+            Task("p1", "Parent 1", record("p1", 0.05), []),
+            Task("p2", "Parent 2", record("p2", 0.15), []),
+            Task("child", "Child", child, ["p1", "p2"]),
+        ]
+
+        executor.execute(executor.plan(tasks))
+
+        assert started["child"] >= finished["p2"]
+
+    def test_streaming_beats_wave_barrier(self):
+        """Test that streaming wall time tracks the critical path"""
+        timings = {}
+
+        for scheduling in ("waves", "streaming"):
+            executor = ParallelExecutor(max_workers=4, scheduling=scheduling)
+            plan = executor.plan(_uneven_graph())
+
+            start = time.perf_counter()
+            executor.execute(plan)
+            timings[scheduling] = time.perf_counter() - start
+
+        assert timings["waves"] >= 0.8
+        assert timings["streaming"] < 0.7
+
+    def test_failed_task_result_is_none(self):
+        """Test that a failing task records None and its error"""
+
+        def boom():
+            raise RuntimeError("boom")
+
+        executor = ParallelExecutor(scheduling="streaming")
+        tasks = [Task("bad", "Bad", boom, []), Task("ok", "OK", lambda: 1, [])]
+
+        results = executor.execute(executor.plan(tasks))
+
+        assert results == {"bad": None, "ok": 1}
+        assert tasks[0].status == TaskStatus.FAILED
+        assert isinstance(tasks[0].error, RuntimeError)
+
+
+class TestWorkerPool:
+    """Test suite for executor-owned and shared worker pools"""
+
+    def test_pool_reused_across_executions(self):
+        """Test that one pool serves every execute() call"""
+        executor = ParallelExecutor(max_workers=2)
+
+        executor.execute(executor.plan([Task("a", "A", lambda: 1, [])]))
+        pool = executor._pool
+        executor.execute(executor.plan([Task("b", "B", lambda: 2, [])]))
+
+        assert pool is not None
+        assert executor._pool is pool
+        executor.shutdown()
+
+    def test_context_manager_shuts_down(self):
+        """Test that leaving the context releases the pool"""
+        with ParallelExecutor(max_workers=2) as executor:
+            results = executor.execute(executor.plan([Task("a", "A", lambda: 1, [])]))
+
+        assert results == {"a": 1}
+        assert executor._pool is None
+
+        with pytest.raises(RuntimeError):
+            executor.execute(executor.plan([Task("b", "B", lambda: 2, [])]))
+
+        # shutdown() is idempotent
+        executor.shutdown()
+
+    def test_max_workers_bounds_in_flight_tasks(self):
+        """Test that an executor never runs more than max_workers at once"""
+        lock = threading.Lock()
+        active = [0, 0]  # current, peak
+
+        def work():
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+
+        with ParallelExecutor(max_workers=3, shared_pool=True) as executor:
+            tasks = [Task(f"t{i}", f"T{i}", work, []) for i in range(20)]
+            executor.execute(executor.plan(tasks))
+
+        assert active[1] <= 3
+
+    def test_shared_pool_is_process_wide(self):
+        """Test that shared executors submit to the same pool"""
+        names = set()
+
+        def record():
+            names.add(threading.current_thread().name)
+
+        for _ in range(3):
+            with ParallelExecutor(shared_pool=True) as executor:
+                executor.execute(executor.plan([Task("a", "A", record, [])]))
+
+        assert executor._pool is None
+        assert all(name.startswith("superclaude-shared") for name in names)
+        assert get_shared_pool() is get_shared_pool()
+
+    def test_nested_shared_execution(self):
+        """Test that executing from inside a shared worker does not deadlock"""
+
+        def nested():
+            with ParallelExecutor(shared_pool=True) as inner:
+                tasks = [Task(f"n{i}", f"N{i}", lambda i=i: i, []) for i in range(4)]
+                return sum(inner.execute(inner.plan(tasks)).values())
+
+        with ParallelExecutor(shared_pool=True) as executor:
+            tasks = [Task(f"o{i}", f"O{i}", nested, []) for i in range(64)]
+            results = executor.execute(executor.plan(tasks))
+
+        assert set(results.values()) == {6}
+
+    def test_shutdown_shared_pool_recreates(self):
+        """Test that the shared pool is recreated after shutdown"""
+        pool = get_shared_pool()
+        shutdown_shared_pool()
+
+        assert get_shared_pool() is not pool
+
+
+class TestBackends:
+    """Test suite for thread, process and inline execution backends"""
+
+    def test_process_backend_runs_in_worker_process(self):
+        """Test that process-backed tasks run outside the parent process"""
+        with ParallelExecutor(max_workers=2, backend="process") as executor:
+            tasks = [
+                Task("pid", "Worker pid", os.getpid, []),
+                Task("hash", "Hash", functools.partial(_digest, b"abc"), []),
+            ]
+            results = executor.execute(executor.plan(tasks))
+
+        assert results["pid"] != os.getpid()
+        assert results["hash"] == hashlib.sha256(b"abc").hexdigest()
+
+    def test_process_backend_rejects_lambda(self):
+        """Test that lambdas fail fast with a clear error before anything runs"""
+        ran = []
+        tasks = [
+            Task("ok", "OK", lambda: ran.append(1), [], backend="thread"),
+            Task("bad", "Lambda", lambda: 1, [], backend="process"),
+        ]
+
+        with ParallelExecutor() as executor:
+            with pytest.raises(BackendError, match="lambda"):
+                executor.execute(executor.plan(tasks))
+
+        assert ran == []
+
+    def test_process_backend_rejects_unpicklable(self):
+        """Test that nested functions are reported as unpicklable"""
+
+        def nested():
+            return 1
+
+        with ParallelExecutor(backend="process") as executor:
+            with pytest.raises(BackendError, match="not picklable"):
+                executor.execute(executor.plan([Task("n", "Nested", nested, [])]))
+
+    def test_large_bytes_come_back_in_shared_memory(self):
+        """Test that large process results are returned without copying"""
+        size = 2 << 20
+
+        with ParallelExecutor(backend="process", max_workers=1) as executor:
+            task = Task("blob", "Blob", functools.partial(_big_payload, size), [])
+            results = executor.execute(executor.plan([task]))
+
+        payload = results["blob"]
+        assert isinstance(payload, SharedBytes)
+        assert len(payload) == size
+
+        with payload:
+            view = payload.view
+            assert view[:3] == b"xxx"
+            view.release()
+
+    def test_inline_backend_runs_in_calling_thread(self):
+        """Test that inline tasks skip the pool entirely"""
+        caller = threading.get_ident()
+
+        with ParallelExecutor(backend="inline") as executor:
+            tasks = [Task("t", "Thread id", threading.get_ident, [])]
+            results = executor.execute(executor.plan(tasks))
+
+        assert results["t"] == caller
+        assert executor._pool is None
+
+    def test_unknown_backend(self):
+        """Test that unknown backends are rejected"""
+        with pytest.raises(BackendError):
+            ParallelExecutor(backend="gpu")
+
+
+def _random_dag(seed, count=80, unit=0.01):
+    """
+    Random DAG with exponentially distributed costs, in shuffled order
+
+    Every task sleeps for its cost times ``unit`` seconds.
+    """
+    rng = random.Random(seed)
+    tasks = []
+    for i in range(count):
+        parents = rng.sample(range(i), min(i, rng.randint(0, 2)))
+        cost = rng.expovariate(1)
+        tasks.append(
+            Task(
+                f"t{i}",
+                f"T{i}",
+                _sleeper(i, cost * unit),
+                [f"t{p}" for p in parents],
+                cost=cost,
+            )
+        )
+    rng.shuffle(tasks)
+    return tasks
+
+
+class TestOrdering:
+    """Test suite for FIFO versus critical-path-first ordering"""
+
+    def _chain_and_fillers(self, unit):
+        """Four independent fillers listed before a three-task chain"""
+        tasks = [Task(f"s{i}", f"Filler {i}", _sleeper(i, unit), []) for i in range(4)]
+        tasks += [
+            Task("c1", "Chain 1", _sleeper("c1", unit), []),
+            Task("c2", "Chain 2", _sleeper("c2", unit), ["c1"]),
+            Task("c3", "Chain 3", _sleeper("c3", unit), ["c2"]),
+        ]
+        for task in tasks:
+            task.cost = unit
+        return tasks
+
+    def test_unknown_ordering(self):
+        """Test that an unknown ordering is rejected"""
+        with pytest.raises(ValueError):
+            ParallelExecutor(ordering="lifo")
+
+    @pytest.mark.parametrize("ordering, expected", [("fifo", 5), ("critical_path", 4)])
+    def test_estimate_reflects_ordering(self, ordering, expected):
+        """Test that the simulated makespan uses the selected ordering"""
+        executor = ParallelExecutor(
+            max_workers=2, scheduling="streaming", ordering=ordering
+        )
+        plan = executor.plan(self._chain_and_fillers(1.0))
+
+        assert plan.parallel_time_estimate == expected
+
+    def test_long_chain_starts_first(self):
+        """Test that critical-path ordering starts the chain with the first pair"""
+        first_pair = {}
+
+        for ordering in ("fifo", "critical_path"):
+            started = []
+            tasks = self._chain_and_fillers(0.05)
+            for task in tasks:
+                task.execute = functools.partial(
+                    lambda name, run: started.append(name) or run(),
+                    task.id,
+                    task.execute,
+                )
+
+            with ParallelExecutor(
+                max_workers=2, scheduling="streaming", ordering=ordering
+            ) as executor:
+                executor.execute(executor.plan(tasks))
+            first_pair[ordering] = set(started[:2])
+
+        assert first_pair == {"fifo": {"s0", "s1"}, "critical_path": {"c1", "s0"}}
+
+    def test_explicit_priority_wins(self):
+        """Test that Task.priority overrides downstream path length"""
+        started = []
+
+        def record(name):
+            return lambda: started.append(name)
+
+        tasks = [
+            Task("head", "Chain head", record("head"), []),
+            Task("tail", "Chain tail", record("tail"), ["head"]),
+            Task("urgent", "Urgent", record("urgent"), [], priority=10),
+        ]
+
+        with ParallelExecutor(max_workers=1, ordering="critical_path") as executor:
+            executor.execute(executor.plan(tasks))
+
+        assert started == ["urgent", "head", "tail"]
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("scheduling", ["waves", "streaming"])
+    def test_random_dag_benchmark(self, scheduling):
+        """Benchmark: critical-path-first versus FIFO on randomized DAGs"""
+        measured = {"fifo": 0.0, "critical_path": 0.0}
+        estimated = {"fifo": 0.0, "critical_path": 0.0}
+
+        for seed in range(5):
+            for ordering in measured:  # Interleaved, so noise hits both alike
+                with ParallelExecutor(
+                    max_workers=4, scheduling=scheduling, ordering=ordering
+                ) as executor:
+                    plan = executor.plan(_random_dag(seed))
+                    start = time.perf_counter()
+                    executor.execute(plan)
+                    measured[ordering] += time.perf_counter() - start
+                estimated[ordering] += plan.parallel_time_estimate
+
+        assert measured["critical_path"] < measured["fifo"]
+        assert estimated["critical_path"] < estimated["fifo"]
+
+
+def _fail():
+    raise RuntimeError("boom")
+
+
+class TestFailurePolicies:
+    """Test failure policies, downstream pruning and cancellation"""
+
+    def test_unknown_policy_rejected(self):
+        """Test that an unknown failure policy is a ValueError"""
+        with pytest.raises(ValueError, match="failure policy"):
+            ParallelExecutor(failure_policy="retry")
+
+    @pytest.mark.parametrize("scheduling", ["waves", "streaming"])
+    def test_continue_runs_dependents(self, scheduling):
+        """Test that the default policy still runs dependents of a failure"""
+        ran = []
+        tasks = [
+            Task("bad", "Fails", _fail, []),
+            Task("child", "Child", lambda: ran.append("child"), ["bad"]),
+        ]
+
+        with ParallelExecutor(scheduling=scheduling) as executor:
+            executor.execute(executor.plan(tasks))
+
+        assert tasks[0].status == TaskStatus.FAILED
+        assert ran == ["child"]
+
+    @pytest.mark.parametrize("scheduling", ["waves", "streaming"])
+    def test_skip_dependents_prunes_subtree(self, scheduling):
+        """Test that the transitive dependents of a failure are skipped"""
+        ran = []
+
+        def record(name):
+            return lambda: ran.append(name) or name
+
+        tasks = [
+            Task("bad", "Fails", _fail, []),
+            Task("ok", "Independent", record("ok"), []),
+            Task("child", "Child", record("child"), ["bad"]),
+            Task("grandchild", "Grandchild", record("grandchild"), ["child"]),
+            Task("mixed", "Mixed parents", record("mixed"), ["ok", "child"]),
+            Task("sibling", "Sibling", record("sibling"), ["ok"]),
+        ]
+
+        with ParallelExecutor(
+            scheduling=scheduling, failure_policy="skip-dependents"
+        ) as executor:
+            results = executor.execute(executor.plan(tasks))
+
+        status = {task.id: task.status for task in tasks}
+        assert status["bad"] == TaskStatus.FAILED
+        assert status["child"] == TaskStatus.SKIPPED
+        assert status["grandchild"] == TaskStatus.SKIPPED
+        assert status["mixed"] == TaskStatus.SKIPPED
+        assert status["sibling"] == TaskStatus.COMPLETED
+        assert sorted(ran) == ["ok", "sibling"]
+        assert results["child"] is None
+
+    def test_fail_fast_cancels_queued_and_cooperative_tasks(self):
+        """Test that fail-fast stops queued work and signals running tasks"""
+        seen = []
+
+        def crawl(token: CancellationToken):
+            token.wait(5)
+            seen.append(token.cancelled)
+            token.raise_if_cancelled()
+
+        tasks = [
+            Task("crawl", "Long crawl", crawl, [], cancellable=True),
+            Task("bad", "Fails", _fail, []),
+            Task("later", "Queued", lambda: "later", ["bad"]),
+        ]
+
+        start = time.perf_counter()
+        with ParallelExecutor(max_workers=2, failure_policy="fail-fast") as executor:
+            results = executor.execute(executor.plan(tasks))
+
+        assert time.perf_counter() - start < 2
+        assert seen == [True]
+        assert tasks[0].status == TaskStatus.CANCELLED
+        assert tasks[1].status == TaskStatus.FAILED
+        assert tasks[2].status == TaskStatus.CANCELLED
+        assert results["later"] is None
+
+    def test_cancel_from_another_thread(self):
+        """Test that cancel() stops a running plan"""
+        started = threading.Event()
+
+        def crawl(token: CancellationToken):
+            started.set()
+            token.wait(5)
+            token.raise_if_cancelled()
+
+        tasks = [Task("crawl", "Long crawl", crawl, [], cancellable=True)]
+        tasks += [
+            Task(f"queued_{i}", "Queued", lambda: None, ["crawl"]) for i in range(5)
+        ]
+
+        with ParallelExecutor(scheduling="streaming") as executor:
+            plan = executor.plan(tasks)
+            canceller = threading.Thread(
+                target=lambda: started.wait(5) and executor.cancel()
+            )
+            canceller.start()
+            executor.execute(plan)
+            canceller.join()
+
+        assert all(task.status == TaskStatus.CANCELLED for task in tasks)
+
+    def test_token_raises(self):
+        """Test CancellationToken signalling"""
+        token = CancellationToken()
+        token.raise_if_cancelled()
+        token.cancel()
+        assert token.cancelled
+        with pytest.raises(TaskCancelledError):
+            token.raise_if_cancelled()
+
+
+class TestTimeoutsAndRetries:
+    """Test per-task timeouts, retries with backoff and plan deadlines"""
+
+    @pytest.mark.parametrize("scheduling", ["waves", "streaming"])
+    def test_hung_task_times_out(self, scheduling):
+        """Test that a hung attempt no longer blocks execute()"""
+        release = threading.Event()
+        tasks = [
+            Task("hung", "Hangs", lambda: release.wait(5), [], timeout=0.1),
+            Task("ok", "Fast", lambda: "ok", []),
+        ]
+
+        with ParallelExecutor(scheduling=scheduling) as executor:
+            start = time.perf_counter()
+            results = executor.execute(executor.plan(tasks))
+            elapsed = time.perf_counter() - start
+            release.set()
+
+        assert elapsed < 1
+        assert tasks[0].status == TaskStatus.TIMED_OUT
+        assert isinstance(tasks[0].error, TaskTimeoutError)
+        assert results == {"hung": None, "ok": "ok"}
+
+    @pytest.mark.parametrize("scheduling", ["waves", "streaming"])
+    def test_retries_until_success(self, scheduling):
+        """Test that a flaky task is retried and its dependents still run"""
+        calls = []
+
+        def flaky():
+            calls.append(time.perf_counter())
+            if len(calls) < 3:
+                raise RuntimeError("transient")
+            return "done"
+
+        tasks = [
+            Task("flaky", "Flaky", flaky, [], retries=3),
+            Task("child", "Child", lambda: "child", ["flaky"]),
+        ]
+
+        with ParallelExecutor(
+            scheduling=scheduling, retry_backoff=0.01, failure_policy="skip-dependents"
+        ) as executor:
+            results = executor.execute(executor.plan(tasks))
+
+        assert results == {"flaky": "done", "child": "child"}
+        assert tasks[0].attempts == 3
+        assert tasks[1].status == TaskStatus.COMPLETED
+
+    def test_retries_exhausted(self):
+        """Test that the final attempt's error is kept"""
+        tasks = [Task("bad", "Fails", _fail, [], retries=2)]
+
+        with ParallelExecutor(retry_backoff=0.01) as executor:
+            executor.execute(executor.plan(tasks))
+
+        assert tasks[0].status == TaskStatus.FAILED
+        assert tasks[0].attempts == 3
+
+    def test_timed_out_attempt_is_retried(self):
+        """Test that a timeout counts as a retryable failure"""
+        calls = []
+
+        def slow_then_fast():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.5)
+            return len(calls)
+
+        tasks = [Task("t", "Slow once", slow_then_fast, [], timeout=0.1, retries=1)]
+
+        with ParallelExecutor(retry_backoff=0.01) as executor:
+            results = executor.execute(executor.plan(tasks))
+
+        assert results["t"] == 2
+        assert tasks[0].attempts == 2
+
+    def test_backoff_is_capped_and_jittered(self):
+        """Test the exponential backoff bounds"""
+        executor = ParallelExecutor(retry_backoff=0.5, retry_backoff_max=2.0)
+
+        for attempt, ceiling in [(1, 0.5), (2, 1.0), (3, 2.0), (10, 2.0)]:
+            delays = [executor._retry_delay(attempt) for _ in range(50)]
+            assert all(0 <= delay <= ceiling for delay in delays)
+            assert len(set(delays)) > 1
+
+    def test_plan_deadline(self):
+        """Test that the deadline times out running work and cancels the rest"""
+        release = threading.Event()
+        tasks = [
+            Task("slow", "Slow", lambda: release.wait(5), []),
+            Task("after", "After", lambda: "after", ["slow"]),
+        ]
+
+        with ParallelExecutor(scheduling="streaming", deadline=0.2) as executor:
+            start = time.perf_counter()
+            executor.execute(executor.plan(tasks))
+            elapsed = time.perf_counter() - start
+            release.set()
+
+        assert elapsed < 1
+        assert tasks[0].status == TaskStatus.TIMED_OUT
+        assert tasks[1].status == TaskStatus.CANCELLED
+
+
+class TestExecuteIter:
+    """Test streaming results from execute_iter"""
+
+    def test_yields_in_completion_order(self):
+        """Test that fast results arrive before slow ones finish"""
+        tasks = [
+            Task("slow", "Slow", _sleeper("slow", 0.2), []),
+            Task("fast", "Fast", _sleeper("fast", 0.0), []),
+        ]
+
+        with ParallelExecutor(scheduling="streaming") as executor:
+            outcomes = list(executor.execute_iter(executor.plan(tasks)))
+
+        assert [outcome.task_id for outcome in outcomes] == ["fast", "slow"]
+        task_id, result, status, duration = outcomes[1]
+        assert (task_id, result, status) == ("slow", "slow", TaskStatus.COMPLETED)
+        assert duration >= 0.2
+
+    def test_reports_skipped_tasks(self):
+        """Test that tasks that never ran are yielded without a duration"""
+        tasks = [
+            Task("bad", "Fails", _fail, []),
+            Task("child", "Child", lambda: "child", ["bad"]),
+        ]
+
+        with ParallelExecutor(failure_policy="skip-dependents") as executor:
+            plan = executor.plan(tasks)
+            outcomes = {o.task_id: o for o in executor.execute_iter(plan)}
+
+        assert outcomes["bad"].status == TaskStatus.FAILED
+        assert outcomes["child"].status == TaskStatus.SKIPPED
+        assert outcomes["child"].duration is None
+
+    @pytest.mark.parametrize("scheduling", ["waves", "streaming"])
+    def test_drop_results_keeps_results_needed_downstream(self, scheduling):
+        """Test that results are released only after their dependents finish"""
+        tasks = [
+            Task("a", "A", lambda: "a", []),
+            Task("b", "B", lambda: tasks[0].result + "b", ["a"]),
+            Task("c", "C", lambda: tasks[0].result + "c", ["a"]),
+        ]
+
+        with ParallelExecutor(scheduling=scheduling) as executor:
+            plan = executor.plan(tasks)
+            results = {
+                outcome.task_id: outcome.result
+                for outcome in executor.execute_iter(plan, drop_results=True)
+            }
+
+        assert results == {"a": "a", "b": "ab", "c": "ac"}
+        assert all(task.result is None for task in tasks)
+
+    def test_abandoning_stops_the_plan(self):
+        """Test that breaking out of the iterator submits nothing further"""
+        ran = []
+        tasks = [
+            Task(f"t{i}", f"Step {i}", functools.partial(ran.append, i), deps)
+            for i, deps in enumerate([[], ["t0"], ["t1"]])
+        ]
+
+        with ParallelExecutor(scheduling="streaming") as executor:
+            for _ in executor.execute_iter(executor.plan(tasks)):
+                break
+
+        assert ran == [0]
+
+    @pytest.mark.performance
+    def test_drop_results_bounded_memory(self):
+        """Benchmark: streamed results are not retained by the executor"""
+        import tracemalloc
+
+        count, size = 5_000, 64 * 1024
+        tasks = [
+            Task(f"t{i}", f"Blob {i}", functools.partial(bytes, size), [])
+            for i in range(count)
+        ]
+
+        with ParallelExecutor(max_workers=8) as executor:
+            plan = executor.plan(tasks)
+
+            tracemalloc.start()
+            try:
+                total = 0
+                for outcome in executor.execute_iter(plan, drop_results=True):
+                    total += len(outcome.result)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        assert total == count * size
+        # Retaining every result would peak above 300 MiB
+        assert peak < 256 * size
+
+
+class TestMap:
+    """Test the bounded-memory chunked map"""
+
+    @pytest.mark.parametrize("backend", ["thread", "inline"])
+    @pytest.mark.parametrize("chunk_size", [1, 7])
+    def test_ordered_results(self, backend, chunk_size):
+        """Test that ordered mode preserves input order from a generator"""
+        rng = random.Random(3)
+        delays = [rng.random() / 500 for _ in range(100)]
+
+        def work(i):
+            time.sleep(delays[i])
+            return i * i
+
+        with ParallelExecutor(max_workers=8, backend=backend) as executor:
+            results = list(executor.map(work, (i for i in range(100)), chunk_size))
+
+        assert results == [i * i for i in range(100)]
+
+    def test_completion_order(self):
+        """Test that unordered mode yields finished chunks first"""
+        with ParallelExecutor(max_workers=2) as executor:
+            results = list(
+                executor.map(lambda s: time.sleep(s) or s, [0.2, 0.0], ordered=False)
+            )
+
+        assert results == [0.0, 0.2]
+
+    def test_consumes_input_lazily(self):
+        """Test that only a bounded window of the input is pulled"""
+        pulled = []
+
+        def source():
+            for i in range(10_000):
+                pulled.append(i)
+                yield i
+
+        with ParallelExecutor(max_workers=2) as executor:
+            results = executor.map(lambda i: i, source(), chunk_size=5, max_in_flight=3)
+            assert next(results) == 0
+            results.close()
+
+        # Three chunks submitted, plus one refilled after the first
+        assert len(pulled) <= 4 * 5
+
+    def test_error_propagates(self):
+        """Test that an exception surfaces when its chunk is reached"""
+
+        def work(i):
+            if i == 3:
+                raise ValueError("bad item")
+            return i
+
+        with ParallelExecutor() as executor:
+            results = executor.map(work, range(10))
+            assert [next(results) for _ in range(3)] == [0, 1, 2]
+            with pytest.raises(ValueError, match="bad item"):
+                next(results)
+
+    def test_process_backend(self):
+        """Test that chunks can run in worker processes"""
+        with ParallelExecutor(max_workers=2, backend="process") as executor:
+            results = list(executor.map(abs, range(-50, 0), chunk_size=10))
+
+        assert results == list(range(50, 0, -1))
+
+    def test_invalid_chunk_size(self):
+        """Test that a chunk size below one is rejected"""
+        with ParallelExecutor() as executor:
+            with pytest.raises(ValueError):
+                next(executor.map(abs, [1], chunk_size=0))
+
+    def test_file_operations(self):
+        """Test the file helpers on a generator, with a failing file"""
+
+        def read(name):
+            if name == "missing.py":
+                raise FileNotFoundError(name)
+            return name.upper()
+
+        names = ["a.py", "missing.py", "b.py"]
+        assert parallel_file_operations(iter(names), read, chunk_size=2) == [
+            "A.PY",
+            None,
+            "B.PY",
+        ]
+        assert sorted(
+            filter(None, iter_file_operations(names, read, ordered=False))
+        ) == ["A.PY", "B.PY"]
+
+    @pytest.mark.performance
+    def test_chunked_map_benchmark(self):
+        """Benchmark: 200k-item map with chunking, bounded memory"""
+        import tracemalloc
+
+        count = 200_000
+
+        with ParallelExecutor(max_workers=4) as executor:
+            start = time.perf_counter()
+            total = sum(executor.map(len, (f"file_{i}.py" for i in range(count)), 1000))
+            elapsed = time.perf_counter() - start
+
+            tracemalloc.start()
+            try:
+                for _ in executor.map(str, range(count), chunk_size=1000):
+                    pass
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        assert total == sum(len(f"file_{i}.py") for i in range(count))
+        assert elapsed < 1.0
+        # At most 8 chunks of 1000 small strings alive at once
+        assert peak < 4 * 1024 * 1024
+
+
+class _PoolProbe:
+    """Records the peak number of concurrently running tasks per pool"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = {}
+        self.peak = {}
+
+    def task(self, task_id, pools, seconds=0.03, depends_on=()):
+        def run():
+            with self.lock:
+                for name in pools:
+                    self.running[name] = self.running.get(name, 0) + 1
+                    self.peak[name] = max(self.peak.get(name, 0), self.running[name])
+            time.sleep(seconds)
+            with self.lock:
+                for name in pools:
+                    self.running[name] -= 1
+            return task_id
+
+        return Task(task_id, f"Use {pools}", run, list(depends_on), pools=pools)
+
+
+class TestConcurrencyPools:
+    """Test named concurrency pools"""
+
+    @pytest.mark.parametrize("scheduling", ["waves", "streaming"])
+    def test_every_limit_is_respected(self, scheduling):
+        """Test that each pool stays within its limit while all are used"""
+        probe = _PoolProbe()
+        tasks = [probe.task(f"p{i}", ["subprocess"]) for i in range(8)]
+        tasks += [probe.task(f"d{i}", ["disk"]) for i in range(8)]
+        tasks += [probe.task(f"b{i}", ["disk", "subprocess"]) for i in range(2)]
+
+        with ParallelExecutor(
+            max_workers=10,
+            scheduling=scheduling,
+            pool_limits={"subprocess": 2, "disk": 4},
+        ) as executor:
+            results = executor.execute(executor.plan(tasks))
+
+        assert results == {task.id: task.id for task in tasks}
+        assert probe.peak == {"subprocess": 2, "disk": 4}
+
+    def test_full_pool_does_not_block_other_tasks(self):
+        """Test that tasks of a saturated pool do not hold up the rest"""
+        probe = _PoolProbe()
+        tasks = [probe.task(f"p{i}", ["subprocess"], 0.05) for i in range(4)]
+        tasks += [probe.task(f"d{i}", ["disk"], 0.01) for i in range(4)]
+
+        with ParallelExecutor(
+            max_workers=4,
+            scheduling="streaming",
+            pool_limits={"subprocess": 1, "disk": 4},
+        ) as executor:
+            order = [o.task_id for o in executor.execute_iter(executor.plan(tasks))]
+
+        assert probe.peak["subprocess"] == 1
+        # All disk tasks finish while the first subprocess task still runs
+        assert set(order[:4]) == {"d0", "d1", "d2", "d3"}
+
+    def test_pools_with_retries_and_failures(self):
+        """Test that failed attempts give their slots back"""
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise RuntimeError("try again")
+            return "ok"
+
+        tasks = [
+            Task("flaky", "Flaky", flaky, [], pools=["mcp"], retries=2),
+            Task("fails", "Fails", _fail, [], pools=["mcp"]),
+            Task("after", "After", lambda: 1, ["fails"], pools=["mcp"]),
+        ]
+
+        with ParallelExecutor(retry_backoff=0.01, pool_limits={"mcp": 1}) as executor:
+            results = executor.execute(executor.plan(tasks))
+
+        assert results == {"flaky": "ok", "fails": None, "after": 1}
+
+    @pytest.mark.parametrize("scheduling", ["waves", "streaming"])
+    def test_timed_out_attempts_keep_their_slot(self, scheduling):
+        """Test that an abandoned, still running attempt holds its slot"""
+        probe = _PoolProbe()
+        slow = probe.task("slow", ["mcp"], 0.3)
+        slow.timeout = 0.05
+        tasks = [slow, probe.task("next", ["mcp"], 0.01)]
+
+        with ParallelExecutor(
+            max_workers=4, scheduling=scheduling, pool_limits={"mcp": 1}
+        ) as executor:
+            results = executor.execute(executor.plan(tasks))
+            duration = slow.duration
+            time.sleep(0.3)  # Let the abandoned attempt return
+
+        assert results == {"slow": None, "next": "next"}
+        assert probe.peak == {"mcp": 1}
+        assert slow.status == TaskStatus.TIMED_OUT
+        assert slow.duration == duration is None
+
+    def test_rejects_unknown_pools_and_bad_limits(self):
+        """Test that misconfigured pools fail before anything runs"""
+        calls = []
+        tasks = [
+            Task("a", "A", lambda: calls.append(1), []),
+            Task("b", "B", lambda: calls.append(1), [], pools=["gpu"]),
+        ]
+
+        with ParallelExecutor(pool_limits={"disk": 2}) as executor:
+            with pytest.raises(ValueError, match="unknown pool 'gpu'"):
+                executor.execute(executor.plan(tasks))
+        assert calls == []
+
+        with pytest.raises(ValueError, match="positive int"):
+            ParallelExecutor(pool_limits={"disk": 0})
@@ -0,0 +1,167 @@
+"""
+Unit tests for plan caching
+
+Tests structural keys, LRU eviction, the on-disk cache and plan reuse
+by ParallelExecutor.
+"""
+
+import time
+
+import pytest
+
+from superclaude.execution.parallel import ParallelExecutor, Task
+from superclaude.execution.plan_cache import PlanCache, PlanTemplate, plan_key
+
+
+def _graph(prefix="t", width=3):
+    """Fan-out / fan-in graph: root -> width tasks -> join"""
+    tasks = [Task(f"{prefix}root", "Root", lambda: None, [])]
+    middle = [f"{prefix}{i}" for i in range(width)]
+    tasks += [Task(i, f"Work {i}", lambda: None, [f"{prefix}root"]) for i in middle]
+    tasks.append(Task(f"{prefix}join", "Join", lambda: None, middle))
+    return tasks
+
+
+def _template(tag):
+    return PlanTemplate([[tag]], 1.0, 1.0, 1.0, [tag], 1.0, 1)
+
+
+class TestPlanKey:
+    """Test suite for plan_key"""
+
+    def test_structure_determines_key(self):
+        """Test that callables don't matter but ids, edges and settings do"""
+        assert plan_key(_graph()) == plan_key(_graph())
+        assert plan_key(_graph()) != plan_key(_graph(width=4))
+        assert plan_key(_graph()) != plan_key(_graph(prefix="u"))
+        assert plan_key(_graph(), "waves") != plan_key(_graph(), "streaming")
+
+        edited = _graph()
+        edited[-1].depends_on = edited[-1].depends_on[:-1]
+        assert plan_key(edited) != plan_key(_graph())
+
+    def test_costs_and_priorities_are_part_of_the_key(self):
+        """Test that edits changing critical-path ordering change the key"""
+        costly, urgent = _graph(), _graph()
+        costly[1].cost = 5.0
+        urgent[2].priority = 10
+
+        assert len({plan_key(g) for g in (_graph(), costly, urgent)}) == 3
+
+
+class TestPlanCache:
+    """Test suite for PlanCache"""
+
+    def test_counters_and_lru(self):
+        """Test hit/miss counting and least-recently-used eviction"""
+        cache = PlanCache(maxsize=2)
+
+        assert cache.get("a") is None
+        cache.put("a", _template("a"))
+        cache.put("b", _template("b"))
+        assert cache.get("a").groups == [["a"]]  # a is now most recent
+        cache.put("c", _template("c"))  # evicts b
+
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+        assert (cache.hits, cache.misses) == (2, 2)
+        assert len(cache) == 2
+
+    def test_disk_cache_survives_instances(self, tmp_path):
+        """Test that templates are read back by a fresh cache"""
+        PlanCache(path=tmp_path).put("k", _template("x"))
+
+        fresh = PlanCache(path=tmp_path)
+        assert fresh.get("k").critical_path == ["x"]
+        assert fresh.hits == 1
+
+    def test_disk_cache_bounded_and_tolerant(self, tmp_path, monkeypatch):
+        """Test periodic disk pruning and that corrupt files are misses"""
+        cache = PlanCache(path=tmp_path, disk_maxsize=8)
+        prunes = []
+        prune = cache._prune
+        monkeypatch.setattr(cache, "_prune", lambda: prunes.append(1) or prune())
+
+        for i in range(12):
+            cache.put(f"k{i}", _template(str(i)))
+            time.sleep(0.01)
+
+        assert len(prunes) == 2  # At the 9th and the 12th put
+        assert {f.stem for f in tmp_path.glob("*.json")} == {
+            f"k{i}" for i in range(6, 12)
+        }
+
+        (tmp_path / "bad.json").write_text("{not json")
+        assert PlanCache(path=tmp_path).get("bad") is None
+
+    def test_invalid_maxsize(self):
+        """Test that an empty cache is rejected"""
+        with pytest.raises(ValueError):
+            PlanCache(maxsize=0)
+
+
+class TestExecutorPlanCache:
+    """Test plan reuse through ParallelExecutor.plan()"""
+
+    def test_reuses_plan_for_new_task_objects(self):
+        """Test that a hit rebinds the cached groups to the new tasks"""
+        cache = PlanCache()
+        executor = ParallelExecutor(plan_cache=cache)
+
+        first = executor.plan(_graph())
+        tasks = _graph()
+        second = executor.plan(tasks)
+
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert [[t.id for t in g.tasks] for g in second.groups] == [
+            [t.id for t in g.tasks] for g in first.groups
+        ]
+        assert second.groups[1].tasks[0] is tasks[1]
+        assert second.parallel_time_estimate == first.parallel_time_estimate
+        assert executor.execute(second)["troot"] is None
+
+    def test_settings_are_part_of_the_key(self):
+        """Test that executors planning differently do not share plans"""
+        cache = PlanCache()
+        ParallelExecutor(plan_cache=cache).plan(_graph())
+        ParallelExecutor(plan_cache=cache, scheduling="streaming").plan(_graph())
+        ParallelExecutor(plan_cache=cache, max_workers=2).plan(_graph())
+
+        assert (cache.hits, cache.misses) == (0, 3)
+
+    def test_auto_workers_key_on_the_setting(self):
+        """Test that a changing adaptive worker count keeps hitting"""
+        cache = PlanCache()
+        executor = ParallelExecutor(max_workers="auto", plan_cache=cache)
+
+        executor.plan(_graph())
+        executor.controller.limit += 1
+        executor.plan(_graph())
+
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.performance
+    def test_cached_plan_is_faster(self):
+        """Benchmark: replanning a 50k-task graph from the cache"""
+        count = 50_000
+
+        def graph():
+            return [
+                Task(f"t{i}", f"Task {i}", None, [f"t{i - 1}"] if i % 10 else [])
+                for i in range(count)
+            ]
+
+        executor = ParallelExecutor(scheduling="streaming", plan_cache=PlanCache())
+
+        start = time.perf_counter()
+        cold = executor.plan(graph())
+        miss = time.perf_counter() - start
+
+        tasks = graph()
+        start = time.perf_counter()
+        warm = executor.plan(tasks)
+        hit = time.perf_counter() - start
+
+        assert warm.total_tasks == cold.total_tasks == count
+        assert len(warm.groups) == 10
+        assert hit < miss / 2
@@ -0,0 +1,167 @@
+"""
+Unit tests for execution profiling
+
+Tests the profiles collected by the executors, utilization and idle-gap
+analysis, and the JSON and Chrome trace exports.
+"""
+
+import asyncio
+import io
+import json
+import time
+
+import pytest
+
+from superclaude.execution.async_parallel import AsyncParallelExecutor
+from superclaude.execution.events import ConsoleRenderer, EventBus
+from superclaude.execution.parallel import ParallelExecutor, Task
+from superclaude.execution.profiling import ExecutionProfile, TaskSpan
+
+
+def _sleeper(task_id, seconds, depends_on=()):
+    return Task(
+        task_id, f"Sleep {task_id}", lambda: time.sleep(seconds), list(depends_on)
+    )
+
+
+def _profile(*intervals, workers=2, elapsed=10.0):
+    """Synthetic profile from (submitted, started, finished, worker) tuples"""
+    profile = ExecutionProfile(workers, origin=0.0, elapsed=elapsed)
+    for i, (*times, worker) in enumerate(intervals):
+        span = TaskSpan(f"t{i}", f"Task {i}", 1, "completed", worker, *times)
+        profile.spans.append(span)
+    return profile
+
+
+class TestExecutionProfile:
+    """Test suite for ExecutionProfile analysis"""
+
+    def test_utilization_and_parallelism(self):
+        """Test busy time, queue time and the derived ratios"""
+        profile = _profile((0, 0, 4, "w1"), (0, 2, 6, "w2"), elapsed=8.0)
+
+        assert profile.busy_time == 8.0
+        assert profile.queue_time == 2.0
+        assert profile.parallelism == 1.0
+        assert profile.utilization == 0.5
+
+    def test_timeline_and_idle_gaps(self):
+        """Test occupancy steps and the gaps with nothing running"""
+        profile = _profile((1, 1, 3, "w1"), (1, 2, 4, "w2"), (6, 6, 7, "w1"))
+
+        assert profile.timeline() == [
+            (1, 1, 1),
+            (2, 2, 0),
+            (3, 1, 0),
+            (4, 0, 0),
+            (6, 1, 0),
+            (7, 0, 0),
+        ]
+        assert profile.idle_gaps() == [(0.0, 1), (4, 6), (7, 10.0)]
+        assert profile.idle_gaps(min_gap=1.5) == [(4, 6), (7, 10.0)]
+
+    def test_json_export(self, tmp_path):
+        """Test that the JSON export carries the summary and every span"""
+        profile = _profile((0, 1, 3, "w1"))
+        path = tmp_path / "profile.json"
+        profile.save_json(path)
+
+        data = json.loads(path.read_text())
+        assert data["busy_time"] == 2
+        assert data["tasks"][0]["queue_wait"] == 1
+        assert data["tasks"][0]["worker"] == "w1"
+
+    def test_chrome_trace_export(self, tmp_path):
+        """Test trace events, worker tracks and lanes for overlapping spans"""
+        profile = _profile(
+            (0, 0, 2, "loop"), (0, 1, 3, "loop"), (0, 2.5, 4, "w2"), elapsed=4.0
+        )
+        path = tmp_path / "trace.json"
+        profile.save_chrome_trace(path)
+
+        trace = json.loads(path.read_text())
+        events = trace["traceEvents"]
+        slices = [e for e in events if e["ph"] == "X"]
+        names = {
+            e["tid"]: e["args"]["name"] for e in events if e["name"] == "thread_name"
+        }
+
+        assert len(slices) == 3
+        assert slices[0]["ts"] == 0 and slices[0]["dur"] == 2e6
+        assert sorted(names.values()) == ["loop", "loop #2", "w2"]
+        assert len({e["tid"] for e in slices}) == 3
+        assert any(e["ph"] == "C" for e in events)
+        assert {e["ph"] for e in events if e.get("cat") == "queue"} == {"b", "e"}
+        assert trace["otherData"]["workers"] == 2
+
+
+class TestExecutorProfiles:
+    """Test the profiles collected by every run"""
+
+    @pytest.mark.parametrize("scheduling", ["waves", "streaming"])
+    def test_thread_run_profile(self, scheduling):
+        """Test per-task spans, queue waits and workers for a thread run"""
+        tasks = [_sleeper(f"t{i}", 0.05) for i in range(4)]
+
+        with ParallelExecutor(max_workers=2, scheduling=scheduling) as executor:
+            executor.execute(executor.plan(tasks))
+
+        profile = executor.last_profile
+        assert len(profile.spans) == 4
+        assert profile.workers == 2
+        assert len({span.worker for span in profile.spans}) == 2
+        assert all(span.run_time >= 0.04 for span in profile.spans)
+        assert 0 <= profile.spans[0].submitted <= profile.spans[0].started
+        assert profile.elapsed >= max(span.finished for span in profile.spans)
+        assert 0.5 < profile.utilization <= 1.05
+
+    def test_retries_and_timeouts_are_spans(self):
+        """Test that every attempt gets a span with its own status"""
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("first attempt fails")
+            return "ok"
+
+        tasks = [
+            Task("flaky", "Flaky", flaky, [], retries=1),
+            Task("slow", "Slow", lambda: time.sleep(0.3), [], timeout=0.05),
+        ]
+
+        with ParallelExecutor(retry_backoff=0.01) as executor:
+            executor.execute(executor.plan(tasks))
+
+        statuses = {}
+        for span in executor.last_profile.spans:
+            statuses.setdefault(span.task_id, []).append((span.attempt, span.status))
+
+        assert statuses["flaky"] == [(1, "failed"), (2, "completed")]
+        assert statuses["slow"] == [(1, "timed_out")]
+
+    def test_async_profile(self):
+        """Test that the event-loop executor records spans too"""
+
+        async def work():
+            await asyncio.sleep(0.02)
+
+        tasks = [Task(f"t{i}", "Work", work, []) for i in range(3)]
+        executor = AsyncParallelExecutor(max_concurrency=1)
+        executor.run(executor.plan(tasks))
+
+        spans = executor.last_profile.spans
+        assert [span.worker for span in spans] == ["event loop"] * 3
+        assert max(span.queue_wait for span in spans) >= 0.03
+
+    def test_renderer_reports_measured_speedup(self):
+        """Test that the console summary uses measured numbers"""
+        stream = io.StringIO()
+        tasks = [_sleeper(f"t{i}", 0.02) for i in range(4)]
+
+        with ParallelExecutor(events=EventBus(ConsoleRenderer(stream))) as executor:
+            executor.execute(executor.plan(tasks))
+
+        output = stream.getvalue()
+        assert "Measured speedup" in output
+        assert "Actual speedup" not in output
@@ -108,6 +108,19 @@ class TestReflexionPattern:
         # Should not raise exception even with custom memory dir
         reflexion.record_error(error_info)
 
+    def test_close_releases_and_reopens(self, temp_memory_dir):
+        """Test that a closed pattern's index and sidecar reopen on use"""
+        error_info = {"error_type": "OSError", "error_message": "disk full"}
+
+        with ReflexionPattern(memory_dir=temp_memory_dir) as reflexion:
+            reflexion.record_error(dict(error_info, solution="Free space"))
+            index, sidecar = reflexion.index, reflexion.sidecar
+
+        assert sidecar._map is None
+        assert reflexion.index is not index
+        assert reflexion.get_solution(error_info)["solution"] == "Free space"
+        reflexion.close()
+
     def test_error_learning_across_sessions(self):
         """
         Test that errors can be learned across sessions
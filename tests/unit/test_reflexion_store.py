@@ -0,0 +1,255 @@
+"""
+Unit tests for the reflexion memory store
+
+Tests the SQLite-backed store, legacy JSON import/export, concurrent
+writers and the self-correction engine on top of it.
+"""
+
+import json
+import random
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from superclaude.execution.reflexion_store import ReflexionStore
+from superclaude.execution.self_correction import SelfCorrectionEngine
+
+
+def _entry(failure_id, task="Deploy service", error="connection refused"):
+    return {
+        "id": failure_id,
+        "timestamp": "2026-01-01T00:00:00",
+        "task": task,
+        "failure_type": "execution_error",
+        "error_message": error,
+        "root_cause": {
+            "category": "dependency",
+            "description": error,
+            "evidence": [error],
+            "prevention_rule": "ALWAYS check dependencies",
+            "validation_tests": ["Check service is up"],
+        },
+        "fixed": False,
+        "fix_description": None,
+        "recurrence_count": 0,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ReflexionStore(tmp_path / "reflexion.db") as store:
+        yield store
+
+
+class TestReflexionStore:
+    """Test suite for ReflexionStore"""
+
+    def test_record_and_recurrence(self, store):
+        """Test inserts, recurrence counting and rule deduplication"""
+        assert store.record(_entry("a1"), "ALWAYS check dependencies") == (0, True)
+        assert store.record(_entry("a1"), "ALWAYS check dependencies") == (1, False)
+        assert store.record(_entry("b2"), "NEVER assume") == (0, True)
+
+        assert store.get("a1")["recurrence_count"] == 1
+        assert store.get("a1")["root_cause"]["category"] == "dependency"
+        assert store.get("missing") is None
+        assert len(store) == 2
+        assert store.prevention_rules() == [
+            "ALWAYS check dependencies",
+            "NEVER assume",
+        ]
+
+    def test_json_round_trip(self, store, tmp_path):
+        """Test that export writes the legacy format import reads back"""
+        store.record(_entry("a1"), "ALWAYS check dependencies")
+        store.record(_entry("b2", error="bad type"), "ALWAYS use type hints")
+        exported = tmp_path / "reflexion.json"
+        store.export_json(exported)
+
+        data = json.loads(exported.read_text())
+        assert [m["id"] for m in data["mistakes"]] == ["a1", "b2"]
+        assert data["mistakes"][0] == _entry("a1")
+        assert data["prevention_rules"] == [
+            "ALWAYS check dependencies",
+            "ALWAYS use type hints",
+        ]
+
+        with ReflexionStore(tmp_path / "copy.db") as copy:
+            assert copy.import_json(exported) == 2
+            assert list(copy.mistakes()) == list(store.mistakes())
+
+    def test_for_repo_migrates_legacy_json(self, tmp_path):
+        """Test that an existing reflexion.json is imported once"""
+        memory = tmp_path / "docs" / "memory"
+        memory.mkdir(parents=True)
+        legacy = {
+            "version": "1.0",
+            "created": "2025-01-01T00:00:00",
+            "mistakes": [_entry("old")],
+            "patterns": [],
+            "prevention_rules": ["NEVER assume"],
+        }
+        (memory / "reflexion.json").write_text(json.dumps(legacy))
+
+        with ReflexionStore.for_repo(tmp_path) as store:
+            assert store.get("old")["task"] == "Deploy service"
+            assert store.prevention_rules() == ["NEVER assume"]
+            store.record(_entry("old"))
+
+        with ReflexionStore.for_repo(tmp_path) as store:
+            assert len(store) == 1
+            assert store.get("old")["recurrence_count"] == 1
+
+    def test_concurrent_writers_keep_every_update(self, tmp_path):
+        """Test that writers with their own connections do not lose updates"""
+        path = tmp_path / "reflexion.db"
+        ReflexionStore(path).close()
+
+        def writer():
+            with ReflexionStore(path) as store:
+                for _ in range(25):
+                    store.record(_entry("shared"))
+
+        threads = [threading.Thread(target=writer) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with ReflexionStore(path) as store:
+            assert store.get("shared")["recurrence_count"] == 99
+
+    def test_periodic_compaction(self, tmp_path):
+        """Test that the write-ahead log is folded back every N writes"""
+        path = tmp_path / "reflexion.db"
+        wal = tmp_path / "reflexion.db-wal"
+
+        with ReflexionStore(path, compact_every=10) as store:
+            for i in range(9):
+                store.record(_entry(f"m{i}", error="x" * 1000))
+            assert wal.stat().st_size > 0
+
+            store.record(_entry("m9"))
+            assert wal.stat().st_size == 0
+            assert len(store) == 10
+
+
+class TestSelfCorrectionMemory:
+    """Test SelfCorrectionEngine on the indexed store"""
+
+    def test_learn_and_check(self, tmp_path):
+        """Test learning failures, recurrences and similarity checks"""
+        failure = {"type": "execution_error", "error": "module not found: yaml"}
+
+        with SelfCorrectionEngine(tmp_path) as engine:
+            for _ in range(2):
+                root_cause = engine.analyze_root_cause("Parse config files", failure)
+                engine.learn_and_prevent("Parse config files", failure, root_cause)
+
+            (mistake,) = engine.check_against_past_mistakes("Parse config files again")
+            assert mistake.recurrence_count == 1
+            assert engine.get_prevention_rules()[-1] == root_cause.prevention_rule
+        assert not (tmp_path / "docs" / "memory" / "reflexion.json").exists()
+
+    def test_engine_closes_its_store(self, tmp_path):
+        """Test that leaving the engine's context closes the database"""
+        with SelfCorrectionEngine(tmp_path) as engine:
+            engine.get_prevention_rules()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            engine.store.get("a1")
+
+    def test_timeout_category(self, tmp_path):
+        """Test that only real timeouts are categorized as timeouts"""
+        with SelfCorrectionEngine(tmp_path) as engine:
+
+            def category(failure_type, error):
+                failure = {"type": failure_type, "error": error}
+                return engine.analyze_root_cause("Sync", failure).category
+
+            assert category("timeout", "Task a exceeded 1s") == "timeout"
+            assert category("exception", "Request timed out") == "timeout"
+            assert category("exception", "missing timeout param") == "validation"
+            assert category("exception", "deadline must be positive") == "validation"
+
+
+class TestSimilaritySearch:
+    """Test the inverted index behind similarity queries"""
+
+    def test_overlap_threshold_per_field(self, store):
+        """Test that two shared words in task or in error make a match"""
+        store.record(_entry("t", task="deploy auth service", error="x"))
+        store.record(_entry("e", task="x", error="connection refused by host"))
+        store.record(_entry("n", task="deploy docs", error="refused"))
+
+        assert [m["id"] for m in store.similar(task="deploy auth")] == ["t"]
+        assert [m["id"] for m in store.similar(error="Connection Refused")] == ["e"]
+        assert {
+            m["id"] for m in store.similar("deploy auth", "connection refused")
+        } == {"t", "e"}
+        assert store.similar(task="deploy") == []
+
+    def test_rare_words_rank_first(self, store):
+        """Test that matches on rare words outrank matches on common ones"""
+        for i in range(10):
+            store.record(_entry(f"common{i}", task=f"fix the build {i}"))
+        store.record(_entry("rare", task="fix flaky websocket reconnect"))
+
+        results = store.similar(task="fix the flaky websocket build")
+
+        assert results[0]["id"] == "rare"
+        assert len(results) == 11
+
+    def test_replaced_mistakes_are_reindexed(self, store, tmp_path):
+        """Test that importing over a mistake drops its old words"""
+        store.record(_entry("a", task="parse yaml config"))
+        legacy = tmp_path / "legacy.json"
+        legacy.write_text(
+            json.dumps({"mistakes": [_entry("a", task="render html template")]})
+        )
+
+        store.import_json(legacy)
+
+        assert store.similar(task="parse yaml") == []
+        assert [m["id"] for m in store.similar(task="html template")] == ["a"]
+
+    def test_index_is_built_for_unindexed_databases(self, tmp_path):
+        """Test that a database written without the index gets one on open"""
+        path = tmp_path / "reflexion.db"
+        with ReflexionStore(path) as store:
+            store.record(_entry("a", task="deploy auth service"))
+            store._db.execute("DELETE FROM postings")
+            store._db.execute("DELETE FROM meta WHERE key = 'index'")
+
+        with ReflexionStore(path) as store:
+            assert [m["id"] for m in store.similar(task="auth service")] == ["a"]
+
+    @pytest.mark.performance
+    def test_similarity_100k_mistakes_benchmark(self, tmp_path):
+        """Benchmark: similarity queries over 100k mistakes stay in milliseconds"""
+        rng = random.Random(7)
+        vocabulary = [f"word{i}" for i in range(3000)]
+        legacy = tmp_path / "reflexion.json"
+        mistakes = [
+            _entry(
+                f"m{i}",
+                task=" ".join(rng.sample(vocabulary, 4)),
+                error=" ".join(rng.sample(vocabulary, 5)),
+            )
+            for i in range(100_000)
+        ]
+        legacy.write_text(json.dumps({"mistakes": mistakes}))
+
+        with ReflexionStore(tmp_path / "reflexion.db") as store:
+            assert store.import_json(legacy) == 100_000
+
+            queries = [rng.choice(mistakes) for _ in range(100)]
+            start = time.perf_counter()
+            for mistake in queries:
+                results = store.similar(mistake["task"], mistake["error_message"])
+                assert results[0]["id"] == mistake["id"]
+            elapsed = time.perf_counter() - start
+
+        assert elapsed / len(queries) < 0.02
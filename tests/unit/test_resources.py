@@ -0,0 +1,210 @@
+"""
+Unit tests for resource dependency inference
+
+Tests how declared reads and writes become task dependencies.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from superclaude.execution.parallel import ParallelExecutor, Task
+from superclaude.execution.resources import (
+    Operation,
+    infer_dependencies,
+    keys_overlap,
+    resource_key,
+)
+
+
+def _task(task_id, reads=(), writes=(), depends_on=None, execute=None):
+    return Task(
+        task_id,
+        task_id,
+        execute or (lambda: task_id),
+        depends_on or [],
+        reads=reads,
+        writes=writes,
+    )
+
+
+class TestResourceKeys:
+    """Test suite for resource normalization and overlap"""
+
+    def test_normalization(self):
+        """Test that equivalent spellings give the same key"""
+        assert resource_key("src/./app.py") == resource_key("src/app.py")
+        assert resource_key(Path("src") / "app.py") == ("src", "app.py")
+        assert resource_key("src\\app.py") == ("src", "app.py")
+        assert resource_key(".") == ()
+
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            ("src/app.py", "src/app.py", True),
+            ("src", "src/app.py", True),
+            ("src/app.py", "src/util.py", False),
+            ("src/*.py", "src/app.py", True),
+            ("src/*.py", "src/README.md", False),
+            ("src/*.py", "src/pkg/mod.py", False),
+            ("src/**/*.py", "src/pkg/mod.py", True),
+            ("src/**", "docs/index.md", False),
+            ("src/*.py", "src/a*.py", True),
+            ("db", "cache", False),
+        ],
+    )
+    def test_overlap(self, a, b, expected):
+        """Test containment and glob overlap in both directions"""
+        assert keys_overlap(resource_key(a), resource_key(b)) is expected
+        assert keys_overlap(resource_key(b), resource_key(a)) is expected
+
+
+class TestInferDependencies:
+    """Test suite for infer_dependencies"""
+
+    def test_readers_share_writers_order(self):
+        """Test read/read, read/write and write/write ordering"""
+        tasks = [
+            _task("r1", reads=["config.yaml"]),
+            _task("r2", reads=["config.yaml"]),
+            _task("w1", writes=["config.yaml"]),
+            _task("w2", writes=["config.yaml"]),
+            _task("r3", reads=["config.yaml"]),
+        ]
+
+        assert infer_dependencies(tasks) == {
+            "r1": [],
+            "r2": [],
+            "w1": ["r1", "r2"],
+            "w2": ["w1"],
+            "r3": ["w2"],
+        }
+
+    def test_disjoint_resources_are_independent(self):
+        """Test that unrelated files and named resources do not wait"""
+        tasks = [
+            _task("a", writes=["src/a.py"]),
+            _task("b", writes=["src/b.py"]),
+            _task("db", writes=["db"]),
+            _task("api", reads=["service:github"]),
+        ]
+
+        assert all(not deps for deps in infer_dependencies(tasks).values())
+
+    def test_directories_and_globs(self):
+        """Test that containing directories and globs conflict with files"""
+        tasks = [
+            _task("edit", writes=["src/pkg/mod.py"]),
+            _task("lint", reads=["src/**/*.py"]),
+            _task("docs", reads=["docs/*.md"]),
+            _task("clean", writes=["src"]),
+        ]
+
+        assert infer_dependencies(tasks) == {
+            "edit": [],
+            "lint": ["edit"],
+            "docs": [],
+            "clean": ["edit", "lint"],
+        }
+
+    def test_read_modify_write(self):
+        """Test that a task reading and writing a file is a single writer"""
+        tasks = [
+            _task("read", reads=["a.txt"]),
+            _task("update", reads=["a.txt"], writes=["a.txt"]),
+            _task("update2", reads=["a.txt"], writes=["a.txt"]),
+        ]
+
+        deps = infer_dependencies(tasks)
+        assert deps["update"] == ["read"]
+        assert deps["update2"] == ["update"]
+
+
+class TestPlanWithResources:
+    """Test that planning and execution honour inferred dependencies"""
+
+    def test_plan_groups(self):
+        """Test that readers share a group and writers get their own"""
+        tasks = [
+            _task("r1", reads=["a.txt"]),
+            _task("r2", reads=["a.txt"]),
+            _task("w", writes=["a.txt"]),
+            _task("r3", reads=["a.txt"], depends_on=["r1"]),
+        ]
+
+        executor = ParallelExecutor()
+        plan = executor.plan(tasks)
+
+        assert [[t.id for t in g.tasks] for g in plan.groups] == [
+            ["r1", "r2"],
+            ["w"],
+            ["r3"],
+        ]
+        assert tasks[3].depends_on == ["r1", "w"]
+
+        # Planning again does not duplicate inferred dependencies
+        executor.plan(tasks)
+        assert tasks[3].depends_on == ["r1", "w"]
+
+    @pytest.mark.parametrize("scheduling", ["waves", "streaming"])
+    def test_writers_never_overlap_readers(self, scheduling):
+        """Test mixed read/modify work against a shared file set"""
+        lock = threading.Lock()
+        active = {"readers": 0, "writers": 0}
+        violations = []
+
+        def access(kind):
+            def run():
+                with lock:
+                    active[kind] += 1
+                    if active["writers"] > 1 or (
+                        active["writers"] and active["readers"]
+                    ):
+                        violations.append(kind)
+                time.sleep(0.002)
+                with lock:
+                    active[kind] -= 1
+
+            return run
+
+        tasks = []
+        for i in range(30):
+            if i % 5 == 4:
+                tasks.append(_task(f"w{i}", writes=["data"], execute=access("writers")))
+            else:
+                tasks.append(
+                    _task(f"r{i}", reads=[f"data/{i}.json"], execute=access("readers"))
+                )
+
+        with ParallelExecutor(max_workers=8, scheduling=scheduling) as executor:
+            executor.execute(executor.plan(tasks))
+
+        assert violations == []
+
+    def test_operation_wrapper(self):
+        """Test that Operation forwards calls and carries its accesses"""
+        op = Operation(lambda x: x * 2, reads=["in"], writes=["out"])
+
+        assert op(21) == 42
+        assert op.reads == ["in"] and op.writes == ["out"]
+
+    @pytest.mark.performance
+    def test_inference_scales(self):
+        """Benchmark: 50k mixed file accesses infer in well under a second"""
+        tasks = []
+        for i in range(50_000):
+            path = f"src/pkg{i % 100}/mod{i % 1000}.py"
+            if i % 10 == 0:
+                tasks.append(_task(f"t{i}", writes=[path]))
+            else:
+                tasks.append(_task(f"t{i}", reads=[path]))
+
+        start = time.perf_counter()
+        deps = infer_dependencies(tasks)
+        elapsed = time.perf_counter() - start
+
+        assert deps["t10"] == []
+        assert deps["t1010"] == ["t10"]
+        assert elapsed < 1.0
@@ -0,0 +1,295 @@
+"""
+Unit tests for the result cache
+
+Tests content-addressed keys over input files, LRU eviction and the
+executors serving cacheable tasks from the cache.
+"""
+
+import os
+import time
+
+import pytest
+
+from superclaude.execution.async_parallel import AsyncParallelExecutor
+from superclaude.execution.parallel import ParallelExecutor, Task, TaskStatus
+from superclaude.execution.result_cache import CacheKey, ResultCache
+
+
+def _backdate(path, seconds=10):
+    """Age a file's mtime so its memoized hash is trusted"""
+    at = time.time() - seconds
+    os.utime(path, (at, at))
+
+
+class _Counter:
+    """Callable counting its calls and returning its input's length"""
+
+    def __init__(self, path):
+        self.path = path
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return len(self.path.read_text())
+
+
+def _task(task_id, func, inputs, version="v1", **kwargs):
+    kwargs.setdefault("fingerprint", f"measure.{task_id}")
+    return Task(
+        task_id,
+        f"Measure {task_id}",
+        func,
+        [],
+        cache=CacheKey(inputs=inputs, version=version),
+        **kwargs,
+    )
+
+
+class TestResultCache:
+    """Test suite for ResultCache"""
+
+    def test_key_follows_content_and_version(self, tmp_path):
+        """Test that keys change with input content and version only"""
+        source = tmp_path / "a.txt"
+        source.write_text("one")
+        cache = ResultCache(tmp_path / "cache")
+
+        key = cache.key_for(_task("a", len, [source]))
+        assert cache.key_for(_task("a", len, [source])) == key
+        assert cache.key_for(_task("a", len, [source], version="v2")) != key
+
+        source.write_text("two")
+        assert cache.key_for(_task("a", len, [source])) != key
+
+    def test_directories_are_walked(self, tmp_path):
+        """Test that a file added under an input directory changes the key"""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.py").write_text("a")
+        cache = ResultCache(tmp_path / "cache")
+
+        key = cache.key_for(_task("t", len, [src]))
+        (src / "b.py").write_text("b")
+
+        assert cache.key_for(_task("t", len, [src])) != key
+
+    def test_inputs_are_relative_to_the_root(self, tmp_path, monkeypatch):
+        """Test that keys follow the root, not the cwd or the checkout path"""
+        checkouts = [tmp_path / "one", tmp_path / "two"]
+        for checkout in checkouts:
+            (checkout / "src").mkdir(parents=True)
+            (checkout / "src" / "a.py").write_text("a")
+        first, second = (
+            ResultCache(tmp_path / "cache", root=checkout) for checkout in checkouts
+        )
+
+        key = first.key_for(_task("t", len, ["src"]))
+        monkeypatch.chdir(checkouts[1] / "src")
+        assert first.key_for(_task("t", len, ["src/a.py"])) == key
+        assert second.key_for(_task("t", len, ["src"])) == key
+
+        (checkouts[1] / "src" / "a.py").write_text("b")
+        assert second.key_for(_task("t", len, ["src"])) != key
+
+    def test_unchanged_files_are_not_rehashed(self, tmp_path, monkeypatch):
+        """Test that memoized hashes persist and skip reading old files"""
+        source = tmp_path / "a.txt"
+        source.write_text("data")
+        _backdate(source)
+        cache = ResultCache(tmp_path / "cache")
+        key = cache.key_for(_task("a", len, [source]))
+        cache.save()
+
+        opened = []
+        real_open = open
+        monkeypatch.setattr(
+            "builtins.open",
+            lambda file, *args, **kw: (
+                opened.append(file) or real_open(file, *args, **kw)
+            ),
+        )
+
+        reloaded = ResultCache(tmp_path / "cache")
+        assert reloaded.key_for(_task("a", len, [source])) == key
+        assert str(source) not in opened
+
+    def test_recent_files_are_rehashed(self, tmp_path):
+        """Test that an edit keeping size and mtime is still noticed"""
+        source = tmp_path / "a.txt"
+        source.write_text("aaaa")
+        stat = source.stat()
+        cache = ResultCache(tmp_path / "cache")
+        key = cache.key_for(_task("a", len, [source]))
+
+        source.write_text("bbbb")
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert cache.key_for(_task("a", len, [source])) != key
+
+    def test_mtime_validation(self, tmp_path):
+        """Test that mtime mode keys on size and modification time"""
+        source = tmp_path / "a.txt"
+        source.write_text("aaaa")
+        cache = ResultCache(tmp_path / "cache")
+        task = Task("a", "A", len, [], cache=CacheKey([source], "v1", validate="mtime"))
+        key = cache.key_for(task)
+
+        _backdate(source)
+        assert cache.key_for(task) != key
+
+    def test_rejects_unknown_validation(self):
+        """Test that an unknown validation mode fails fast"""
+        with pytest.raises(ValueError, match="validation mode"):
+            CacheKey(["a.txt"], validate="sometimes")
+
+    def test_get_put_and_counters(self, tmp_path):
+        """Test stored results, misses and results JSON cannot hold"""
+        cache = ResultCache(tmp_path / "cache")
+
+        assert cache.get("ab" * 32) == (False, None)
+        cache.put("ab" * 32, {"lines": 3})
+        cache.put("cd" * 32, lambda: None)
+        cache.put("ef" * 32, ("a", 1))  # Would come back as a list
+
+        assert cache.get("ab" * 32) == (True, {"lines": 3})
+        assert cache.get("cd" * 32) == (False, None)
+        assert cache.get("ef" * 32) == (False, None)
+        assert (cache.hits, cache.misses) == (1, 3)
+        assert len(cache) == 1
+
+    def test_pickles_are_opt_in(self, tmp_path, monkeypatch):
+        """Test that pickled results are only written and read when allowed"""
+        private = ResultCache(tmp_path / "cache", allow_pickle=True)
+        private.put("ab" * 32, ("a", 1))
+        assert private.get("ab" * 32) == (True, ("a", 1))
+
+        monkeypatch.setattr(
+            "pickle.loads", lambda *args: pytest.fail("pickle was loaded")
+        )
+        assert ResultCache(tmp_path / "cache").get("ab" * 32) == (False, None)
+
+    def test_stale_entries_are_misses(self, tmp_path):
+        """Test that a result whose class moved is dropped, not raised"""
+        cache = ResultCache(tmp_path / "cache", allow_pickle=True)
+        cache.put("ab" * 32, ("a", 1))
+        (file,) = cache._object_files()
+        file.write_bytes(b"cmoved_module\nGone\n(tR.")
+
+        assert cache.get("ab" * 32) == (False, None)
+        assert not file.exists()
+
+    def test_anonymous_callables_have_no_key(self, tmp_path):
+        """Test that lambdas are only keyed by an explicit fingerprint"""
+        cache = ResultCache(tmp_path / "cache")
+        anonymous = Task("a", "Operation 1", lambda: 1, [], cache=CacheKey())
+
+        assert cache.key_for(anonymous) is None
+        assert cache.lookup(anonymous) == (None, False, None)
+        anonymous.fingerprint = "count-lines"
+        assert cache.key_for(anonymous) is not None
+
+        def derived(func):
+            return cache.key_for(Task("a", "Measure", func, [], cache=CacheKey()))
+
+        assert derived(len) != derived(str)  # Fingerprints of named callables
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that the least recently used results go first"""
+        cache = ResultCache(tmp_path / "cache", max_bytes=2500)
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+        for key in keys[:2]:
+            cache.put(key, "x" * 1000)
+            time.sleep(0.01)
+        cache.get(keys[0])  # Most recently used now
+        time.sleep(0.01)
+
+        cache.put(keys[2], "x" * 1000)
+
+        assert cache.get(keys[0])[0]
+        assert not cache.get(keys[1])[0]
+        assert cache.get(keys[2])[0]
+
+
+class TestCachedExecution:
+    """Test executors serving cacheable tasks from a ResultCache"""
+
+    @pytest.mark.parametrize("backend", ["thread", "inline"])
+    def test_rerun_is_served_from_cache(self, tmp_path, backend):
+        """Test that an unchanged re-run does not call the task again"""
+        source = tmp_path / "a.txt"
+        source.write_text("hello")
+        counter = _Counter(source)
+        cache = ResultCache(tmp_path / "cache")
+
+        for _ in range(2):
+            task = _task("a", counter, [source])
+            with ParallelExecutor(backend=backend, result_cache=cache) as executor:
+                results = executor.execute(executor.plan([task]))
+            assert results == {"a": 5}
+
+        assert counter.calls == 1
+        assert task.cached and task.status == TaskStatus.COMPLETED
+        assert executor.last_profile.spans[0].worker == "result cache"
+
+        source.write_text("hello world")
+        task = _task("a", counter, [source])
+        with ParallelExecutor(result_cache=cache) as executor:
+            assert executor.execute(executor.plan([task])) == {"a": 11}
+        assert counter.calls == 2 and not task.cached
+
+    def test_failures_are_not_cached(self, tmp_path):
+        """Test that a failed run is retried on the next execution"""
+        source = tmp_path / "a.txt"
+        source.write_text("x")
+        cache = ResultCache(tmp_path / "cache")
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return "ok"
+
+        with ParallelExecutor(result_cache=cache) as executor:
+            for expected in (None, "ok", "ok"):
+                task = _task("a", flaky, [source])
+                assert executor.execute(executor.plan([task])) == {"a": expected}
+
+        assert len(calls) == 2
+
+    def test_tasks_without_cache_key_always_run(self, tmp_path):
+        """Test that only tasks declaring a cache key are memoized"""
+        calls = []
+        cache = ResultCache(tmp_path / "cache")
+
+        with ParallelExecutor(result_cache=cache) as executor:
+            for _ in range(2):
+                task = Task("a", "Count", lambda: calls.append(1), [])
+                executor.execute(executor.plan([task]))
+
+        assert len(calls) == 2
+        assert len(cache) == 0
+
+    def test_lambdas_are_not_cached(self, tmp_path):
+        """Test that a lambda's result is not reused under its description"""
+        cache = ResultCache(tmp_path / "cache")
+
+        with ParallelExecutor(result_cache=cache) as executor:
+            for value in (1, 2):
+                task = Task("a", "Operation 1", lambda: value, [], cache=CacheKey())
+                assert executor.execute(executor.plan([task])) == {"a": value}
+
+        assert len(cache) == 0
+
+    def test_async_executor(self, tmp_path):
+        """Test that the event-loop executor uses the cache too"""
+        source = tmp_path / "a.txt"
+        source.write_text("hello")
+        counter = _Counter(source)
+        executor = AsyncParallelExecutor(result_cache=ResultCache(tmp_path / "c"))
+
+        for _ in range(2):
+            task = _task("a", counter, [source])
+            assert executor.run(executor.plan([task])) == {"a": 5}
+
+        assert counter.calls == 1 and task.cached
@@ -0,0 +1,186 @@
+"""
+Unit tests for the error signature index
+
+Tests MinHash sketches, incremental syncing of the solutions log and
+ReflexionPattern lookups through the index.
+"""
+
+import random
+import time
+
+import pytest
+
+from superclaude.pm_agent.reflexion import ReflexionPattern
+from superclaude.pm_agent.signature_index import (
+    INDEX_NAME,
+    SignatureIndex,
+    keywords,
+    minhash,
+)
+
+
+@pytest.fixture
+def index(tmp_path, solutions_log):
+    with SignatureIndex(
+        tmp_path / "solutions.lsh", solutions_log.path, solutions_log.signature
+    ) as index:
+        yield index
+
+
+class TestMinHash:
+    """Test MinHash sketches"""
+
+    def test_sketch_estimates_jaccard(self):
+        """Test that matching sketch values track word-set similarity"""
+        a = keywords(" ".join(f"w{i}" for i in range(100)))
+        b = keywords(" ".join(f"w{i}" for i in range(20, 120)))  # Jaccard 2/3
+
+        sa, sb = minhash(a), minhash(b)
+        agreement = sum(x == y for x, y in zip(sa, sb)) / len(sa)
+
+        assert minhash(a) == sa
+        assert abs(agreement - 2 / 3) < 0.15
+
+
+class TestSignatureIndex:
+    """Test suite for SignatureIndex"""
+
+    def test_near_duplicates_are_candidates(self, index, solutions_log):
+        """Test that similar signatures are found and unrelated ones are not"""
+        solutions_log.append(
+            "TypeError | expected str, got int | test_parse",
+            "ImportError | no module named yaml | test_config",
+            "TypeError | expected str, got int | test_render",
+        )
+        first, _, third = solutions_log.offsets()
+
+        found = index.candidates("TypeError | expected str, got int | test_parse")
+
+        assert found == [first, third]
+        assert index.candidates("KeyError | missing key") == []
+        assert index.candidates("") == []
+
+    def test_appended_records_are_synced(self, index, solutions_log):
+        """Test that only new complete lines are indexed on the next lookup"""
+        solutions_log.append("ValueError | bad input value | test_a")
+        assert index.sync() == 1
+
+        solutions_log.append("ValueError | bad input value | test_b")
+        solutions_log.write('{"signature": "ValueError | bad')  # Still being written
+
+        assert len(index.candidates("ValueError | bad input value | test_a")) == 2
+        assert len(index) == 2
+
+        solutions_log.write(' input value | test_c"}\n')
+        assert len(index.candidates("ValueError | bad input value | test_a")) == 3
+
+    def test_index_persists(self, tmp_path, index, solutions_log):
+        """Test that a reopened index does not re-read indexed records"""
+        solutions_log.append("OSError | disk full | test_write")
+        index.sync()
+
+        with SignatureIndex(
+            tmp_path / "solutions.lsh", solutions_log.path, solutions_log.signature
+        ) as again:
+            assert again.sync() == 0
+            assert again.candidates("OSError | disk full | test_write") == [0]
+
+    def test_replaced_source_is_reindexed(self, index, solutions_log):
+        """Test that a rewritten or truncated log does not leave stale offsets"""
+        solutions_log.append("KeyError | missing user id | test_lookup")
+        index.sync()
+
+        solutions_log.path.write_text("")
+        solutions_log.append(
+            "OSError | disk full | test_write",
+            "KeyError | missing user id | test_lookup",
+        )
+
+        assert index.candidates("KeyError | missing user id | test_lookup") == [
+            solutions_log.offsets()[1]
+        ]
+        assert len(index) == 2
+
+    def test_malformed_lines_are_skipped(self, index, solutions_log):
+        """Test that lines that are not records are never candidates"""
+        solutions_log.write("not json\n[1, 2]\n")
+        solutions_log.append("RuntimeError | loop closed | test_async")
+
+        assert index.candidates("RuntimeError | loop closed | test_async") == [
+            solutions_log.offsets()[2]
+        ]
+        assert len(index) == 1
+
+    @pytest.mark.performance
+    def test_lookup_20k_records_benchmark(self, index, solutions_log):
+        """Benchmark: lookups over 20k records stay under a millisecond"""
+        rng = random.Random(3)
+        vocabulary = [f"word{i}" for i in range(3000)]
+        signatures = [
+            " | ".join(
+                [rng.choice(["TypeError", "ValueError", "KeyError"])]
+                + [" ".join(rng.sample(vocabulary, 6)), f"test_{i}"]
+            )
+            for i in range(20_000)
+        ]
+        solutions_log.append(*signatures)
+        index.sync()
+        offsets = solutions_log.offsets()
+
+        queries = rng.sample(range(len(signatures)), 200)
+        start = time.perf_counter()
+        for i in queries:
+            assert offsets[i] in index.candidates(signatures[i])
+        elapsed = time.perf_counter() - start
+
+        assert elapsed / len(queries) < 0.001
+
+
+class TestReflexionLookup:
+    """Test ReflexionPattern.get_solution through the index"""
+
+    def test_earliest_match_wins(self, temp_memory_dir):
+        """Test that the first recorded matching solution is returned"""
+        reflexion = ReflexionPattern(memory_dir=temp_memory_dir)
+        for solution in ("Use str()", "Cast with str()"):
+            reflexion.record_error(
+                {
+                    "test_name": "test_render",
+                    "error_type": "TypeError",
+                    "error_message": "can only concatenate str (not int) to str",
+                    "solution": solution,
+                }
+            )
+
+        found = reflexion.get_solution(
+            {
+                "test_name": "test_render",
+                "error_type": "TypeError",
+                "error_message": "can only concatenate str (not int) to str",
+            }
+        )
+
+        assert found["solution"] == "Use str()"
+        assert (temp_memory_dir / INDEX_NAME).exists()
+
+    def test_dissimilar_error_has_no_solution(self, temp_memory_dir):
+        """Test that candidates failing the overlap check are rejected"""
+        reflexion = ReflexionPattern(memory_dir=temp_memory_dir)
+        reflexion.record_error(
+            {
+                "test_name": "test_render",
+                "error_type": "TypeError",
+                "error_message": "can only concatenate str (not int) to str",
+                "solution": "Use str()",
+            }
+        )
+
+        found = reflexion.get_solution(
+            {
+                "test_name": "test_parse",
+                "error_type": "TypeError",
+                "error_message": "unsupported operand types",
+            }
+        )
+
+        assert found is None
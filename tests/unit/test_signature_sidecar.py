@@ -0,0 +1,179 @@
+"""
+Unit tests for the signature sidecar
+
+Tests precomputed entries, header statistics, syncing with the
+solutions log and ReflexionPattern reading from the sidecar.
+"""
+
+import json
+import random
+import time
+
+import pytest
+
+from superclaude.pm_agent.reflexion import ReflexionPattern
+from superclaude.pm_agent.signature_sidecar import (
+    MAX_TOKENS,
+    SIDECAR_NAME,
+    SignatureSidecar,
+    token_hashes,
+)
+
+
+@pytest.fixture
+def sidecar(tmp_path, solutions_log):
+    with SignatureSidecar(
+        tmp_path / "solutions.sig", solutions_log.path, solutions_log.signature
+    ) as sidecar:
+        yield sidecar
+
+
+class TestSignatureSidecar:
+    """Test suite for SignatureSidecar"""
+
+    def test_entries_and_statistics(self, sidecar, solutions_log):
+        """Test that entries hold word hashes and the header counts records"""
+        solutions_log.append(
+            {"signature": "TypeError | expected str", "solution": "Use str()"},
+            {"signature": "KeyError | missing id"},
+        )
+
+        assert sidecar.sync() == 2
+        assert sidecar.statistics() == (2, 1)
+
+        first, second = solutions_log.offsets()
+        entry = sidecar.entry(second)
+        assert entry.tokens == token_hashes("KeyError | missing id")
+        assert entry.complete and not entry.has_solution
+        assert sidecar.entry(first).has_solution
+        assert sidecar.entry(first + 1) is None
+
+    def test_long_signatures_are_marked_incomplete(self, sidecar, solutions_log):
+        """Test that signatures with too many words are flagged"""
+        words = " ".join(f"w{i}" for i in range(MAX_TOKENS + 5))
+        solutions_log.append({"signature": words})
+        sidecar.sync()
+
+        entry = sidecar.entry(0)
+        assert entry.word_count == MAX_TOKENS + 5
+        assert not entry.complete
+        assert entry.tokens < token_hashes(words)
+
+    def test_appended_records_are_synced(self, sidecar, solutions_log):
+        """Test that only complete new lines are added, and only once"""
+        solutions_log.append({"signature": "OSError | disk full"})
+        sidecar.sync()
+        solutions_log.write('{"signature": "OSError')  # Still being written
+
+        assert sidecar.sync() == 0
+        solutions_log.write(' | disk full", "solution": "Free space"}\n')
+        assert sidecar.sync() == 1
+        assert sidecar.statistics() == (2, 1)
+
+    def test_sidecar_persists(self, tmp_path, sidecar, solutions_log):
+        """Test that a reopened sidecar does not re-read the log"""
+        solutions_log.append({"signature": "OSError | disk full", "solution": "x"})
+        sidecar.sync()
+
+        with SignatureSidecar(
+            tmp_path / "solutions.sig", solutions_log.path, solutions_log.signature
+        ) as again:
+            assert again.sync() == 0
+            assert again.statistics() == (1, 1)
+
+    def test_replaced_source_is_rebuilt(self, sidecar, solutions_log):
+        """Test that a rewritten or truncated log does not leave stale entries"""
+        solutions_log.append(*[{"signature": f"Error {i}"} for i in range(3)])
+        sidecar.sync()
+
+        solutions_log.path.write_text("")
+        solutions_log.append({"signature": "ValueError | bad", "solution": "Check"})
+
+        assert sidecar.sync() == 1
+        assert sidecar.statistics() == (1, 1)
+        assert sidecar.entry(0).tokens == token_hashes("ValueError | bad")
+
+    def test_torn_entries_are_overwritten(self, sidecar, solutions_log):
+        """Test that bytes past the counted entries are dropped"""
+        solutions_log.append({"signature": "a b c"})
+        sidecar.sync()
+        with sidecar.path.open("ab") as f:
+            f.write(b"\xff" * 50)  # Entry cut short by a crash
+
+        solutions_log.append({"signature": "d e f"})
+        sidecar.sync()
+
+        assert sidecar.statistics() == (2, 0)
+        assert sidecar.entry(solutions_log.offsets()[1]).tokens == token_hashes("d e f")
+
+    def test_malformed_lines_are_not_counted(self, sidecar, solutions_log):
+        """Test that lines that are not records get no entry"""
+        solutions_log.write("not json\n[1, 2]\n")
+        solutions_log.append({"signature": "a b"})
+
+        assert sidecar.sync() == 1
+        assert sidecar.entry(solutions_log.offsets()[2]) is not None
+
+
+class TestReflexionStatistics:
+    """Test ReflexionPattern reading from the sidecar"""
+
+    def test_statistics_come_from_the_header(self, temp_memory_dir, monkeypatch):
+        """Test that statistics are current without scanning the log"""
+        reflexion = ReflexionPattern(memory_dir=temp_memory_dir)
+        reflexion.record_error({"error_type": "TypeError", "solution": "Use str()"})
+        reflexion.record_error({"error_type": "KeyError"})
+        assert (temp_memory_dir / SIDECAR_NAME).exists()
+
+        monkeypatch.setattr(
+            "json.loads", lambda *args, **kw: pytest.fail("log was re-parsed")
+        )
+        assert reflexion.get_statistics() == {
+            "total_errors": 2,
+            "errors_with_solutions": 1,
+            "solution_reuse_rate": 50.0,
+        }
+
+    def test_empty_log(self, temp_memory_dir):
+        """Test statistics before anything was recorded"""
+        reflexion = ReflexionPattern(memory_dir=temp_memory_dir)
+
+        assert reflexion.get_statistics()["total_errors"] == 0
+
+    @pytest.mark.performance
+    def test_statistics_and_lookup_benchmark(self, temp_memory_dir):
+        """Benchmark: statistics and lookups over 20k records stay fast"""
+        rng = random.Random(5)
+        letters = "abcdefghijklmnopqrstuvwxyz"
+        vocabulary = ["".join(rng.choices(letters, k=8)) for _ in range(3000)]
+        records = [
+            {
+                "error_type": rng.choice(["TypeError", "ValueError", "KeyError"]),
+                "error_message": " ".join(rng.sample(vocabulary, 6)),
+                "test_name": f"test_{i}",
+                "solution": f"fix {i}" if i % 2 else None,
+            }
+            for i in range(20_000)
+        ]
+        reflexion = ReflexionPattern(memory_dir=temp_memory_dir)
+        reflexion.vector_backend = None  # Index and sidecar only
+        with reflexion.solutions_file.open("a") as f:
+            f.writelines(json.dumps(record) + "\n" for record in records)
+        reflexion.get_statistics()  # Builds the sidecar
+        reflexion.index.sync()
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            stats = reflexion.get_statistics()
+        statistics_time = (time.perf_counter() - start) / 1000
+        assert stats["total_errors"] == 20_000
+        assert stats["errors_with_solutions"] == 10_000
+
+        queries = rng.sample(records, 200)
+        start = time.perf_counter()
+        for record in queries:
+            assert reflexion.get_solution(record)["solution"] == record["solution"]
+        lookup_time = (time.perf_counter() - start) / len(queries)
+
+        assert statistics_time < 0.0005
+        assert lookup_time < 0.002
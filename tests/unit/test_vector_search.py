@@ -0,0 +1,298 @@
+"""
+Unit tests for semantic search of past errors
+
+Tests n-gram embeddings, the local memory-mapped vector backend (NumPy
+and pure-Python scoring) and ReflexionPattern's pluggable backend.
+"""
+
+import random
+import time
+
+import pytest
+
+from superclaude.pm_agent.reflexion import ReflexionPattern
+from superclaude.pm_agent.vector_search import (
+    VECTORS_NAME,
+    LocalVectorBackend,
+    VectorBackend,
+    VectorMatch,
+    embed,
+)
+
+
+def _cosine(a, b):
+    return sum(weight * b.get(bucket, 0.0) for bucket, weight in a.items())
+
+
+@pytest.fixture
+def backend(tmp_path, solutions_log):
+    with LocalVectorBackend(
+        tmp_path / "solutions.vec",
+        solutions_log.path,
+        solutions_log.signature,
+        use_numpy=False,
+    ) as backend:
+        yield backend
+
+
+class TestEmbed:
+    """Test hashed character n-gram vectors"""
+
+    def test_unit_vectors_track_wording(self):
+        """Test that vectors are normalized and close for similar texts"""
+        a = embed("FileNotFoundError | no such file: 'config/settings.json'")
+        b = embed("FileNotFoundError | no such file: 'config/setting.json'")
+        c = embed("KeyError | 'session' | test_logout")
+
+        assert _cosine(a, a) == pytest.approx(1.0)
+        assert _cosine(a, b) > 0.9
+        assert _cosine(a, c) < 0.5
+
+    def test_empty_text(self):
+        """Test that text without n-grams has no vector"""
+        assert embed("") == {}
+        assert embed("   ") == {}
+
+
+class TestLocalVectorBackend:
+    """Test suite for LocalVectorBackend"""
+
+    def test_batched_search(self, backend, solutions_log):
+        """Test that each query of a batch gets its nearest records first"""
+        solutions_log.append(
+            "TypeError | can only concatenate str (not int) to str",
+            "ImportError | no module named yaml",
+            "TypeError | can only concatenate str (not float) to str",
+        )
+        assert backend.sync() == 3
+        first, second, third = solutions_log.offsets()
+
+        results = backend.search(
+            [
+                "TypeError | can only concatenate str (not int) to str",
+                "ImportError | no module named 'yaml'",
+                "",
+            ],
+            k=2,
+        )
+
+        assert [match.position for match in results[0]] == [first, third]
+        assert results[0][0].score == pytest.approx(1.0, abs=1e-6)
+        assert results[1][0].position == second
+        assert results[2] == []
+
+    def test_ties_go_to_the_earlier_record(self, backend, solutions_log):
+        """Test that identical signatures rank in log order"""
+        solutions_log.append(
+            "OSError | disk full", "ValueError | bad", "OSError | disk full"
+        )
+        backend.sync()
+
+        (best,) = backend.search(["OSError | disk full"], k=1)
+
+        assert best == [VectorMatch(0, best[0].score)]
+
+    def test_appended_records_are_synced(self, backend, solutions_log):
+        """Test that only complete new lines become rows"""
+        solutions_log.append("OSError | disk full")
+        backend.sync()
+        solutions_log.write('{"signature": "KeyError')  # Still being written
+
+        assert backend.sync() == 0
+        solutions_log.write(' | missing id"}\n')
+        assert backend.sync() == 1
+        assert len(backend) == 2
+
+    def test_replaced_source_is_rebuilt(self, backend, solutions_log):
+        """Test that a rewritten log does not leave stale rows"""
+        solutions_log.append("OSError | disk full", "KeyError | missing id")
+        backend.sync()
+
+        solutions_log.path.write_text("")
+        solutions_log.append("KeyError | missing id")
+
+        assert backend.sync() == 1
+        assert backend.search(["KeyError | missing id"])[0][0].position == 0
+
+    def test_other_shape_is_rebuilt(self, tmp_path, backend, solutions_log):
+        """Test that reopening with other dimensions re-embeds the log"""
+        solutions_log.append("OSError | disk full", "KeyError | missing id")
+        backend.sync()
+
+        with LocalVectorBackend(
+            tmp_path / "solutions.vec",
+            solutions_log.path,
+            solutions_log.signature,
+            dim=64,
+            use_numpy=False,
+        ) as other:
+            assert other.sync() == 2
+            assert other.search(["KeyError | missing id"])[0][0].position > 0
+
+    def test_rejects_bad_shape(self, tmp_path, solutions_log):
+        """Test that non-positive dimensions fail fast"""
+        with pytest.raises(ValueError, match="must be positive"):
+            LocalVectorBackend(
+                tmp_path / "v.vec", solutions_log.path, solutions_log.signature, dim=0
+            )
+
+    def test_numpy_matches_pure_python(self, tmp_path, backend, solutions_log):
+        """Test that both scoring paths return the same matches"""
+        pytest.importorskip("numpy")
+        rng = random.Random(11)
+        words = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta"]
+        signatures = [" ".join(rng.sample(words, 4)) for _ in range(300)]
+        solutions_log.append(*signatures)
+        backend.sync()
+
+        with LocalVectorBackend(
+            backend.path, solutions_log.path, solutions_log.signature
+        ) as vectorized:
+            queries = signatures[:20]
+            expected = backend.search(queries, k=5)
+            actual = vectorized.search(queries, k=5)
+
+        for want, got in zip(expected, actual):
+            assert [m.position for m in got] == [m.position for m in want]
+            for m, n in zip(got, want):
+                assert m.score == pytest.approx(n.score, abs=1e-5)
+
+    @pytest.mark.performance
+    def test_batched_queries_benchmark(self, backend, solutions_log):
+        """Benchmark: a batch costs less per query than single queries"""
+        rng = random.Random(5)
+        letters = "abcdefghijklmnopqrstuvwxyz"
+        vocabulary = ["".join(rng.choices(letters, k=8)) for _ in range(2000)]
+        signatures = [
+            f"{rng.choice(['TypeError', 'KeyError'])} | "
+            + " ".join(rng.sample(vocabulary, 6))
+            for _ in range(5000)
+        ]
+        solutions_log.append(*signatures)
+        backend.sync()
+        offsets = solutions_log.offsets()
+        queries = rng.sample(range(len(signatures)), 50)
+
+        start = time.perf_counter()
+        for i in queries[:10]:
+            backend.search([signatures[i]], k=1)
+        single = (time.perf_counter() - start) / 10
+
+        start = time.perf_counter()
+        results = backend.search([signatures[i] for i in queries], k=1)
+        batched = (time.perf_counter() - start) / len(queries)
+
+        for i, matches in zip(queries, results):
+            assert matches[0].position == offsets[i]
+        assert batched < single
+
+
+class _RecordingBackend(VectorBackend):
+    """Backend wrapper recording the batches it is asked"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.batches = []
+
+    def sync(self):
+        return self.backend.sync()
+
+    def search(self, queries, k=5):
+        self.batches.append(list(queries))
+        return self.backend.search(queries, k)
+
+
+class TestReflexionSemanticSearch:
+    """Test ReflexionPattern's semantic search through a VectorBackend"""
+
+    @pytest.fixture
+    def reflexion(self, temp_memory_dir):
+        probe = ReflexionPattern(memory_dir=temp_memory_dir)
+        backend = _RecordingBackend(
+            LocalVectorBackend(
+                temp_memory_dir / VECTORS_NAME,
+                probe.solutions_file,
+                probe._create_error_signature,
+                use_numpy=False,
+            )
+        )
+        return ReflexionPattern(memory_dir=temp_memory_dir, vector_backend=backend)
+
+    def test_backends_implement_sync_and_search(self):
+        """Test that an incomplete backend cannot be created"""
+
+        class SearchOnly(VectorBackend):
+            def search(self, queries, k=5):
+                return [[] for _ in queries]
+
+        with pytest.raises(TypeError):
+            SearchOnly()
+
+    def test_vector_hits_are_verified(self, reflexion):
+        """Test that a close vector that fails the word overlap is rejected"""
+        reflexion.record_error(
+            {
+                "error_type": "KeyError",
+                "error_message": "'user_id'",
+                "test_name": "test_get_user",
+                "solution": "Check the id first",
+            }
+        )
+        error = {
+            "error_type": "KeyError",
+            "error_message": "'user_ids'",
+            "test_name": "test_get_users",
+        }
+
+        (best,) = reflexion.vector_backend.search(
+            [reflexion._create_error_signature(error)], k=1
+        )
+        assert best[0].score > 0.85
+        assert reflexion.get_solution(error) is None
+
+    def test_index_first_then_closest_verified_vector(self, reflexion, monkeypatch):
+        """Test that vectors only rank records when the index finds none"""
+        for message, solution in [
+            ("missing key user_id in session store", "A"),
+            ("missing key user_ids in session cache", "B"),
+        ]:
+            reflexion.record_error(
+                {
+                    "error_type": "KeyError",
+                    "error_message": message,
+                    "test_name": "test_get_user",
+                    "solution": solution,
+                }
+            )
+        error = {
+            "error_type": "KeyError",
+            "error_message": "missing key user_id in session cache",
+            "test_name": "test_get_user",
+        }
+
+        assert reflexion.get_solution(error)["solution"] == "A"
+        assert reflexion.vector_backend.batches == []
+
+        monkeypatch.setattr(reflexion.index, "candidates", lambda signature: [])
+        assert reflexion.get_solution(error)["solution"] == "B"
+        assert len(reflexion.vector_backend.batches) == 1
+
+    def test_get_solutions_is_one_batch(self, reflexion):
+        """Test that errors the index misses go to the backend in one query"""
+        reflexion.record_error(
+            {"error_type": "KeyError", "error_message": "'user'", "solution": "A"}
+        )
+        reflexion.record_error(
+            {"error_type": "OSError", "error_message": "disk full", "solution": "B"}
+        )
+
+        solutions = reflexion.get_solutions(
+            [
+                {"error_type": "OSError", "error_message": "disk full"},
+                {"error_type": "ZeroDivisionError", "error_message": "by zero"},
+                {"error_type": "KeyError", "error_message": "'user'"},
+            ]
+        )
+
+        assert [s and s["solution"] for s in solutions] == ["B", None, "A"]
+        assert reflexion.vector_backend.batches == [["ZeroDivisionError | by zero"]]